@@ -2,12 +2,11 @@ import os
 import textwrap
 from collections import OrderedDict
 
-from jinja2 import Template
-
 from conan.tools._check_build_profile import check_using_build_profile
 from conans.errors import ConanException
 from conans.util.files import load, save
 from conans.client.tools.apple import to_apple_arch
+from conans.util.templates import compiled_template
 
 GLOBAL_XCCONFIG_TEMPLATE = textwrap.dedent("""\
     // Includes both the toolchain and the dependencies
@@ -149,7 +148,7 @@ class XcodeDeps(object):
             'condition': _xcconfig_conditional(self._conanfile.settings)
         }
 
-        template = Template(self._conf_xconfig)
+        template = compiled_template(self._conf_xconfig)
         content_multi = template.render(**fields)
         return content_multi
 
@@ -168,10 +167,11 @@ class XcodeDeps(object):
                         else f"conan_{_format_name(component[0])}_{_format_name(component[1])}.xcconfig"
                         for component in components]
 
-            content_multi = Template(content_multi).render({"pkg_name": pkg_name,
-                                                            "comp_name": comp_name,
-                                                            "dep_xconfig_filename": dep_xconfig_filename,
-                                                            "deps_includes": _get_includes(reqs)})
+            content_multi = compiled_template(content_multi).render({
+                "pkg_name": pkg_name,
+                "comp_name": comp_name,
+                "dep_xconfig_filename": dep_xconfig_filename,
+                "deps_includes": _get_includes(reqs)})
 
         if dep_xconfig_filename not in content_multi:
             content_multi = content_multi.replace('.xcconfig"',
@@ -1,7 +1,5 @@
 import os
 
-import yaml
-
 from conans.errors import ConanException
 from conans.util.files import load, save
 
@@ -11,6 +9,7 @@ def update_conandata(conanfile, data):
     this only works for updating the conandata on the export() method, it seems it would
     be plain wrong to try to change it anywhere else
     """
+    import yaml
     if not hasattr(conanfile, "export_folder") or conanfile.export_folder is None:
         raise ConanException("The 'update_conandata()' can only be used in the 'export()' method")
     path = os.path.join(conanfile.export_folder, "conandata.yml")
@@ -38,6 +37,7 @@ def trim_conandata(conanfile):
     Tool to modify the ``conandata.yml`` once it is exported, to limit it to the current version
     only
     """
+    import yaml
     if not hasattr(conanfile, "export_folder") or conanfile.export_folder is None:
         raise ConanException("The 'trim_conandata()' can only be used in the 'export()' method")
     path = os.path.join(conanfile.export_folder, "conandata.yml")
@@ -1,9 +1,10 @@
 import fnmatch
 import os
-import shutil
 from collections import defaultdict
 
+from conans.util.file_selection import compile_patterns, current_snapshots
 from conans.util.files import mkdir
+from conans.util.staging import copy_files
 
 
 def copy(conanfile, pattern, src, dst, keep_path=True, excludes=None,
@@ -52,18 +53,17 @@ def _filter_files(src, pattern, excludes, ignore_case, excluded_folder):
     """ return a list of the files matching the patterns
     The list will be relative path names wrt to the root src folder
     """
-    filenames = []
+    files_to_copy = []
     files_symlinked_to_folders = []
 
-    if excludes:
-        if not isinstance(excludes, (tuple, list)):
-            excludes = (excludes, )
-        if ignore_case:
-            excludes = [e.lower() for e in excludes]
-    else:
-        excludes = []
+    if excludes and not isinstance(excludes, (tuple, list)):
+        excludes = (excludes, )
+    included = compile_patterns([pattern], ignore_case, normcase=ignore_case)
+    excluded_file = compile_patterns(excludes, ignore_case, normcase=ignore_case)
+    excluded_subfolder = compile_patterns(excludes, ignore_case, normcase=True)
 
-    for root, subfolders, files in os.walk(src):
+    # The copies of the same recipe method walk every folder once
+    for root, subfolders, files in current_snapshots().walk(src):
         if root == excluded_folder:
             subfolders[:] = []
             continue
@@ -76,29 +76,14 @@ def _filter_files(src, pattern, excludes, ignore_case, excluded_folder):
                     files_symlinked_to_folders.append(relative_path)
 
         relative_path = os.path.relpath(root, src)
-        compare_relative_path = relative_path.lower() if ignore_case else relative_path
-        for exclude in excludes:
-            if fnmatch.fnmatch(compare_relative_path, exclude):
-                subfolders[:] = []
-                files = []
-                break
+        prefix = "" if relative_path == "." else relative_path + os.sep
+        if excluded_subfolder and excluded_subfolder(relative_path):
+            subfolders[:] = []
+            continue
         for f in files:
-            relative_name = os.path.normpath(os.path.join(relative_path, f))
-            filenames.append(relative_name)
-
-    if ignore_case:
-        pattern = pattern.lower()
-        files_to_copy = [n for n in filenames if fnmatch.fnmatch(os.path.normpath(n.lower()),
-                                                                 pattern)]
-    else:
-        files_to_copy = [n for n in filenames if fnmatch.fnmatchcase(os.path.normpath(n),
-                                                                     pattern)]
-
-    for exclude in excludes:
-        if ignore_case:
-            files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatch(f.lower(), exclude)]
-        else:
-            files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatchcase(f, exclude)]
+            relative_name = prefix + f
+            if included(relative_name) and not (excluded_file and excluded_file(relative_name)):
+                files_to_copy.append(relative_name)
 
     return files_to_copy, files_symlinked_to_folders
 
@@ -108,15 +93,13 @@ def _copy_files(files, src, dst, keep_path):
     managing symlinks if necessary
     """
     copied_files = []
+    files_to_copy = []
     for filename in files:
         abs_src_name = os.path.join(src, filename)
         filename = filename if keep_path else os.path.basename(filename)
         abs_dst_name = os.path.normpath(os.path.join(dst, filename))
-        try:
-            os.makedirs(os.path.dirname(abs_dst_name))
-        except Exception:
-            pass
         if os.path.islink(abs_src_name):
+            mkdir(os.path.dirname(abs_dst_name))
             linkto = os.readlink(abs_src_name)  # @UndefinedVariable
             try:
                 os.remove(abs_dst_name)
@@ -124,8 +107,9 @@ def _copy_files(files, src, dst, keep_path):
                 pass
             os.symlink(linkto, abs_dst_name)  # @UndefinedVariable
         else:
-            shutil.copy2(abs_src_name, abs_dst_name)
+            files_to_copy.append((abs_src_name, abs_dst_name))
         copied_files.append(abs_dst_name)
+    copy_files(files_to_copy)
     return copied_files
 
 
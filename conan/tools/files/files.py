@@ -7,6 +7,8 @@ import platform
 import shutil
 import subprocess
 import sys
+import tempfile
+import time
 from contextlib import contextmanager
 from fnmatch import fnmatch
 
@@ -15,10 +17,13 @@ from urllib.parse import urlparse
 from urllib.request import url2pathname
 
 from conan.tools import CONAN_TOOLCHAIN_ARGS_FILE, CONAN_TOOLCHAIN_ARGS_SECTION
-from conans.client.downloaders.download import run_downloader
+from conans.client.downloaders.download import run_downloader, run_extracting_downloader
 from conans.errors import ConanException
-from conans.util.files import rmdir as _internal_rmdir
+from conans.util.archives import extract_tar, extract_zip, is_tar, zip_size
+from conans.util.files import rmdir as _internal_rmdir, unshare_file, merge_directories, \
+    add_saved_file
 from conans.util.runners import check_output_runner
+from conans.util.staging import get_staging_method, STAGING_COPY, STAGING_REFLINK
 
 if six.PY3:  # Remove this IF in develop2
     from shutil import which
@@ -51,6 +56,8 @@ def save(conanfile, path, content, append=False, encoding="utf-8"):
             except Exception:
                 raise
 
+    add_saved_file(path)
+    unshare_file(path)
     with open(path, mode) as handle:
         if not isinstance(content, bytes):
             content = bytes(content, encoding=encoding)
@@ -91,6 +98,119 @@ def get(conanfile, url, md5=None, sha1=None, sha256=None, destination=".", filen
                                  "parameter.".format(url_base))
         filename = os.path.basename(url_base)
 
+    checksum = sha256 or sha1 or md5
+    extracted_cache = conanfile.conf["tools.files.get:extracted_cache"] if checksum else None
+    if not extracted_cache or not (is_tar(filename) or filename.endswith(".zip")):
+        _get(conanfile, url, filename, destination, keep_permissions, pattern, verify, retry,
+             retry_wait, auth, headers, strip_root, md5, sha1, sha256)
+        return
+
+    # The same archive extracted with the same arguments is reused, by any recipe revision
+    algorithm = "sha256" if sha256 else "sha1" if sha1 else "md5"
+    key = "%s:%s pattern:%s strip_root:%s keep_permissions:%s" % (algorithm, checksum.lower(),
+                                                                   pattern, strip_root,
+                                                                   keep_permissions)
+    key = hashlib.sha256(key.encode()).hexdigest()
+    cached_folder = os.path.join(extracted_cache, key)
+    if os.path.isdir(cached_folder):
+        conanfile.output.info("Using the extracted %s from the cache" % filename)
+        os.utime(cached_folder)  # The least recently used entries are evicted first
+    else:
+        os.makedirs(extracted_cache, exist_ok=True)
+        # Extracted to a temporary folder, renamed when complete, never partially visible
+        tmp_folder = tempfile.mkdtemp(prefix=key + ".", dir=extracted_cache)
+        try:
+            _get(conanfile, url, filename, tmp_folder, keep_permissions, pattern, verify, retry,
+                 retry_wait, auth, headers, strip_root, md5, sha1, sha256)
+            try:
+                os.rename(tmp_folder, cached_folder)
+                os.utime(cached_folder)
+            except OSError:  # Stored concurrently by other process
+                pass
+        finally:
+            _internal_rmdir(tmp_folder)
+        max_size = conanfile.conf.get("tools.files.get:extracted_cache_max_size", check_type=int)
+        _clean_extracted_cache(extracted_cache, key, max_size)
+
+    # Never hard links, modifying a file in the destination would modify the cached one too.
+    # Reflinks are copy-on-write
+    staging = get_staging_method(conanfile.conf)
+    staging = STAGING_COPY if staging == STAGING_COPY else STAGING_REFLINK
+    try:
+        merge_directories(cached_folder, destination, staging=staging)
+    except (IOError, OSError):
+        if os.path.isdir(cached_folder):
+            raise
+        # Evicted by other process while copying it
+        _get(conanfile, url, filename, destination, keep_permissions, pattern, verify, retry,
+             retry_wait, auth, headers, strip_root, md5, sha1, sha256)
+
+
+# The temporary folders of interrupted get() calls are removed after this time, in seconds
+_EXTRACTED_TMP_AGE = 24 * 3600
+
+
+def _folder_size(folder):
+    size = 0
+    for root, _, files in os.walk(folder):
+        for f in files:
+            try:
+                size += os.lstat(os.path.join(root, f)).st_size
+            except OSError:
+                pass
+    return size
+
+
+def _clean_extracted_cache(extracted_cache, keep, max_size):
+    """ removes the temporary folders left by interrupted get() calls, and the least recently
+    used entries, except 'keep', while the cache is bigger than max_size (MB), if defined
+    """
+    now = time.time()
+    entries = []
+    for name in os.listdir(extracted_cache):
+        path = os.path.join(extracted_cache, name)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:  # Removed concurrently
+            continue
+        if "." in name:  # Temporary folder, being extracted or removed
+            if now - mtime > _EXTRACTED_TMP_AGE:
+                _internal_rmdir(path)
+        elif name != keep:
+            entries.append((mtime, path))
+    if max_size is None:
+        return
+
+    sizes = {path: _folder_size(path) for _, path in entries}
+    total_size = sum(sizes.values()) + _folder_size(os.path.join(extracted_cache, keep))
+    for _, path in sorted(entries):
+        if total_size <= max_size * 1024 * 1024:
+            break
+        # Renamed first, the get() calls starting now don't find it
+        evicted = "%s.evicted%s" % (path, os.getpid())
+        try:
+            os.rename(path, evicted)
+        except OSError:  # Evicted by other process
+            continue
+        _internal_rmdir(evicted)
+        total_size -= sizes[path]
+
+
+def _get(conanfile, url, filename, destination, keep_permissions, pattern, verify, retry,
+         retry_wait, auth, headers, strip_root, md5, sha1, sha256):
+    checksum = sha256 or sha1 or md5
+    if (checksum and is_tar(filename) and not isinstance(url, (list, tuple)) and
+            url.startswith(("http://", "https://")) and
+            not conanfile.conf["tools.files.download:download_cache"]):
+        # A tar archive is extracted while downloaded, it is not stored
+        if run_extracting_downloader(requester=conanfile._conan_requester,
+                                     output=conanfile.output, verify=verify, url=url,
+                                     filename=filename, destination=destination, pattern=pattern,
+                                     strip_root=strip_root, auth=auth, headers=headers, md5=md5,
+                                     sha1=sha1, sha256=sha256):
+            conanfile.output.writeln("")
+            return
+
     download(conanfile, url, filename, verify=verify,
              retry=retry, retry_wait=retry_wait, auth=auth, headers=headers,
              md5=md5, sha1=sha1, sha256=sha256)
@@ -338,52 +458,14 @@ def unzip(conanfile, filename, destination=".", keep_permissions=False, pattern=
             pass
 
     with zipfile.ZipFile(filename, "r") as z:
-        zip_info = z.infolist()
-        if pattern:
-            zip_info = [zi for zi in zip_info if fnmatch(zi.filename, pattern)]
-        if strip_root:
-            names = [n.replace("\\", "/") for n in z.namelist()]
-            common_folder = os.path.commonprefix(names).split("/", 1)[0]
-            if not common_folder and len(names) > 1:
-                raise ConanException("The zip file contains more than 1 folder in the root")
-            if len(names) == 1 and len(names[0].split("/", 1)) == 1:
-                raise ConanException("The zip file contains a file in the root")
-            # Remove the directory entry if present
-            # Note: The "zip" format contains the "/" at the end if it is a directory
-            zip_info = [m for m in zip_info if m.filename != (common_folder + "/")]
-            for member in zip_info:
-                name = member.filename.replace("\\", "/")
-                member.filename = name.split("/", 1)[1]
-
-        uncompress_size = sum((file_.file_size for file_ in zip_info))
+        uncompress_size = zip_size(z, pattern)
         if uncompress_size > 100000:
             output.info("Unzipping %s, this can take a while" % _human_size(uncompress_size))
         else:
             output.info("Unzipping %s" % _human_size(uncompress_size))
-        extracted_size = 0
-
         print_progress.last_size = -1
-        if platform.system() == "Windows":
-            for file_ in zip_info:
-                extracted_size += file_.file_size
-                print_progress(extracted_size, uncompress_size)
-                try:
-                    z.extract(file_, full_path)
-                except Exception as e:
-                    output.error("Error extract %s\n%s" % (file_.filename, str(e)))
-        else:  # duplicated for, to avoid a platform check for each zipped file
-            for file_ in zip_info:
-                extracted_size += file_.file_size
-                print_progress(extracted_size, uncompress_size)
-                try:
-                    z.extract(file_, full_path)
-                    if keep_permissions:
-                        # Could be dangerous if the ZIP has been created in a non nix system
-                        # https://bugs.python.org/issue15795
-                        perm = file_.external_attr >> 16 & 0xFFF
-                        os.chmod(os.path.join(full_path, file_.filename), perm)
-                except Exception as e:
-                    output.error("Error extract %s\n%s" % (file_.filename, str(e)))
+        extract_zip(z, full_path, pattern, strip_root, keep_permissions, output,
+                    lambda extracted_size: print_progress(extracted_size, uncompress_size))
         output.writeln("")
 
 
@@ -391,33 +473,7 @@ def untargz(filename, destination=".", pattern=None, strip_root=False):
     # NOT EXPOSED at `conan.tools.files` but used in tests
     import tarfile
     with tarfile.TarFile.open(filename, 'r:*') as tarredgzippedFile:
-        if not pattern and not strip_root:
-            tarredgzippedFile.extractall(destination)
-        else:
-            members = tarredgzippedFile.getmembers()
-
-            if strip_root:
-                names = [n.replace("\\", "/") for n in tarredgzippedFile.getnames()]
-                common_folder = os.path.commonprefix(names).split("/", 1)[0]
-                if not common_folder and len(names) > 1:
-                    raise ConanException("The tgz file contains more than 1 folder in the root")
-                if len(names) == 1 and len(names[0].split("/", 1)) == 1:
-                    raise ConanException("The tgz file contains a file in the root")
-                # Remove the directory entry if present
-                members = [m for m in members if m.name != common_folder]
-                for member in members:
-                    name = member.name.replace("\\", "/")
-                    member.name = name.split("/", 1)[1]
-                    member.path = member.name
-                    if member.linkpath.startswith(common_folder):
-                        # https://github.com/conan-io/conan/issues/11065
-                        linkpath = member.linkpath.replace("\\", "/")
-                        member.linkpath = linkpath.split("/", 1)[1]
-                        member.linkname = member.linkpath
-            if pattern:
-                members = list(filter(lambda m: fnmatch(m.name, pattern),
-                                      tarredgzippedFile.getmembers()))
-            tarredgzippedFile.extractall(destination, members=members)
+        extract_tar(tarredgzippedFile, destination, pattern, strip_root)
 
 
 def _human_size(size_bytes):
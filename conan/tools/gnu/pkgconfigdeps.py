@@ -2,11 +2,12 @@ import os
 import textwrap
 from collections import namedtuple
 
-from jinja2 import Template, StrictUndefined
+from jinja2 import StrictUndefined
 
 from conan.tools.gnu.gnudeps_flags import GnuDepsFlags
 from conans.errors import ConanException
 from conans.util.files import save
+from conans.util.templates import compiled_template
 
 
 def _get_name_with_namespace(namespace, name):
@@ -182,8 +183,8 @@ class _PCContentGenerator:
             "defines": [var.replace('"', '\\"') for var in info.cpp_info.defines],
             "gnudeps_flags": GnuDepsFlags(self._conanfile, info.cpp_info)
         }
-        template = Template(self.template, trim_blocks=True, lstrip_blocks=True,
-                            undefined=StrictUndefined)
+        template = compiled_template(self.template, trim_blocks=True, lstrip_blocks=True,
+                                     undefined=StrictUndefined)
         return template.render(context)
 
     def shortened_content(self, info):
@@ -195,8 +196,8 @@ class _PCContentGenerator:
             "version": self._dep.ref.version,
             "requires": info.requires
         }
-        template = Template(self.shortened_template, trim_blocks=True,
-                            lstrip_blocks=True, undefined=StrictUndefined)
+        template = compiled_template(self.shortened_template, trim_blocks=True,
+                                     lstrip_blocks=True, undefined=StrictUndefined)
         return template.render(context)
 
 
@@ -3,11 +3,12 @@ import re
 import textwrap
 from collections import namedtuple
 
-from jinja2 import Template, StrictUndefined
+from jinja2 import StrictUndefined
 
 from conan.errors import ConanException
 from conan.tools._check_build_profile import check_using_build_profile
 from conans.util.files import save
+from conans.util.templates import compiled_template
 
 _BazelTargetInfo = namedtuple("DepInfo", ['repository_name', 'name', 'requires', 'cpp_info'])
 _LibInfo = namedtuple("LibInfo", ['name', 'is_shared', 'lib_path', 'interface_lib_path'])
@@ -236,8 +237,8 @@ class _BazelDependenciesBZLGenerator:
         self._dependencies = dependencies
 
     def generate(self):
-        template = Template(self.template, trim_blocks=True, lstrip_blocks=True,
-                            undefined=StrictUndefined)
+        template = compiled_template(self.template, trim_blocks=True, lstrip_blocks=True,
+                                     undefined=StrictUndefined)
         content = template.render(dependencies=self._dependencies)
         # Saving the BUILD (empty) and dependencies.bzl files
         save(self.filename, content)
@@ -451,8 +452,8 @@ class _BazelBUILDGenerator:
 
     def generate(self):
         context = self._get_context()
-        template = Template(self.template, trim_blocks=True, lstrip_blocks=True,
-                            undefined=StrictUndefined)
+        template = compiled_template(self.template, trim_blocks=True, lstrip_blocks=True,
+                                     undefined=StrictUndefined)
         content = template.render(context)
         save(self.build_file_pah, content)
 
@@ -1,13 +1,39 @@
-from conans.client.build.autotools_environment import AutoToolsBuildEnvironment
-from conans.client.build.cmake import CMake
-from conans.client.build.meson import Meson
-from conans.client.build.msbuild import MSBuild
-from conans.client.build.visual_environment import VisualStudioBuildEnvironment
-from conans.client.run_environment import RunEnvironment
-from conans.model.conan_file import ConanFile
-from conans.model.options import Options
-from conans.model.settings import Settings
-from conans.util.files import load
+import sys
+
+# The public API of the package is imported when it is first used, so commands and tools that
+# don't need the build helpers don't pay for importing them
+_LAZY_ATTRIBUTES = {
+    "AutoToolsBuildEnvironment": "conans.client.build.autotools_environment",
+    "CMake": "conans.client.build.cmake",
+    "Meson": "conans.client.build.meson",
+    "MSBuild": "conans.client.build.msbuild",
+    "VisualStudioBuildEnvironment": "conans.client.build.visual_environment",
+    "RunEnvironment": "conans.client.run_environment",
+    "ConanFile": "conans.model.conan_file",
+    "Options": "conans.model.options",
+    "Settings": "conans.model.settings",
+    "load": "conans.util.files",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError("module 'conans' has no attribute '%s'" % name)
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
+
+
+if sys.version_info < (3, 7):  # No module __getattr__ (PEP 562)
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
 
 
 # complex_search: With ORs and not filtering by not restricted settings
@@ -1,4 +1,4 @@
-from jinja2 import DictLoader
+import sys
 
 import conans.assets.templates.info_graph_dot
 import conans.assets.templates.info_graph_html
@@ -8,8 +8,22 @@ SEARCH_TABLE_HTML = 'output/search_table.html'
 INFO_GRAPH_DOT = 'output/info_graph.dot'
 INFO_GRAPH_HTML = 'output/info_graph.html'
 
-dict_loader = DictLoader({
-    SEARCH_TABLE_HTML: search_table_html.content,
-    INFO_GRAPH_DOT: info_graph_dot.content,
-    INFO_GRAPH_HTML: info_graph_html.content,
-})
+
+def __getattr__(name):
+    """ The jinja2 'dict_loader' of these templates is created the first time it is used, as
+    importing jinja2 is a significant part of the startup time of every command
+    """
+    if name != "dict_loader":
+        raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+    from jinja2 import DictLoader
+    value = DictLoader({
+        SEARCH_TABLE_HTML: search_table_html.content,
+        INFO_GRAPH_DOT: info_graph_dot.content,
+        INFO_GRAPH_HTML: info_graph_html.content,
+    })
+    globals()[name] = value
+    return value
+
+
+if sys.version_info < (3, 7):  # No module __getattr__ (PEP 562)
+    __getattr__("dict_loader")
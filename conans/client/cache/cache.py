@@ -3,12 +3,10 @@ import platform
 import shutil
 from collections import OrderedDict
 
-from jinja2 import Environment, select_autoescape, FileSystemLoader, ChoiceLoader, Template
-
 from conan import conan_version
-from conans.assets.templates import dict_loader
 from conans.client.cache.editable import EditablePackages
 from conans.client.cache.remote_registry import RemoteRegistry
+from conans.client.cache.trash import TRASH_FOLDER, Trash
 from conans.client.conf import ConanClientConfigParser, get_default_client_conf, \
     get_default_settings_yml
 from conans.client.conf.detect import detect_defaults_settings
@@ -34,6 +32,21 @@ PROFILES_FOLDER = "profiles"
 HOOKS_FOLDER = "hooks"
 TEMPLATES_FOLDER = "templates"
 GENERATORS_FOLDER = "generators"
+BYTECODE_FOLDER = "bytecode"
+GENERATORS_MANIFESTS_FOLDER = "generators_manifests"
+
+# Parsed configuration files {path: (text, parsed)}, shared by all the caches of the process, so
+# long running processes (like the daemon) don't parse them again while their contents are equal
+_parsed_files = {}
+
+
+def _load_parsed(path, parse):
+    text = load(path)
+    cached = _parsed_files.get(path)
+    if cached is None or cached[0] != text:
+        cached = text, parse(text)
+        _parsed_files[path] = cached
+    return cached[1]
 
 
 def _is_case_insensitive_os():
@@ -79,7 +92,9 @@ class ClientCache(object):
         self._no_lock = None
         self._config = None
         self._new_config = None
+        self._metadata_cache = {}  # Loaded metadata.json files, shared by all layouts
         self.editable_packages = EditablePackages(self.cache_folder)
+        self.trash = Trash(os.path.join(self.cache_folder, TRASH_FOLDER), output)
         # paths
         self._store_folder = self.config.storage_path or os.path.join(self.cache_folder, "data")
         # Just call it to make it raise in case of short_paths misconfiguration
@@ -112,7 +127,8 @@ class ClientCache(object):
             _check_ref_case(ref, self.store)
             base_folder = os.path.normpath(os.path.join(self.store, ref.dir_repr()))
             return PackageCacheLayout(base_folder=base_folder, ref=ref,
-                                      short_paths=short_paths, no_lock=self._no_locks())
+                                      short_paths=short_paths, no_lock=self._no_locks(),
+                                      metadata_cache=self._metadata_cache, trash=self.trash)
 
     @property
     def remotes_path(self):
@@ -170,11 +186,12 @@ class ClientCache(object):
         if self._new_config is None:
             self._new_config = ConfDefinition()
             if os.path.exists(self.new_config_path):
-                text = load(self.new_config_path)
+                from jinja2 import Template
+                template = _load_parsed(self.new_config_path, Template)
                 distro = None
                 if platform.system() in ["Linux", "FreeBSD"]:
                     import distro
-                content = Template(text).render({"platform": platform, "os": os, "distro": distro,
+                content = template.render({"platform": platform, "os": os, "distro": distro,
                                                  "conan_version": conan_version})
                 self._new_config.loads(content)
         return self._new_config
@@ -215,6 +232,21 @@ class ClientCache(object):
         """
         return os.path.join(self.cache_folder, HOOKS_FOLDER)
 
+    @property
+    def bytecode_folder(self):
+        """
+        :return: Folder with the compiled bytecode of the loaded recipes
+        """
+        return os.path.join(self.cache_folder, BYTECODE_FOLDER)
+
+    @property
+    def generators_manifests_folder(self):
+        """
+        :return: Folder with the manifests of the files written by the generators in the
+                 consumers folders
+        """
+        return os.path.join(self.cache_folder, GENERATORS_MANIFESTS_FOLDER)
+
     @property
     def default_profile(self):
         self.initialize_default_profile()
@@ -230,8 +262,7 @@ class ClientCache(object):
         """Returns {setting: [value, ...]} defining all the possible
            settings without values"""
         self.initialize_settings()
-        content = load(self.settings_path)
-        return Settings.loads(content)
+        return _load_parsed(self.settings_path, Settings.loads).copy()
 
     @property
     def hooks(self):
@@ -276,6 +307,8 @@ class ClientCache(object):
 
     def get_template(self, template_name, user_overrides=False):
         # TODO: It can be initialized only once together with the Conan app
+        from jinja2 import Environment, select_autoescape, FileSystemLoader, ChoiceLoader
+        from conans.assets.templates import dict_loader
         loaders = [dict_loader]
         if user_overrides:
             loaders.insert(0, FileSystemLoader(os.path.join(self.cache_folder, 'templates')))
@@ -0,0 +1,112 @@
+import os
+import platform
+import subprocess
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import conans
+from conans.paths import rm_conandir
+from conans.util.files import mkdir
+from conans.util.log import logger
+
+TRASH_FOLDER = "trash"
+_REMOVE_WORKERS = 8
+
+
+class Trash(object):
+    """ Folder of the cache where the folders to remove are moved first, with a single atomic
+    rename, so the cache is consistent immediately. Their contents are removed later, in
+    parallel, by a background process. Anything left in the trash by an interrupted removal is
+    removed the next time the trash is emptied.
+    """
+
+    def __init__(self, folder, output=None):
+        self._folder = folder
+        self._output = output
+        self._warned = False
+
+    @property
+    def folder(self):
+        return self._folder
+
+    def discard(self, path):
+        """ moves the folder to the trash. If it cannot be moved (i.e. it is in a different
+        file system than the trash), it is removed in place
+        """
+        if not os.path.exists(path):
+            return
+        try:
+            try:
+                mkdir(self._folder)
+                os.rename(path, os.path.join(self._folder, uuid.uuid4().hex))
+            except OSError:  # A background process could have just removed the empty trash
+                mkdir(self._folder)
+                os.rename(path, os.path.join(self._folder, uuid.uuid4().hex))
+        except OSError as e:
+            logger.debug("TRASH: Cannot move %s to trash, removing it: %s" % (path, str(e)))
+            if self._output is not None and not self._warned:
+                self._warned = True
+                self._output.warn("The removed cache folders cannot be moved to the trash %s, "
+                                  "removing them can take longer. Is 'storage.path' in a "
+                                  "different file system? (%s)" % (self._folder, str(e)))
+            rm_conandir(path)
+
+    def empty_in_background(self):
+        """ removes the contents of the trash in a detached process, so the command doesn't
+        wait for it. If it cannot be launched (e.g. the Conan installers cannot run Python
+        modules) they are removed now
+        """
+        if not os.path.isdir(self._folder):
+            return
+        if getattr(sys, "frozen", False):
+            self.empty()
+            return
+        # The process imports this Conan, wherever the current folder is
+        env = dict(os.environ)
+        conans_root = os.path.dirname(os.path.dirname(os.path.abspath(conans.__file__)))
+        env["PYTHONPATH"] = os.pathsep.join(p for p in (conans_root, env.get("PYTHONPATH")) if p)
+        if platform.system() == "Windows":
+            detached = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP |
+                        subprocess.DETACHED_PROCESS}
+        else:
+            detached = {"start_new_session": True}
+        try:
+            with open(os.devnull, "r+") as devnull:
+                subprocess.Popen([sys.executable, "-m", "conans.client.cache.trash",
+                                  self._folder], stdin=devnull, stdout=devnull, stderr=devnull,
+                                 close_fds=True, cwd=os.path.dirname(self._folder), env=env,
+                                 **detached)
+        except (OSError, ValueError) as e:
+            logger.debug("TRASH: Cannot empty the trash in background: %s" % str(e))
+            self.empty()
+
+    def empty(self):
+        """ removes the contents of the trash, including the ones left by other processes
+        """
+        try:
+            entries = os.listdir(self._folder)
+        except OSError:  # Nothing discarded
+            return
+        paths = [os.path.join(self._folder, entry) for entry in entries]
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(paths), _REMOVE_WORKERS)) as executor:
+                list(executor.map(self._remove, paths))
+        else:
+            for path in paths:
+                self._remove(path)
+        try:
+            os.rmdir(self._folder)
+        except OSError:  # Something was discarded concurrently or couldn't be removed
+            pass
+
+    @staticmethod
+    def _remove(path):
+        try:
+            rm_conandir(path)
+        except OSError as e:  # Other process could be removing it too, will be retried later
+            logger.debug("TRASH: Cannot remove %s: %s" % (path, str(e)))
+
+
+if __name__ == "__main__":
+    Trash(sys.argv[1]).empty()
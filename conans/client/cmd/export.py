@@ -4,12 +4,12 @@ import shutil
 import sys
 
 import six
-import yaml
 
 from conans.client.file_copier import FileCopier
 from conans.client.output import Color, ScopedOutput
 from conans.client.remover import DiskRemover
 from conans.client.tools import chdir
+from conans.client.tools.scm import git_snapshots
 from conans.errors import ConanException, ConanV2Exception, conanfile_exception_formatter
 from conans.model.manifest import FileTreeManifest
 from conans.model.ref import ConanFileReference
@@ -124,7 +124,8 @@ def cmd_export(app, conanfile_path, name, version, user, channel, keep_source,
         except IOError:
             previous_manifest = None
 
-        package_layout.export_remove()
+        # The compressed recipe files are still valid if the recipe doesn't change
+        package_layout.export_remove(keep_download=True)
         export_folder = package_layout.export()
         export_src_folder = package_layout.export_sources()
         mkdir(export_folder)
@@ -134,22 +135,25 @@ def cmd_export(app, conanfile_path, name, version, user, channel, keep_source,
         export_source(conanfile, origin_folder, export_src_folder)
         shutil.copy2(conanfile_path, package_layout.conanfile())
 
-        # Calculate the "auto" values and replace in conanfile.py
-        scm_data, local_src_folder = _capture_scm_auto_fields(conanfile,
-                                                              os.path.dirname(conanfile_path),
-                                                              package_layout, output,
-                                                              ignore_dirty, scm_to_conandata)
-        # Clear previous scm_folder
-        modified_recipe = False
-        scm_sources_folder = package_layout.scm_sources()
-        if local_src_folder and not keep_source:
-            # Copy the local scm folder to scm_sources in the cache
-            mkdir(scm_sources_folder)
-            _export_scm(scm_data, local_src_folder, scm_sources_folder, output)
-            # https://github.com/conan-io/conan/issues/5195#issuecomment-551840597
-            # It will cause the source folder to be removed (needed because the recipe still has
-            # the "auto" with uncommitted changes)
-            modified_recipe = True
+        # The state of the git repository is captured once, for all the scm fields and the
+        # revision of this export
+        with git_snapshots() as snapshots:
+            # Calculate the "auto" values and replace in conanfile.py
+            scm_data, local_src_folder = _capture_scm_auto_fields(conanfile,
+                                                                  os.path.dirname(conanfile_path),
+                                                                  package_layout, output,
+                                                                  ignore_dirty, scm_to_conandata)
+            # Clear previous scm_folder
+            modified_recipe = False
+            scm_sources_folder = package_layout.scm_sources()
+            if local_src_folder and not keep_source:
+                # Copy the local scm folder to scm_sources in the cache
+                mkdir(scm_sources_folder)
+                _export_scm(scm_data, local_src_folder, scm_sources_folder, output)
+                # https://github.com/conan-io/conan/issues/5195#issuecomment-551840597
+                # It will cause the source folder to be removed (needed because the recipe still
+                # has the "auto" with uncommitted changes)
+                modified_recipe = True
 
         # Execute post-export hook before computing the digest
         hook_manager.execute("post_export", conanfile=conanfile, reference=package_layout.ref,
@@ -161,18 +165,20 @@ def cmd_export(app, conanfile_path, name, version, user, channel, keep_source,
         if modified_recipe:
             output.success('A new %s version was exported' % CONANFILE)
             output.info('Folder: %s' % export_folder)
+            package_layout.remove_folder(package_layout.download_export())
         else:
             output.info("The stored package has not changed")
             manifest = previous_manifest  # Use the old one, keep old timestamp
         manifest.save(export_folder)
 
     # Compute the revision for the recipe
-    revision = _update_revision_in_metadata(package_layout=package_layout,
-                                            revisions_enabled=revisions_enabled,
-                                            output=output,
-                                            path=os.path.dirname(conanfile_path),
-                                            manifest=manifest,
-                                            revision_mode=conanfile.revision_mode)
+    with git_snapshots(snapshots):
+        revision = _update_revision_in_metadata(package_layout=package_layout,
+                                                revisions_enabled=revisions_enabled,
+                                                output=output,
+                                                path=os.path.dirname(conanfile_path),
+                                                manifest=manifest,
+                                                revision_mode=conanfile.revision_mode)
 
     # FIXME: Conan 2.0 Clear the registry entry if the recipe has changed
     source_folder = package_layout.source()
@@ -286,6 +292,7 @@ def _capture_scm_auto_fields(conanfile, conanfile_dir, package_layout, output, i
 
 def _replace_scm_data_in_recipe(package_layout, scm_data, scm_to_conandata):
     if scm_to_conandata:
+        import yaml
         conandata_path = os.path.join(package_layout.export(), DATA_YML)
         conandata_yml = {}
         if os.path.exists(conandata_path):
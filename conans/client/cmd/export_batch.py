@@ -0,0 +1,93 @@
+import os
+import time
+from multiprocessing import Pool
+
+from six import StringIO
+
+from conans.client.cmd.export import cmd_export
+from conans.client.output import ConanOutput
+from conans.client.tools.env import environment_append
+from conans.client.tools.scm import capture_git_snapshots, git_snapshots
+from conans.client.userio import UserIO
+from conans.errors import ConanException
+from conans.model.ref import ConanFileReference
+from conans.tools import cpu_count
+from conans.util.files import exception_message_safe
+from conans.util.log import logger
+
+# The ConanApp of every process of the pool, its output and the git snapshots
+_worker = None
+
+
+def _init_worker(cache_folder, snapshots):
+    from conans.client.conan_api import ConanApp
+    global _worker
+    stream = StringIO()
+    user_io = UserIO(out=ConanOutput(stream))
+    user_io.disable_input()
+    app = ConanApp(cache_folder, user_io)
+    app.load_remotes()
+    _worker = app, stream, snapshots
+
+
+def _export(app, conanfile_path, user, channel, keep_source, ignore_dirty, snapshots):
+    """ returns the exported reference (full string, with revision) and the error, if any
+    """
+    current_dir = os.getcwd()
+    try:
+        with environment_append(app.cache.config.env_vars):
+            with git_snapshots(snapshots):
+                ref = cmd_export(app, conanfile_path, None, None, user, channel, keep_source,
+                                 ignore_dirty=ignore_dirty)
+        return ref.full_str(), None
+    except Exception as exc:
+        return None, exception_message_safe(exc)
+    finally:
+        os.chdir(current_dir)
+
+
+def _export_worker(args):
+    app, stream, snapshots = _worker
+    stream.seek(0)
+    stream.truncate()
+    ref, error = _export(app, *args, snapshots=snapshots)
+    return ref, error, stream.getvalue()
+
+
+def cmd_export_batch(app, conanfile_paths, user, channel, keep_source=False, ignore_dirty=False,
+                     jobs=None):
+    """ Exports many recipes, in parallel processes, every one loading and exporting the recipes
+    with its own ConanApp. The state of the git repositories containing the recipes (the
+    commit and if there are uncommitted changes) is captured once, and shared by all the recipes.
+    Returns the exported references, in the same order than the paths
+    """
+    t1 = time.time()
+    output = app.out
+    jobs = min(jobs or cpu_count(), len(conanfile_paths))
+    snapshots = capture_git_snapshots(os.path.dirname(p) for p in conanfile_paths)
+    tasks = [(path, user, channel, keep_source, ignore_dirty) for path in conanfile_paths]
+
+    results = []
+    if jobs <= 1:
+        for task in tasks:
+            ref, error = _export(app, *task, snapshots=snapshots)
+            results.append((ref, error))
+    else:
+        pool = Pool(jobs, initializer=_init_worker, initargs=(app.cache_folder, snapshots))
+        try:
+            # In order, so the output of every recipe is not mixed with others
+            for ref, error, recipe_output in pool.imap(_export_worker, tasks):
+                output.write(recipe_output)
+                results.append((ref, error))
+        finally:
+            pool.close()
+            pool.join()
+
+    errors = [(path, error) for path, (_, error) in zip(conanfile_paths, results) if error]
+    for path, error in errors:
+        output.error("Export of '%s' failed: %s" % (path, error))
+    if errors:
+        raise ConanException("Errors exporting some recipes")
+
+    logger.debug("EXPORT: Time export batch: %f" % (time.time() - t1))
+    return [ConanFileReference.loads(ref) for ref, _ in results]
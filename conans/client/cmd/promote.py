@@ -0,0 +1,153 @@
+import time
+import traceback
+from multiprocessing.pool import ThreadPool
+
+from conans.client.remote_manager import is_package_snapshot_complete
+from conans.errors import ConanException, NotFoundException, PackageNotFoundException
+from conans.model.ref import ConanFileReference, PackageReference, check_valid_ref
+from conans.tools import cpu_count
+from conans.util import progress_bar
+from conans.util.env_reader import get_env
+from conans.util.files import mkdir_tmp, rmdir
+from conans.util.log import logger
+
+
+class CmdPromote(object):
+    """ Copies recipes and binary packages from one remote to another, keeping their revisions.
+
+    The compressed files stored in the source remote (conan_export.tgz, conan_sources.tgz,
+    conan_package.tgz, conaninfo.txt, conanmanifest.txt...) are transferred as they are: they
+    are downloaded in chunks to a temporary folder, without extracting them, and uploaded to the
+    target remote, that needs their size and checksum before receiving them. Nothing is
+    compressed again and the local cache is not used.
+    """
+
+    def __init__(self, cache, user_io, remote_manager):
+        self._cache = cache
+        self._user_io = user_io
+        self._output = progress_bar.ProgressOutput(user_io.out)
+        self._remote_manager = remote_manager
+        self._exceptions_list = []
+
+    def promote(self, reference_or_pattern, source, target, package_id=None, all_packages=False,
+                query=None, force=False, retry=None, retry_wait=None, parallel=False):
+        if source.name == target.name:
+            raise ConanException("The source and target remotes must be different")
+        t1 = time.time()
+        refs = self._collect_refs(reference_or_pattern, source, package_id)
+
+        # The credentials of the target are requested once, before transferring anything
+        self._remote_manager.check_credentials(target)
+        if parallel:
+            self._user_io.disable_input()
+        pool = ThreadPool((self._cache.config.parallel_upload or cpu_count()) if parallel else 1)
+        try:
+            self._output.info("Promoting from remote '%s' to remote '%s':"
+                              % (source.name, target.name))
+
+            def promote_recipe(ref):
+                try:
+                    ref = self._promote_recipe(ref, source, target, force, retry, retry_wait)
+                    return self._collect_prefs(ref, source, package_id, all_packages, query)
+                except BaseException as exc:
+                    self._exceptions_list.append((exc, ref, traceback.format_exc()))
+                    return []
+
+            prefs = [pref for ref_prefs in pool.map(promote_recipe, refs) for pref in ref_prefs]
+
+            def promote_package(pref):
+                try:
+                    self._promote_package(pref, source, target, force, retry, retry_wait)
+                except BaseException as exc:
+                    self._exceptions_list.append((exc, pref, traceback.format_exc()))
+
+            pool.map(promote_package, prefs)
+        finally:
+            pool.close()
+            pool.join()
+
+        if self._exceptions_list:
+            for exc, ref, trace in self._exceptions_list:
+                t = "recipe" if isinstance(ref, ConanFileReference) else "package"
+                msg = "%s: Promotion of %s to '%s' failed: %s\n" % (str(ref), t, target.name,
+                                                                    str(exc))
+                if get_env("CONAN_VERBOSE_TRACEBACK", False):
+                    msg += trace
+                self._output.error(msg)
+            raise ConanException("Errors promoting some packages")
+
+        logger.debug("PROMOTE: Time promote: %f" % (time.time() - t1))
+
+    def _collect_refs(self, reference_or_pattern, source, package_id):
+        if package_id and not check_valid_ref(reference_or_pattern, strict_mode=False):
+            raise ConanException("-p parameter only allowed with a valid recipe reference, "
+                                 "not with a pattern")
+        if package_id or check_valid_ref(reference_or_pattern):
+            ref = ConanFileReference.loads(reference_or_pattern)
+            if ref.revision and not self._cache.config.revisions_enabled:
+                raise ConanException("Revisions not enabled in the client, specify a "
+                                     "reference without revision")
+            return [ref]
+        refs = self._remote_manager.search_recipes(source, reference_or_pattern)
+        if not refs:
+            raise NotFoundException("No packages found matching pattern '%s' in remote '%s'"
+                                    % (reference_or_pattern, source.name))
+        return sorted(refs)
+
+    def _collect_prefs(self, ref, source, package_id, all_packages, query):
+        """ the references of the packages to promote of a recipe, ref has the revision
+        """
+        if package_id:
+            package_id, revision = (package_id.split("#", 1) if "#" in package_id
+                                    else (package_id, None))
+            return [PackageReference(ref, package_id, revision)]
+        if all_packages or query:
+            packages = self._remote_manager.search_packages(source, ref, query)
+            return [PackageReference(ref, pid) for pid in sorted(packages)]
+        return []
+
+    def _promote_recipe(self, ref, source, target, force, retry, retry_wait):
+        """ returns the reference with the promoted revision
+        """
+        source_manifest, ref = self._remote_manager.get_recipe_manifest(ref, source)
+        msg = "\rPromoting %s" % str(ref)
+        self._output.info(progress_bar.left_justify_message(msg))
+        try:
+            target_manifest, _ = self._remote_manager.get_recipe_manifest(ref, target)
+            target_snapshot = self._remote_manager.get_recipe_snapshot(ref, target)
+        except NotFoundException:
+            target_manifest, target_snapshot = None, []
+        if not force and target_manifest is not None and target_manifest == source_manifest:
+            self._output.info("%s: Recipe is up to date, promotion skipped" % str(ref))
+            return ref
+
+        tmp_folder = mkdir_tmp()
+        try:
+            files = self._remote_manager.get_recipe_files(ref, source, tmp_folder)
+            deleted = [f for f in target_snapshot if f not in files]
+            self._remote_manager.upload_recipe(ref, files, deleted, target, retry, retry_wait)
+        finally:
+            rmdir(tmp_folder)
+        self._output.info("%s: Promoted recipe to '%s'" % (str(ref), target.name))
+        return ref
+
+    def _promote_package(self, pref, source, target, force, retry, retry_wait):
+        source_manifest, pref = self._remote_manager.get_package_manifest(pref, source)
+        snapshot = self._remote_manager.get_package_snapshot(pref, source)
+        if not is_package_snapshot_complete(snapshot):
+            raise PackageNotFoundException(pref, remote=source)
+        try:
+            target_manifest, _ = self._remote_manager.get_package_manifest(pref, target)
+        except NotFoundException:
+            target_manifest = None
+        if not force and target_manifest is not None and target_manifest == source_manifest:
+            self._output.info("%s: Package is up to date, promotion skipped" % str(pref))
+            return
+
+        tmp_folder = mkdir_tmp()
+        try:
+            files = self._remote_manager.get_package_files(pref, source, tmp_folder)
+            self._remote_manager.upload_package(pref, files, None, target, retry, retry_wait)
+        finally:
+            rmdir(tmp_folder)
+        self._output.info("%s: Promoted package to '%s'" % (str(pref), target.name))
@@ -1,6 +1,8 @@
 import os
+import shutil
 import stat
 import tarfile
+import threading
 import time
 import traceback
 from collections import defaultdict
@@ -9,6 +11,7 @@ from multiprocessing.pool import ThreadPool
 from conans.util import progress_bar
 from conans.util.env_reader import get_env
 from conans.util.progress_bar import left_justify_message
+from conans.client.downloaders.cached_file_downloader import find_download_cache_file
 from conans.client.remote_manager import is_package_snapshot_complete, calc_files_checksum
 from conans.client.source import retrieve_exports_sources
 from conans.errors import ConanException, NotFoundException
@@ -17,9 +20,11 @@ from conans.model.ref import ConanFileReference, PackageReference, check_valid_r
 from conans.paths import (CONAN_MANIFEST, CONANFILE, EXPORT_SOURCES_TGZ_NAME,
                           EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, CONANINFO)
 from conans.search.search import search_packages, search_recipes
-from conans.util.files import (load, clean_dirty, is_dirty,
-                               gzopen_without_timestamps, set_dirty_context_manager)
+from conans.util.files import (load, clean_dirty, is_dirty, HashingWriter, store_file_checksums,
+                               gzopen_without_timestamps, set_dirty_context_manager, mkdir,
+                               file_checksums)
 from conans.util.log import logger
+from conans.util.profiler import span
 from conans.util.tracer import log_recipe_upload, log_compressed_files, log_package_upload
 from conans.tools import cpu_count
 
@@ -157,20 +162,123 @@ class _UploadCollecter(object):
         return refs_by_remote
 
 
+class _RemoteChecks(object):
+    """
+    Answers the queries to the remotes that decide what has to be uploaded: recipe and package
+    manifests and snapshots. They are done in advance with "prefetch" for all the references
+    to upload to a remote, concurrently, and the transfer phase consumes the results without
+    querying the remote again. Anything not prefetched (or that failed) is queried when needed.
+    The credentials are checked only once per remote.
+    """
+    def __init__(self, remote_manager):
+        self._remote_manager = remote_manager
+        self._checked_credentials = set()
+        self._results = {}  # {(remote_name, query_name, ref or pref): result or NotFoundException}
+        self._lock = threading.Lock()
+
+    def check_credentials(self, remote):
+        if remote.name not in self._checked_credentials:
+            self._remote_manager.check_credentials(remote)
+            self._checked_credentials.add(remote.name)
+
+    def _query(self, query_name, ref, remote):
+        with self._lock:
+            result = self._results.pop((remote.name, query_name, ref), None)
+        if result is None:
+            return getattr(self._remote_manager, query_name)(ref, remote)
+        if isinstance(result, NotFoundException):
+            raise result
+        return result
+
+    def get_recipe_manifest(self, ref, remote):
+        return self._query("get_recipe_manifest", ref, remote)
+
+    def get_recipe_snapshot(self, ref, remote):
+        return self._query("get_recipe_snapshot", ref, remote)
+
+    def get_package_manifest(self, pref, remote):
+        return self._query("get_package_manifest", pref, remote)
+
+    def get_package_snapshot(self, pref, remote):
+        return self._query("get_package_snapshot", pref, remote)
+
+    def forget_packages(self, ref, remote):
+        """ The remote packages of the reference could have changed after uploading its recipe
+        """
+        with self._lock:
+            for key in [k for k in self._results if k[0] == remote.name and
+                        isinstance(k[2], PackageReference) and k[2].ref == ref]:
+                del self._results[key]
+
+    def prefetch(self, remote, refs, policy, workers):
+        """ refs: [(ref, conanfile, prefs)] to be uploaded to the remote
+        """
+        def run_query(query):
+            query_name, ref = query
+            try:
+                result = getattr(self._remote_manager, query_name)(ref, remote)
+            except NotFoundException as e:
+                result = e
+            except Exception as e:  # It will be queried again, and reported, when uploading
+                logger.debug("UPLOAD: %s %s failed: %s" % (query_name, repr(ref), str(e)))
+                return False
+            with self._lock:
+                self._results[(remote.name, query_name, ref)] = result
+            if (query_name == "get_package_snapshot" and result and
+                    policy != UPLOAD_POLICY_FORCE and is_package_snapshot_complete(result)):
+                run_query(("get_package_manifest", ref))
+            return True
+
+        def run_queries(queries):
+            if not queries:
+                return True
+            # The first one alone, so the connection (or login) to the remote happens only once,
+            # and if it fails, the rest are not tried
+            if not run_query(queries[0]):
+                return False
+            pool = ThreadPool(workers)
+            try:
+                pool.map(run_query, queries[1:])
+            finally:
+                pool.close()
+                pool.join()
+            return True
+
+        t1 = time.time()
+        # The same order than the upload: recipe manifests, credentials, snapshots
+        if policy != UPLOAD_POLICY_FORCE:
+            if not run_queries([("get_recipe_manifest", ref) for ref, _, _ in refs]):
+                return
+        if policy != UPLOAD_POLICY_SKIP:
+            try:
+                self.check_credentials(remote)
+            except Exception as e:  # It will be checked again, and reported, when uploading
+                logger.debug("UPLOAD: check_credentials failed: %s" % str(e))
+                return
+            queries = []
+            for ref, _, prefs in refs:
+                queries.append(("get_recipe_snapshot", ref))
+                queries.extend(("get_package_snapshot", pref) for pref in prefs)
+            run_queries(queries)
+        logger.debug("UPLOAD: Time checking remote '%s': %f" % (remote.name, time.time() - t1))
+
+
 class _PackagePreparator(object):
-    def __init__(self, cache, remote_manager, hook_manager, output):
+    def __init__(self, cache, remote_manager, hook_manager, output, remote_checks):
         self._cache = cache
         self._remote_manager = remote_manager
         self._output = output
         self._hook_manager = hook_manager
+        self._remote_checks = remote_checks
 
     def prepare_recipe(self, ref, conanfile, remote, remotes, policy):
         """ do a bunch of things that are necessary before actually executing the upload:
         - retrieve exports_sources to complete the recipe if necessary
-        - compress the artifacts in conan_export.tgz and conan_export_sources.tgz
         - check if package is ok to be uploaded, if scm info missing, will raise
         - check if the remote recipe is newer, raise
-        - compare and decide which files need to be uploaded (and deleted from server)
+        - compare with the remote manifest, an up to date recipe is not compressed
+        - compress the artifacts in conan_export.tgz and conan_export_sources.tgz
+        - decide which files need to be uploaded (and deleted from server)
         """
         layout = self._cache.package_layout(ref)
         current_remote_name = layout.load_metadata().recipe.remote
@@ -183,12 +291,12 @@ class _PackagePreparator(object):
                                    reference=ref, remote=remote)
 
         t1 = time.time()
-        cache_files = self._compress_recipe_files(layout, ref)
-
-        with layout.update_metadata() as metadata:
-            metadata.recipe.checksums = calc_files_checksum(cache_files)
-
-        local_manifest = FileTreeManifest.loads(load(cache_files["conanmanifest.txt"]))
+        export_folder = layout.export()
+        recipe_files = {CONANFILE: os.path.join(export_folder, CONANFILE),
+                        CONAN_MANIFEST: os.path.join(export_folder, CONAN_MANIFEST)}
+        if not all(os.path.isfile(f) for f in recipe_files.values()):
+            raise ConanException("Cannot upload corrupted recipe '%s'" % str(ref))
+        local_manifest = FileTreeManifest.loads(load(recipe_files[CONAN_MANIFEST]))
 
         remote_manifest = None
         if policy != UPLOAD_POLICY_FORCE:
@@ -205,16 +313,26 @@ class _PackagePreparator(object):
 
             remote_manifest = self._check_recipe_date(ref, remote, local_manifest)
 
+        remote_snapshot = None
+        if policy != UPLOAD_POLICY_SKIP:
+            remote_snapshot = self._remote_recipe_snapshot(ref, policy, remote, remote_manifest,
+                                                           local_manifest)
+            if remote_snapshot is None:  # Up to date, it is not compressed
+                return None, None, recipe_files, conanfile_path, t1, current_remote_name, layout
+
+        cache_files = self._compress_recipe_files(layout, ref)
+        with layout.update_metadata() as metadata:
+            metadata.recipe.checksums = calc_files_checksum(cache_files)
+
         if policy == UPLOAD_POLICY_SKIP:
             return
 
-        files_to_upload, deleted = self._recipe_files_to_upload(ref, policy, cache_files, remote,
-                                                                remote_manifest, local_manifest)
-        return files_to_upload, deleted, cache_files, conanfile_path, t1, current_remote_name, layout
+        deleted = set(remote_snapshot).difference(cache_files)
+        return cache_files, deleted, cache_files, conanfile_path, t1, current_remote_name, layout
 
     def _check_recipe_date(self, ref, remote, local_manifest):
         try:
-            remote_recipe_manifest, ref = self._remote_manager.get_recipe_manifest(ref, remote)
+            remote_recipe_manifest, ref = self._remote_checks.get_recipe_manifest(ref, remote)
         except NotFoundException:
             return  # First time uploading this package
 
@@ -247,33 +365,35 @@ class _PackagePreparator(object):
         except Exception as e:
             self._output.info("Error printing information about the diff: %s" % str(e))
 
-    def _recipe_files_to_upload(self, ref, policy, files, remote, remote_manifest, local_manifest):
-        self._remote_manager.check_credentials(remote)
-        remote_snapshot = self._remote_manager.get_recipe_snapshot(ref, remote)
+    def _remote_recipe_snapshot(self, ref, policy, remote, remote_manifest, local_manifest):
+        """ the remote recipe files, to decide which ones have to be deleted, None if the remote
+        recipe is up to date and nothing has to be uploaded
+        """
+        self._remote_checks.check_credentials(remote)
+        remote_snapshot = self._remote_checks.get_recipe_snapshot(ref, remote)
         if not remote_snapshot:
-            return files, set()
+            return {}
 
-        deleted = set(remote_snapshot).difference(files)
         if policy != UPLOAD_POLICY_FORCE:
             if remote_manifest is None:
                 # This is the weird scenario, we have a snapshot but don't have a manifest.
                 # Can be due to concurrency issues, so we can try retrieve it now
                 try:
-                    remote_manifest, _ = self._remote_manager.get_recipe_manifest(ref, remote)
+                    remote_manifest, _ = self._remote_checks.get_recipe_manifest(ref, remote)
                 except NotFoundException:
                     # This is weird, the manifest still not there, better upload everything
                     self._output.warn("The remote recipe doesn't have the 'conanmanifest.txt' "
                                       "file and will be uploaded: '{}'".format(ref))
-                    return files, deleted
+                    return remote_snapshot
 
             if remote_manifest == local_manifest:
-                return None, None
+                return None
 
             if policy in (UPLOAD_POLICY_NO_OVERWRITE, UPLOAD_POLICY_NO_OVERWRITE_RECIPE):
                 raise ConanException("Local recipe is different from the remote recipe. "
                                      "Forbidden overwrite.")
 
-        return files, deleted
+        return remote_snapshot
 
     def _compress_recipe_files(self, layout, ref):
         download_export_folder = layout.download_export()
@@ -295,9 +415,12 @@ class _PackagePreparator(object):
         result = {CONANFILE: files.pop(CONANFILE),
                   CONAN_MANIFEST: files.pop(CONAN_MANIFEST)}
 
+        recorded_checksums = layout.load_metadata().recipe.checksums
+
         def add_tgz(tgz_name, tgz_files, tgz_symlinks, msg):
             tgz = os.path.join(download_export_folder, tgz_name)
-            if os.path.isfile(tgz):
+            if os.path.isfile(tgz) or self._reuse_tgz(tgz, result[CONAN_MANIFEST],
+                                                      recorded_checksums):
                 result[tgz_name] = tgz
             elif tgz_files:
                 if self._output and not self._output.is_terminal:
@@ -312,15 +435,22 @@ class _PackagePreparator(object):
         return result
 
     def prepare_package(self, pref, integrity_check, policy, p_remote):
+        """ The package is compared with the remote manifest before compressing it, an up to
+        date package is not compressed
+        """
         pkg_layout = self._cache.package_layout(pref.ref)
-        cache_files = self._compress_package_files(pkg_layout, pref, integrity_check)
+        files, symlinks = self._gather_package_files(pkg_layout, pref, integrity_check)
 
         if policy == UPLOAD_POLICY_SKIP:
+            self._compress_package_files(pkg_layout, pref, files, symlinks)
             return None
-        files_to_upload, deleted = self._package_files_to_upload(pref, policy, cache_files, p_remote)
-        return files_to_upload, deleted, cache_files
+        deleted = self._remote_package_deleted(pref, policy, files[CONAN_MANIFEST], p_remote)
+        if deleted is None:  # Up to date
+            return None, None, {CONANINFO: files[CONANINFO], CONAN_MANIFEST: files[CONAN_MANIFEST]}
+        cache_files = self._compress_package_files(pkg_layout, pref, files, symlinks)
+        return cache_files, deleted, cache_files
 
-    def _compress_package_files(self, layout, pref, integrity_check):
+    def _gather_package_files(self, layout, pref, integrity_check):
         t1 = time.time()
         if layout.package_is_dirty(pref):
             raise ConanException("Package %s is corrupted, aborting upload.\n"
@@ -348,8 +478,14 @@ class _PackagePreparator(object):
             self._package_integrity_check(pref, files, package_folder)
             logger.debug("UPLOAD: Time remote_manager check package integrity : %f"
                          % (time.time() - t1))
+        return files, symlinks
 
-        if not os.path.isfile(package_tgz):
+    def _compress_package_files(self, layout, pref, files, symlinks):
+        download_pkg_folder = layout.download_package(pref)
+        package_tgz = os.path.join(download_pkg_folder, PACKAGE_TGZ_NAME)
+        recorded_checksums = layout.load_metadata().packages[pref.id].checksums
+        if (not os.path.isfile(package_tgz) and
+                not self._reuse_tgz(package_tgz, files[CONAN_MANIFEST], recorded_checksums)):
             if self._output and not self._output.is_terminal:
                 self._output.writeln("Compressing package...")
             tgz_files = {f: path for f, path in files.items() if
@@ -363,6 +499,33 @@ class _PackagePreparator(object):
                 CONANINFO: files[CONANINFO],
                 CONAN_MANIFEST: files[CONAN_MANIFEST]}
 
+    def _reuse_tgz(self, tgz_path, manifest_path, recorded_checksums):
+        """ The metadata records the checksums of the last downloaded or uploaded files. If the
+        manifest is still the same, a tgz with the recorded checksum has the same contents, and
+        if it is in the download cache, it can be used instead of compressing the files again
+        """
+        download_cache = self._cache.config.download_cache
+        tgz_checksums = recorded_checksums.get(os.path.basename(tgz_path))
+        manifest_checksums = recorded_checksums.get(CONAN_MANIFEST)
+        if not download_cache or not tgz_checksums or not manifest_checksums:
+            return False
+        if file_checksums(manifest_path, ("sha1",))["sha1"] != manifest_checksums["sha1"]:
+            return False
+        cached_tgz = find_download_cache_file(download_cache, tgz_checksums["sha1"])
+        if cached_tgz is None:
+            return False
+        try:
+            mkdir(os.path.dirname(tgz_path))
+            shutil.copy2(cached_tgz, tgz_path)
+            if file_checksums(tgz_path, ("sha1",))["sha1"] == tgz_checksums["sha1"]:
+                logger.debug("UPLOAD: Reused %s from the download cache" % tgz_path)
+                return True
+        except (IOError, OSError) as e:  # Concurrently evicted from the download cache
+            logger.debug("UPLOAD: Cannot reuse %s: %s" % (cached_tgz, str(e)))
+        if os.path.exists(tgz_path):
+            os.remove(tgz_path)
+        return False
+
     def _package_integrity_check(self, pref, files, package_folder):
         # If package has been modified remove tgz to regenerate it
         self._output.rewrite_line("Checking package integrity...")
@@ -392,22 +555,24 @@ class _PackagePreparator(object):
             self._output.rewrite_line("Package integrity OK!")
         self._output.writeln("")
 
-    def _package_files_to_upload(self, pref, policy, the_files, remote):
-        self._remote_manager.check_credentials(remote)
-        remote_snapshot = self._remote_manager.get_package_snapshot(pref, remote)
+    def _remote_package_deleted(self, pref, policy, manifest_path, remote):
+        """ the remote package files to be deleted, None if the remote package is up to date
+        and nothing has to be uploaded
+        """
+        self._remote_checks.check_credentials(remote)
+        remote_snapshot = self._remote_checks.get_package_snapshot(pref, remote)
 
         if remote_snapshot and policy != UPLOAD_POLICY_FORCE:
             if not is_package_snapshot_complete(remote_snapshot):
-                return the_files, set()
-            remote_manifest, _ = self._remote_manager.get_package_manifest(pref, remote)
-            local_manifest = FileTreeManifest.loads(load(the_files["conanmanifest.txt"]))
+                return set()
+            remote_manifest, _ = self._remote_checks.get_package_manifest(pref, remote)
+            local_manifest = FileTreeManifest.loads(load(manifest_path))
             if remote_manifest == local_manifest:
-                return None, None
+                return None
             if policy == UPLOAD_POLICY_NO_OVERWRITE:
                 raise ConanException("Local package is different from the remote package. Forbidden"
                                      " overwrite.")
-        deleted = set(remote_snapshot).difference(the_files)
-        return the_files, deleted
+        return set(remote_snapshot).difference((PACKAGE_TGZ_NAME, CONANINFO, CONAN_MANIFEST))
 
 
 class CmdUpload(object):
@@ -441,6 +606,9 @@ class CmdUpload(object):
     - get_package_snapshot() to do the diff and know what files to upload
     - get_recipe_manifest() to check the date and raise if policy requires
     - get_package_manifest() to raise if policy!=force and manifests change
+
+    These queries are done for all the references to upload to a remote before the transfers,
+    concurrently ("_RemoteChecks.prefetch"), and the credentials are checked once per remote.
     """
     def __init__(self, cache, user_io, remote_manager, loader, hook_manager):
         self._cache = cache
@@ -451,7 +619,9 @@ class CmdUpload(object):
         self._hook_manager = hook_manager
         self._upload_thread_pool = None
         self._exceptions_list = []
-        self._preparator = _PackagePreparator(cache, remote_manager, hook_manager, self._output)
+        self._remote_checks = _RemoteChecks(remote_manager)
+        self._preparator = _PackagePreparator(cache, remote_manager, hook_manager, self._output,
+                                              self._remote_checks)
 
     def upload(self, reference_or_pattern, remotes, upload_recorder, package_id=None,
                all_packages=None, confirm=False, retry=None, retry_wait=None, integrity_check=False,
@@ -465,10 +635,12 @@ class CmdUpload(object):
         if parallel_upload:
             self._user_io.disable_input()
         self._upload_thread_pool = ThreadPool(
-            cpu_count() if parallel_upload else 1)
+            (self._cache.config.parallel_upload or cpu_count()) if parallel_upload else 1)
+        checks_workers = self._cache.config.parallel_upload_checks
 
         for remote, refs in refs_by_remote.items():
             self._output.info("Uploading to remote '{}':".format(remote.name))
+            self._remote_checks.prefetch(remote, refs, policy, checks_workers)
 
             def upload_ref(ref_conanfile_prefs):
                 _ref, _conanfile, _prefs = ref_conanfile_prefs
@@ -561,6 +733,7 @@ class CmdUpload(object):
         if files_to_upload or deleted:
             self._remote_manager.upload_recipe(ref, files_to_upload, deleted, remote, retry,
                                                retry_wait)
+            self._remote_checks.forget_packages(ref, remote)
             msg = "\rUploaded conan recipe '%s' to '%s': %s" % (str(ref), remote.name, remote.url)
             self._output.info(left_justify_message(msg))
         else:
@@ -610,13 +783,14 @@ class CmdUpload(object):
 
         logger.debug("UPLOAD: Time uploader upload_package: %f" % (time.time() - t1))
 
-        # Update the package metadata
-        checksums = calc_files_checksum(cache_files)
+        # Update the package metadata, the recorded checksums are kept if it wasn't compressed
+        checksums = calc_files_checksum(cache_files) if PACKAGE_TGZ_NAME in cache_files else None
         with pkg_layout.update_metadata() as metadata:
             cur_package_remote = metadata.packages[pref.id].remote
             if not cur_package_remote:
                 metadata.packages[pref.id].remote = p_remote.name
-            metadata.packages[pref.id].checksums = checksums
+            if checksums is not None:
+                metadata.packages[pref.id].checksums = checksums
 
         return pref
 
@@ -637,8 +811,11 @@ def compress_files(files, symlinks, name, dest_dir, output=None):
     t1 = time.time()
     # FIXME, better write to disk sequentially and not keep tgz contents in memory
     tgz_path = os.path.join(dest_dir, name)
-    with set_dirty_context_manager(tgz_path), open(tgz_path, "wb") as tgz_handle:
-        tgz = gzopen_without_timestamps(name, mode="w", fileobj=tgz_handle)
+    with span("compress %s" % name, "compress", dst=tgz_path), \
+            set_dirty_context_manager(tgz_path), open(tgz_path, "wb") as tgz_handle:
+        # Hash the compressed stream while writing, so the upload doesn't read it again
+        tgz_writer = HashingWriter(tgz_handle)
+        tgz = gzopen_without_timestamps(name, mode="w", fileobj=tgz_writer)
 
         for filename, dest in sorted(symlinks.items()):
             info = tarfile.TarInfo(name=filename)
@@ -663,6 +840,7 @@ def compress_files(files, symlinks, name, dest_dir, output=None):
                     with open(abs_path, 'rb') as file_handler:
                         tgz.addfile(tarinfo=info, fileobj=file_handler)
         tgz.close()
+    store_file_checksums(tgz_path, tgz_writer.checksums)
 
     duration = time.time() - t1
     log_compressed_files(files, duration, tgz_path)
@@ -10,13 +10,12 @@ from difflib import get_close_matches
 
 from conans import __version__ as client_version
 from conans.client.cmd.frogarian import cmd_frogarian
-from conans.client.cmd.uploader import UPLOAD_POLICY_FORCE, \
-    UPLOAD_POLICY_NO_OVERWRITE, UPLOAD_POLICY_NO_OVERWRITE_RECIPE, UPLOAD_POLICY_SKIP
 from conans.client.conan_api import Conan, default_manifest_folder, _make_abs_path, ProfileData
 from conans.client.conf.config_installer import is_config_install_scheduled
 from conans.client.conan_command_output import CommandOutputer
 from conans.client.output import Color
 from conans.client.printer import Printer
+from conans.client.tools.files import human_size
 from conans.errors import ConanException, ConanInvalidConfiguration, NoRemoteAvailable, \
     ConanMigrationError, ConanInvalidSystemRequirements
 from conans.model.ref import ConanFileReference, PackageReference, get_reference_fields, \
@@ -595,6 +594,9 @@ class Command(object):
         set_subparser = subparsers.add_parser('set', help='Set a value for a configuration item')
         init_subparser = subparsers.add_parser('init', help='Initializes Conan configuration files')
         list_subparser = subparsers.add_parser('list', help='List Conan configuration properties')
+        stats_subparser = subparsers.add_parser('download-stats',
+                                                help='Show the usage statistics of the download '
+                                                     'cache')
 
         get_subparser.add_argument("item", nargs="?", help="Item to print")
         home_subparser.add_argument("-j", "--json", default=None, action=OnceArgument,
@@ -623,6 +625,8 @@ class Command(object):
         set_subparser.add_argument("item", help="'item=value' to set")
         init_subparser.add_argument('-f', '--force', default=False, action='store_true',
                                     help='Overwrite existing Conan configuration files')
+        stats_subparser.add_argument("-j", "--json", default=None, action=OnceArgument,
+                                     help='json file path where the statistics will be written to')
 
         args = parser.parse_args(*args)
 
@@ -664,6 +668,22 @@ class Command(object):
             self._out.info("Supported Conan *experimental* global.conf and [conf] properties:")
             for key, description in BUILT_IN_CONFS.items():
                 self._out.writeln("{}: {}".format(key, description))
+        elif args.subcommand == "download-stats":
+            stats = self._conan.config_download_stats()
+            requests = stats["hits"] + stats["misses"]
+            hit_rate = 100.0 * stats["hits"] / requests if requests else 0
+            max_size = human_size(stats["max_size"]) if stats["max_size"] else "unlimited"
+            self._out.writeln("Download cache: %s" % stats["path"])
+            self._out.writeln("Files: %s (%s), max size: %s" % (stats["files"],
+                                                                human_size(stats["size"]),
+                                                                max_size))
+            self._out.writeln("Hits: %s, misses: %s, hit rate: %.1f%%"
+                              % (stats["hits"], stats["misses"], hit_rate))
+            self._out.writeln("Downloads saved: %s" % human_size(stats["bytes_saved"]))
+            self._out.writeln("Evicted files: %s" % stats["evictions"])
+            if args.json:
+                self._outputer.json_output(stats, args.json, os.getcwd())
+            return stats
 
     def info(self, *args):
         """
@@ -1121,6 +1141,42 @@ class Command(object):
                                   lockfile_out=args.lockfile_out,
                                   ignore_dirty=args.ignore_dirty)
 
+    def export_batch(self, *args):
+        """
+        Copies many recipes to your local cache, exporting them in parallel.
+
+        The recipes are loaded and exported in different processes, and the
+        state of the git repositories containing them is obtained only once.
+        Useful to export all the recipes of a repository.
+        """
+        parser = argparse.ArgumentParser(description=self.export_batch.__doc__,
+                                         prog="conan export-batch",
+                                         formatter_class=SmartFormatter)
+        parser.add_argument("paths", nargs="+", help="Paths to the folders containing the "
+                                                     "conanfile.py files, or to the files")
+        parser.add_argument("--user", action=OnceArgument,
+                            help="User of the exported recipes, if not declared in them")
+        parser.add_argument("--channel", action=OnceArgument,
+                            help="Channel of the exported recipes, if not declared in them")
+        parser.add_argument('-k', '-ks', '--keep-source', default=False, action='store_true',
+                            help=_KEEP_SOURCE_HELP)
+        parser.add_argument("--ignore-dirty", default=False, action='store_true',
+                            help='When using the "scm" feature with "auto" values, capture the'
+                                 ' revision and url even if there are uncommitted changes')
+        parser.add_argument("-j", "--jobs", type=int, action=OnceArgument,
+                            help="Number of recipes exported in parallel. Default: the number "
+                                 "of CPUs")
+
+        args = parser.parse_args(*args)
+        self._warn_python_version()
+        if any([args.user, args.channel]) and not all([args.user, args.channel]):
+            raise ConanException("Specify both --user and --channel, or none of them")
+
+        refs = self._conan.export_batch(paths=args.paths, user=args.user, channel=args.channel,
+                                        keep_source=args.keep_source,
+                                        ignore_dirty=args.ignore_dirty, jobs=args.jobs)
+        self._out.success("Exported %d recipes" % len(refs))
+
     def remove(self, *args):
         """
         Removes packages or binaries matching pattern from local cache or remote.
@@ -1458,6 +1514,8 @@ class Command(object):
         If no remote is specified, the first configured remote (by default conan-center, use
         'conan remote list' to list the remotes) will be used.
         """
+        from conans.client.cmd.uploader import UPLOAD_POLICY_FORCE, UPLOAD_POLICY_NO_OVERWRITE, \
+            UPLOAD_POLICY_NO_OVERWRITE_RECIPE, UPLOAD_POLICY_SKIP
         parser = argparse.ArgumentParser(description=self.upload.__doc__,
                                          prog="conan upload",
                                          formatter_class=SmartFormatter)
@@ -1559,6 +1617,57 @@ class Command(object):
             if args.json and info:
                 self._outputer.json_output(info, args.json, os.getcwd())
 
+    def promote(self, *args):
+        """
+        Copies recipes and binary packages from one remote to another.
+
+        The files are transferred as they are stored in the source remote, keeping the
+        revisions, without installing them in the local cache. Recipes and packages already
+        in the target remote with the same contents are skipped.
+        """
+        parser = argparse.ArgumentParser(description=self.promote.__doc__,
+                                         prog="conan promote",
+                                         formatter_class=SmartFormatter)
+        parser.add_argument('pattern_or_reference', help=_PATTERN_REF_OR_PREF_HELP)
+        parser.add_argument("source_remote", help='Remote to copy the packages from')
+        parser.add_argument("target_remote", help='Remote to copy the packages to')
+        parser.add_argument('-q', '--query', default=None, action=OnceArgument,
+                            help="Only promote packages matching a specific query. " + _QUERY_HELP)
+        parser.add_argument("--all", action='store_true', default=False,
+                            help='Promote both package recipes and packages')
+        parser.add_argument("--force", action='store_true', default=False,
+                            help='Transfer the files even if they are already in the target remote')
+        parser.add_argument('--retry', default=None, type=int, action=OnceArgument,
+                            help="In case of fail retries to upload again the specified times.")
+        parser.add_argument('--retry-wait', default=None, type=int, action=OnceArgument,
+                            help='Waits specified seconds before retry again')
+        parser.add_argument("--parallel", action='store_true', default=False,
+                            help='Transfer the packages in parallel using multiple threads. '
+                                 'The default number of launched threads is set to the value of '
+                                 'cpu_count, or to parallel_upload in conan.conf')
+        args = parser.parse_args(*args)
+
+        try:
+            pref = PackageReference.loads(args.pattern_or_reference, validate=True)
+        except ConanException:
+            reference = args.pattern_or_reference
+            package_id = None
+        else:
+            reference = repr(pref.ref)
+            package_id = "{}#{}".format(pref.id, pref.revision) if pref.revision else pref.id
+            if args.query:
+                raise ConanException("'--query' argument cannot be used together with "
+                                     "full reference")
+            if args.all:
+                raise ConanException("'--all' argument cannot be used together with full reference")
+
+        self._warn_python_version()
+        return self._conan.promote(pattern=reference, source_remote=args.source_remote,
+                                   target_remote=args.target_remote, package=package_id,
+                                   all_packages=args.all, query=args.query, force=args.force,
+                                   retry=args.retry, retry_wait=args.retry_wait,
+                                   parallel=args.parallel)
+
     def remote(self, *args):
         """
         Manages the remote list and the package recipes associated with a remote.
@@ -1925,6 +2034,43 @@ class Command(object):
                 self._out.writeln("    Path: %s" % v["path"])
                 self._out.writeln("    Layout: %s" % v["layout"])
 
+    def daemon(self, *args):
+        """
+        Manages a persistent Conan process that runs the commands of this Conan home.
+
+        While the daemon is running, the 'conan' commands forward their arguments, environment
+        and current folder to it, avoiding the startup and configuration loading of every
+        command. It runs one command at a time, the commands launched while it is busy run in
+        their own process. It cannot be used with the Conan installers.
+        """
+        parser = argparse.ArgumentParser(description=self.daemon.__doc__,
+                                         prog="conan daemon",
+                                         formatter_class=SmartFormatter)
+        subparsers = parser.add_subparsers(dest='subcommand', help='sub-command help')
+        subparsers.required = True
+        subparsers.add_parser('start', help='Start the daemon in the background')
+        subparsers.add_parser('stop', help='Stop the daemon')
+        subparsers.add_parser('status', help='Check if the daemon is running')
+        args = parser.parse_args(*args)
+
+        from conans.client.daemon import daemon_status, start_daemon, stop_daemon
+        cache_folder = self._conan.cache_folder
+        if args.subcommand == "start":
+            pid = start_daemon(cache_folder)
+            self._out.success("Conan daemon running (pid %s)" % pid)
+        elif args.subcommand == "stop":
+            pid = stop_daemon(cache_folder)
+            if pid is None:
+                self._out.info("Conan daemon is not running")
+            else:
+                self._out.success("Conan daemon stopped (pid %s)" % pid)
+        elif args.subcommand == "status":
+            pid = daemon_status(cache_folder)
+            if pid is None:
+                self._out.info("Conan daemon is not running")
+            else:
+                self._out.info("Conan daemon running (pid %s)" % pid)
+
     def frogarian(self, *args):
         """
         Conan The Frogarian
@@ -2070,11 +2216,13 @@ class Command(object):
         Prints a summary of all commands.
         """
         grps = [("Consumer commands", ("install", "config", "get", "info", "search")),
-                ("Creator commands", ("new", "create", "upload", "export", "export-pkg", "test")),
+                ("Creator commands", ("new", "create", "upload", "export", "export-pkg",
+                                      "export-batch", "test")),
                 ("Package development commands", ("source", "build", "package", "editable",
                                                   "workspace")),
-                ("Misc commands", ("profile", "remote", "user", "imports", "copy", "remove",
-                                   "alias", "download", "inspect", "help", "lock", "frogarian"))]
+                ("Misc commands", ("profile", "remote", "user", "imports", "copy", "promote",
+                                   "remove", "alias", "download", "inspect", "help", "lock",
+                                   "daemon", "frogarian"))]
 
         def check_all_commands_listed():
             """Keep updated the main directory, raise if don't"""
@@ -2122,8 +2270,8 @@ class Command(object):
         for m in inspect.getmembers(self, predicate=inspect.ismethod):
             method_name = m[0]
             if not method_name.startswith('_'):
-                if "export_pkg" == method_name:
-                    method_name = "export-pkg"
+                if method_name in ("export_pkg", "export_batch"):
+                    method_name = method_name.replace("_", "-")
                 method = m[1]
                 if method.__doc__ and not method.__doc__.startswith('HIDDEN'):
                     result[method_name] = method
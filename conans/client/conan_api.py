@@ -9,19 +9,13 @@ from six import StringIO
 import conans
 from conans import __version__ as client_version
 from conans.client.cache.cache import ClientCache
-from conans.client.cmd.build import cmd_build
-from conans.client.cmd.create import create
-from conans.client.cmd.download import download
 from conans.client.cmd.export import cmd_export, export_alias
-from conans.client.cmd.export_pkg import export_pkg
 from conans.client.cmd.profile import (cmd_profile_create, cmd_profile_delete_key, cmd_profile_get,
                                        cmd_profile_list, cmd_profile_update)
 from conans.client.cmd.search import Search
-from conans.client.cmd.test import install_build_and_test
-from conans.client.cmd.uploader import CmdUpload
 from conans.client.cmd.user import user_set, users_clean, users_list, token_present
-from conans.client.conanfile.package import run_package_method
 from conans.client.conf.required_version import check_required_conan_version
+from conans.client.downloaders.cached_file_downloader import CachedFileDownloader
 from conans.client.generators import GeneratorManager
 from conans.client.graph.graph import RECIPE_EDITABLE
 from conans.client.graph.graph_binaries import GraphBinariesAnalyzer
@@ -31,10 +25,7 @@ from conans.client.graph.proxy import ConanProxy
 from conans.client.graph.python_requires import ConanPythonRequire, PyRequireLoader
 from conans.client.graph.range_resolver import RangeResolver
 from conans.client.hook_manager import HookManager
-from conans.client.importer import run_imports, undo_imports
-from conans.client.installer import BinaryInstaller
 from conans.client.loader import ConanFileLoader
-from conans.client.manager import deps_install
 from conans.client.migrations import ClientMigrator
 from conans.client.output import ConanOutput, colorama_initialize
 from conans.client.profile_loader import profile_from_args, read_profile
@@ -42,12 +33,8 @@ from conans.client.recorder.action_recorder import ActionRecorder
 from conans.client.recorder.search_recorder import SearchRecorder
 from conans.client.recorder.upload_recoder import UploadRecorder
 from conans.client.remote_manager import RemoteManager
-from conans.client.remover import ConanRemover
 from conans.client.rest.auth_manager import ConanApiAuthManager
-from conans.client.rest.conan_requester import ConanRequester
-from conans.client.rest.rest_client import RestApiClientFactory
 from conans.client.runner import ConanRunner
-from conans.client.source import config_source_local
 from conans.client.tools.env import environment_append
 from conans.client.userio import UserIO
 from conans.errors import (ConanException, RecipeNotFoundException,
@@ -55,18 +42,16 @@ from conans.errors import (ConanException, RecipeNotFoundException,
 from conans.model.editable_layout import get_editable_abs_path
 from conans.model.graph_info import GraphInfo, GRAPH_INFO_FILE
 from conans.model.graph_lock import GraphLockFile, LOCKFILE, GraphLock
-from conans.model.lock_bundle import LockBundle
 from conans.model.ref import ConanFileReference, PackageReference, check_valid_ref
 from conans.model.version import Version
-from conans.model.workspace import Workspace
 from conans.paths import BUILD_INFO, CONANINFO, get_conan_user_home
 from conans.paths.package_layouts.package_cache_layout import PackageCacheLayout
 from conans.search.search import search_recipes
-from conans.tools import set_global_instances
 from conans.util.conan_v2_mode import conan_v2_error
 from conans.util.files import exception_message_safe, mkdir, save_files, load, save
 from conans.util.log import configure_logger
-from conans.util.tracer import log_command, log_exception
+from conans.util.profiler import profile_command
+from conans.util.tracer import flush_log, log_command, log_exception
 
 default_manifest_folder = '.conan_manifests'
 
@@ -90,7 +75,11 @@ def api_method(f):
             api.create_app(quiet_output=quiet_output)
             log_command(f.__name__, kwargs)
             with environment_append(api.app.cache.config.env_vars):
-                return f(api, *args, **kwargs)
+                with profile_command(f.__name__):
+                    result = f(api, *args, **kwargs)
+            # The folders removed by the command were moved to the trash
+            api.app.cache.trash.empty_in_background()
+            return result
         except Exception as exc:
             if quiet_output:
                 old_output.write(quiet_output._stream.getvalue())
@@ -102,6 +91,9 @@ def api_method(f):
                 pass
             raise
         finally:
+            if api.app is not None and api.app.requester.metrics is not None:
+                api.app.requester.metrics.report(api.app.out)
+            flush_log()
             if old_curdir:
                 os.chdir(old_curdir)
     return wrapper
@@ -176,8 +168,13 @@ class ConanApp(object):
         conans.util.log.logger.debug("INIT: Using config '%s'" % self.cache.conan_conf_path)
 
         self.hook_manager = HookManager(self.cache.hooks_path, self.config.hooks, self.out)
+        # requests is only imported by the commands that need a ConanApp
+        from conans.client.rest.conan_requester import ConanRequester
+        from conans.client.rest.rest_client import RestApiClientFactory
         # Wraps an http_requester to inject proxies, certs, etc
         self.requester = ConanRequester(self.config, http_requester)
+        if self.requester.metrics is not None:
+            self.requester.metrics.set_remotes(self.cache.registry.load_remotes())
         # To handle remote connections
         artifacts_properties = self.cache.read_artifacts_properties()
         rest_client_factory = RestApiClientFactory(self.out, self.requester, self.config,
@@ -188,6 +185,7 @@ class ConanApp(object):
         self.remote_manager = RemoteManager(self.cache, auth_manager, self.out, self.hook_manager)
 
         # Adjust global tool variables
+        from conans.tools import set_global_instances
         set_global_instances(self.out, self.requester, self.config)
 
         self.runner = runner or ConanRunner(self.config.print_commands_to_output,
@@ -202,7 +200,8 @@ class ConanApp(object):
                                                   self.generator_manager)
         self.pyreq_loader = PyRequireLoader(self.proxy, self.range_resolver)
         self.loader = ConanFileLoader(self.runner, self.out, self.python_requires,
-                                      self.generator_manager, self.pyreq_loader, self.requester)
+                                      self.generator_manager, self.pyreq_loader, self.requester,
+                                      bytecode_folder=self.cache.bytecode_folder)
 
         self.binaries_analyzer = GraphBinariesAnalyzer(self.cache, self.out, self.remote_manager)
         self.graph_manager = GraphManager(self.out, self.cache, self.remote_manager, self.loader,
@@ -317,6 +316,7 @@ class ConanAPIV1(object):
     def test(self, path, reference, profile_names=None, settings=None, options=None, env=None,
              remote_name=None, update=False, build_modes=None, cwd=None, test_build_folder=None,
              lockfile=None, profile_build=None, conf=None):
+        from conans.client.cmd.test import install_build_and_test
 
         profile_host = ProfileData(profiles=profile_names, settings=settings, options=options,
                                    env=env, conf=conf)
@@ -350,6 +350,7 @@ class ConanAPIV1(object):
                                     string - test_folder path
                                     False  - disabling tests
         """
+        from conans.client.cmd.create import create
 
         profile_host = ProfileData(profiles=profile_names, settings=settings, options=options,
                                    env=env, conf=conf)
@@ -408,6 +409,7 @@ class ConanAPIV1(object):
                    options=None, env=None, force=False, user=None, version=None, cwd=None,
                    lockfile=None, lockfile_out=None, ignore_dirty=False, profile_build=None,
                    conf=None):
+        from conans.client.cmd.export_pkg import export_pkg
         profile_host = ProfileData(profiles=profile_names, settings=settings, options=options,
                                    env=env, conf=conf)
         remotes = self.app.load_remotes()
@@ -467,6 +469,7 @@ class ConanAPIV1(object):
 
     @api_method
     def download(self, reference, remote_name=None, packages=None, recipe=False):
+        from conans.client.cmd.download import download
         if packages and recipe:
             raise ConanException("recipe parameter cannot be used together with packages")
         # Install packages without settings (fixed ids or all)
@@ -492,6 +495,8 @@ class ConanAPIV1(object):
                           remote_name=None, build=None, profile_name=None,
                           update=False, cwd=None, install_folder=None, profile_build=None,
                           conf=None):
+        from conans.client.installer import BinaryInstaller
+        from conans.model.workspace import Workspace
         profile_host = ProfileData(profiles=profile_name, settings=settings, options=options,
                                    env=env, conf=conf)
         cwd = cwd or os.getcwd()
@@ -539,6 +544,7 @@ class ConanAPIV1(object):
                           lockfile=None, lockfile_out=None, profile_build=None,
                           lockfile_node_id=None, is_build_require=False, conf=None,
                           require_overrides=None):
+        from conans.client.manager import deps_install
         profile_host = ProfileData(profiles=profile_names, settings=settings, options=options,
                                    env=env, conf=conf)
         recorder = ActionRecorder()
@@ -586,6 +592,7 @@ class ConanAPIV1(object):
                 output_folder=None, cwd=None,
                 lockfile=None, lockfile_out=None, profile_build=None, conf=None,
                 require_overrides=None):
+        from conans.client.manager import deps_install
         profile_host = ProfileData(profiles=profile_names, settings=settings, options=options,
                                    env=env, conf=conf)
         recorder = ActionRecorder()
@@ -622,7 +629,8 @@ class ConanAPIV1(object):
                          no_imports=no_imports,
                          recorder=recorder,
                          require_overrides=require_overrides,
-                         conanfile_path=os.path.dirname(conanfile_path))
+                         conanfile_path=os.path.dirname(conanfile_path),
+                         fingerprint=not lockfile_out)
 
             if lockfile_out:
                 lockfile_out = _make_abs_path(lockfile_out, cwd)
@@ -681,6 +689,17 @@ class ConanAPIV1(object):
     def config_home(self):
         return self.cache_folder
 
+    @api_method
+    def config_download_stats(self):
+        download_cache = self.app.config.download_cache
+        if not download_cache:
+            raise ConanException("There is no download cache, define it in "
+                                 "'storage.download_cache'")
+        max_size = self.app.config.download_cache_max_size
+        result = CachedFileDownloader(download_cache, None, max_size=max_size).stats()
+        result["path"] = download_cache
+        return result
+
     @api_method
     def config_init(self, force=False):
         if force:
@@ -767,6 +786,7 @@ class ConanAPIV1(object):
     def build(self, conanfile_path, source_folder=None, package_folder=None, build_folder=None,
               install_folder=None, should_configure=True, should_build=True, should_install=True,
               should_test=True, cwd=None):
+        from conans.client.cmd.build import cmd_build
         self.app.load_remotes()
         cwd = cwd or os.getcwd()
         conanfile_path = _get_conanfile_path(conanfile_path, cwd, py=True)
@@ -788,6 +808,7 @@ class ConanAPIV1(object):
     @api_method
     def package(self, path, build_folder, package_folder, source_folder=None, install_folder=None,
                 cwd=None):
+        from conans.client.conanfile.package import run_package_method
         self.app.load_remotes()
 
         cwd = cwd or os.getcwd()
@@ -817,6 +838,7 @@ class ConanAPIV1(object):
 
     @api_method
     def source(self, path, source_folder=None, info_folder=None, cwd=None):
+        from conans.client.source import config_source_local
         self.app.load_remotes()
 
         cwd = cwd or os.getcwd()
@@ -846,6 +868,7 @@ class ConanAPIV1(object):
         :param cwd: Current working directory
         :return: None
         """
+        from conans.client.importer import run_imports
         cwd = cwd or os.getcwd()
         info_folder = _make_abs_path(info_folder, cwd)
         dest = _make_abs_path(dest, cwd)
@@ -860,6 +883,7 @@ class ConanAPIV1(object):
 
     @api_method
     def imports_undo(self, manifest_path):
+        from conans.client.importer import undo_imports
         cwd = os.getcwd()
         manifest_path = _make_abs_path(manifest_path, cwd)
         undo_imports(manifest_path, self.app.out)
@@ -883,9 +907,19 @@ class ConanAPIV1(object):
             lockfile_out = _make_abs_path(lockfile_out, cwd)
             graph_lock_file.save(lockfile_out)
 
+    @api_method
+    def export_batch(self, paths, user=None, channel=None, keep_source=False, cwd=None,
+                     ignore_dirty=False, jobs=None):
+        from conans.client.cmd.export_batch import cmd_export_batch
+        conanfile_paths = [_get_conanfile_path(path, cwd, py=True) for path in paths]
+        self.app.load_remotes()
+        return cmd_export_batch(self.app, conanfile_paths, user, channel, keep_source,
+                                ignore_dirty=ignore_dirty, jobs=jobs)
+
     @api_method
     def remove(self, pattern, query=None, packages=None, builds=None, src=False, force=False,
                remote_name=None, outdated=False):
+        from conans.client.remover import ConanRemover
         remotes = self.app.cache.registry.load_remotes()
         remover = ConanRemover(self.app.cache, self.app.remote_manager, self.app.user_io, remotes)
         remover.remove(pattern, remote_name, src, builds, packages, force=force,
@@ -1002,6 +1036,7 @@ class ConanAPIV1(object):
                parallel_upload=False):
         """ Uploads a package recipe and the generated binary packages to a specified remote
         """
+        from conans.client.cmd.uploader import CmdUpload
         upload_recorder = UploadRecorder()
         uploader = CmdUpload(self.app.cache, self.app.user_io, self.app.remote_manager,
                              self.app.loader, self.app.hook_manager)
@@ -1016,6 +1051,18 @@ class ConanAPIV1(object):
             exc.info = upload_recorder.get_info()
             raise
 
+    @api_method
+    def promote(self, pattern, source_remote, target_remote, package=None, all_packages=False,
+                query=None, force=False, retry=None, retry_wait=None, parallel=False):
+        """ Copies recipes and binary packages from one remote to another, without using the
+        local cache
+        """
+        from conans.client.cmd.promote import CmdPromote
+        remotes = self.app.load_remotes()
+        promoter = CmdPromote(self.app.cache, self.app.user_io, self.app.remote_manager)
+        promoter.promote(pattern, remotes[source_remote], remotes[target_remote], package,
+                         all_packages, query, force, retry, retry_wait, parallel)
+
     @api_method
     def remote_list(self):
         return list(self.app.cache.registry.load_remotes().all_values())
@@ -1381,6 +1428,7 @@ class ConanAPIV1(object):
     def lock_install(self, lockfile, remote_name=None, build=None,
                      generators=None, install_folder=None, cwd=None,
                      lockfile_out=None, recipes=None):
+        from conans.client.manager import deps_install
         lockfile = _make_abs_path(lockfile, cwd) if lockfile else None
         graph_info = get_graph_info(None, None, cwd, None,
                                     self.app.cache, self.app.out, lockfile=lockfile)
@@ -1419,6 +1467,7 @@ class ConanAPIV1(object):
 
     @api_method
     def lock_bundle_create(self, lockfiles, lockfile_out, cwd=None):
+        from conans.model.lock_bundle import LockBundle
         cwd = cwd or os.getcwd()
         result = LockBundle.create(lockfiles, self.app.cache.config.revisions_enabled, cwd)
         lockfile_out = _make_abs_path(lockfile_out, cwd)
@@ -1426,6 +1475,7 @@ class ConanAPIV1(object):
 
     @api_method
     def lock_bundle_build_order(self, lockfile, cwd=None):
+        from conans.model.lock_bundle import LockBundle
         cwd = cwd or os.getcwd()
         lockfile = _make_abs_path(lockfile, cwd)
         lock_bundle = LockBundle()
@@ -1435,6 +1485,7 @@ class ConanAPIV1(object):
 
     @api_method
     def lock_bundle_update(self, lock_bundle_path, cwd=None):
+        from conans.model.lock_bundle import LockBundle
         cwd = cwd or os.getcwd()
         lock_bundle_path = _make_abs_path(lock_bundle_path, cwd)
         revisions_enabled = self.app.cache.config.revisions_enabled
@@ -1442,6 +1493,7 @@ class ConanAPIV1(object):
 
     @api_method
     def lock_bundle_clean_modified(self, lock_bundle_path, cwd=None):
+        from conans.model.lock_bundle import LockBundle
         cwd = cwd or os.getcwd()
         lock_bundle_path = _make_abs_path(lock_bundle_path, cwd)
         revisions_enabled = self.app.cache.config.revisions_enabled
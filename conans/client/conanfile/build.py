@@ -3,6 +3,7 @@ import os
 from conans.errors import conanfile_exception_formatter
 from conans.model.conan_file import get_env_context_manager
 from conans.util.log import logger
+from conans.util.profiler import span
 
 
 def run_build_method(conanfile, hook_manager, **hook_kwargs):
@@ -13,6 +14,7 @@ def run_build_method(conanfile, hook_manager, **hook_kwargs):
     with get_env_context_manager(conanfile):
         conanfile.output.highlight("Calling build()")
         with conanfile_exception_formatter(str(conanfile), "build"):
-            conanfile.build()
+            with span("build %s" % conanfile.display_name, "build"):
+                conanfile.build()
 
     hook_manager.execute("post_build", conanfile=conanfile, **hook_kwargs)
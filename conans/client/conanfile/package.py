@@ -4,14 +4,16 @@ import shutil
 from conans.client.file_copier import FileCopier
 from conans.client.output import ScopedOutput
 from conans.client.packager import report_files_from_manifest
+from conans.client.tools import chdir
 from conans.errors import ConanException, conanfile_exception_formatter
 from conans.model.conan_file import get_env_context_manager
 from conans.model.manifest import FileTreeManifest
 from conans.paths import CONANINFO
-from conans.tools import chdir
 from conans.util.conan_v2_mode import conan_v2_property
+from conans.util.file_selection import directory_snapshots
 from conans.util.files import save, mkdir
 from conans.util.log import logger
+from conans.util.profiler import span
 
 
 def run_package_method(conanfile, package_id, hook_manager, conanfile_path, ref, copy_info=False):
@@ -32,7 +34,9 @@ def run_package_method(conanfile, package_id, hook_manager, conanfile_path, ref,
     output.info("Package folder %s" % conanfile.package_folder)
 
     with get_env_context_manager(conanfile):
-        return _call_package(conanfile, package_id, hook_manager, conanfile_path, ref, copy_info)
+        with span("package %s" % conanfile.display_name, "package"):
+            return _call_package(conanfile, package_id, hook_manager, conanfile_path, ref,
+                                 copy_info)
 
 
 def _call_package(conanfile, package_id, hook_manager, conanfile_path, ref, copy_info):
@@ -44,12 +48,14 @@ def _call_package(conanfile, package_id, hook_manager, conanfile_path, ref, copy
     output.highlight("Calling package()")
     folders = [conanfile.source_folder, conanfile.build_folder] \
         if conanfile.source_folder != conanfile.build_folder else [conanfile.build_folder]
-    conanfile.copy = FileCopier(folders, conanfile.package_folder)
-    with conanfile_exception_formatter(str(conanfile), "package"):
-        with chdir(conanfile.build_folder):
-            with conan_v2_property(conanfile, 'info',
-                                   "'self.info' access in package() method is deprecated"):
-                conanfile.package()
+    # All the copies of package() share the listings of the folders, walked only once
+    with directory_snapshots():
+        conanfile.copy = FileCopier(folders, conanfile.package_folder)
+        with conanfile_exception_formatter(str(conanfile), "package"):
+            with chdir(conanfile.build_folder):
+                with conan_v2_property(conanfile, 'info',
+                                       "'self.info' access in package() method is deprecated"):
+                    conanfile.package()
 
     hook_manager.execute("post_package", conanfile=conanfile, conanfile_path=conanfile_path,
                          reference=ref, package_id=package_id)
@@ -2,7 +2,6 @@ import logging
 import os
 import textwrap
 
-from jinja2 import Template
 from six.moves.configparser import ConfigParser, NoSectionError
 
 from conans.errors import ConanException
@@ -12,7 +11,7 @@ from conans.util.dates import timedelta_from_text
 from conans.util.env_reader import get_env
 from conans.util.files import load
 
-_t_default_settings_yml = Template(textwrap.dedent("""
+_t_default_settings_yml = textwrap.dedent("""
     # Only for cross building, 'os_build/arch_build' is the system that runs Conan
     os_build: [Windows, WindowsStore, Linux, Macos, FreeBSD, SunOS, AIX, VxWorks]
     arch_build: [x86, x86_64, ppc32be, ppc32, ppc64le, ppc64, armv5el, armv5hf, armv6, armv7, armv7hf, armv7s, armv7k, armv8, armv8_32, armv8.3, sparc, sparcv9, mips, mips64, avr, s390, s390x, sh4le, e2k-v2, e2k-v3, e2k-v4, e2k-v5, e2k-v6, e2k-v7]
@@ -168,19 +167,23 @@ _t_default_settings_yml = Template(textwrap.dedent("""
 
     cppstd: [None, 98, gnu98, 11, gnu11, 14, gnu14, 17, gnu17, 20, gnu20, 23, gnu23]  # Deprecated, use compiler.cppstd
 
-    """))
+    """)
 
 
 def get_default_settings_yml():
-    return _t_default_settings_yml.render()
+    from jinja2 import Template
+    return Template(_t_default_settings_yml).render()
 
 
-_t_default_client_conf = Template(textwrap.dedent("""
+_t_default_client_conf = textwrap.dedent("""
     [log]
     run_to_output = True        # environment CONAN_LOG_RUN_TO_OUTPUT
     run_to_file = False         # environment CONAN_LOG_RUN_TO_FILE
     level = critical            # environment CONAN_LOGGING_LEVEL
     # trace_file =              # environment CONAN_TRACE_FILE
+    # perf_trace_file =         # environment CONAN_PERF_TRACE_FILE
+    # http_metrics = False      # environment CONAN_HTTP_METRICS
+    # http_metrics_file =       # environment CONAN_HTTP_METRICS_FILE
     print_run_commands = False  # environment CONAN_PRINT_RUN_COMMANDS
 
     [general]
@@ -197,6 +200,7 @@ _t_default_client_conf = Template(textwrap.dedent("""
     # error_on_override = False           # environment CONAN_ERROR_ON_OVERRIDE
     # bash_path = ""                      # environment CONAN_BASH_PATH (only windows)
     # read_only_cache = True              # environment CONAN_READ_ONLY_CACHE
+    # hardlink_imports = False            # environment CONAN_HARDLINK_IMPORTS (only with read_only_cache)
     # cache_no_locks = True               # environment CONAN_CACHE_NO_LOCKS
     # user_home_short = your_path         # environment CONAN_USER_HOME_SHORT
     # use_always_short_paths = False      # environment CONAN_USE_ALWAYS_SHORT_PATHS
@@ -257,11 +261,12 @@ _t_default_client_conf = Template(textwrap.dedent("""
     [hooks]    # environment CONAN_HOOKS
     attribute_checker
 
-    """))
+    """)
 
 
 def get_default_client_conf(force_v1=False):
-    return _t_default_client_conf.render(default_profile=DEFAULT_PROFILE_NAME)
+    from jinja2 import Template
+    return Template(_t_default_client_conf).render(default_profile=DEFAULT_PROFILE_NAME)
 
 
 class ConanClientConfigParser(ConfigParser, object):
@@ -276,6 +281,9 @@ class ConanClientConfigParser(ConfigParser, object):
             ("CONAN_LOG_RUN_TO_FILE", "run_to_file", False),
             ("CONAN_LOGGING_LEVEL", "level", logging.CRITICAL),
             ("CONAN_TRACE_FILE", "trace_file", None),
+            ("CONAN_PERF_TRACE_FILE", "perf_trace_file", None),
+            ("CONAN_HTTP_METRICS", "http_metrics", False),
+            ("CONAN_HTTP_METRICS_FILE", "http_metrics_file", None),
             ("CONAN_PRINT_RUN_COMMANDS", "print_run_commands", False),
         ],
         "general": [
@@ -291,6 +299,7 @@ class ConanClientConfigParser(ConfigParser, object):
             ("CONAN_VS_INSTALLATION_PREFERENCE", "vs_installation_preference", None),
             ("CONAN_CPU_COUNT", "cpu_count", None),
             ("CONAN_READ_ONLY_CACHE", "read_only_cache", None),
+            ("CONAN_HARDLINK_IMPORTS", "hardlink_imports", None),
             ("CONAN_USER_HOME_SHORT", "user_home_short", None),
             ("CONAN_USE_ALWAYS_SHORT_PATHS", "use_always_short_paths", None),
             ("CONAN_VERBOSE_TRACEBACK", "verbose_traceback", None),
@@ -487,6 +496,44 @@ class ConanClientConfigParser(ConfigParser, object):
         except ValueError:
             raise ConanException("Specify a numeric parameter for 'parallel_download'")
 
+    @property
+    def parallel_upload(self):
+        """ number of threads uploading files with 'conan upload --parallel', by default the
+        number of cpus
+        """
+        try:
+            parallel = self.get_item("general.parallel_upload")
+        except ConanException:
+            return None
+
+        try:
+            parallel = int(parallel) if parallel is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'parallel_upload'")
+        if parallel is not None and parallel < 1:
+            raise ConanException("Specify a number of threads greater than 0 for "
+                                 "'parallel_upload'")
+        return parallel
+
+    @property
+    def parallel_upload_checks(self):
+        """ number of concurrent queries to the remote to check what already exists before
+        uploading
+        """
+        try:
+            parallel = self.get_item("general.parallel_upload_checks")
+        except ConanException:
+            return 8
+
+        try:
+            parallel = int(parallel)
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'parallel_upload_checks'")
+        if parallel < 1:
+            raise ConanException("Specify a number of queries greater than 0 for "
+                                 "'parallel_upload_checks'")
+        return parallel
+
     @property
     def download_cache(self):
         try:
@@ -495,6 +542,21 @@ class ConanClientConfigParser(ConfigParser, object):
         except ConanException:
             return None
 
+    @property
+    def download_cache_max_size(self):
+        """ in bytes, it is defined in MB
+        """
+        try:
+            max_size = self.get_item("storage.download_cache_max_size")
+        except ConanException:
+            return None
+
+        try:
+            return int(max_size) * 1024 * 1024 if max_size is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter (MB) for "
+                                 "'download_cache_max_size'")
+
     @property
     def scm_to_conandata(self):
         try:
@@ -735,6 +797,29 @@ class ConanClientConfigParser(ConfigParser, object):
         except ConanException:
             return False
 
+    @property
+    def http_metrics(self):
+        try:
+            http_metrics = get_env("CONAN_HTTP_METRICS")
+            if http_metrics is None:
+                http_metrics = self.get_item("log.http_metrics")
+            return http_metrics.lower() in ("1", "true")
+        except ConanException:
+            return False
+
+    @property
+    def http_metrics_file(self):
+        try:
+            http_metrics_file = get_env("CONAN_HTTP_METRICS_FILE")
+            if http_metrics_file is None:
+                http_metrics_file = unquote(self.get_item("log.http_metrics_file"))
+        except ConanException:
+            return None
+        if http_metrics_file and not os.path.isabs(http_metrics_file):
+            raise ConanException("Bad CONAN_HTTP_METRICS_FILE value. The specified "
+                                 "path has to be an absolute path to a file.")
+        return http_metrics_file or None
+
     @property
     def log_run_to_output(self):
         try:
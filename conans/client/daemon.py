@@ -0,0 +1,435 @@
+""" Persistent Conan client process, serving commands over a Unix socket in the Conan home.
+
+The thin client (conans.conan.run) forwards the command line, the current folder, the
+environment and its standard file descriptors to the daemon, which runs the command in a
+process that keeps warm the imported modules, the parsed configuration files, the recipe
+classes and the HTTP connection pools. Everything is invalidated when the files change in the
+cache, so the result of a command is the same as running it in a new process.
+
+The daemon runs one command at a time, as the current folder, the environment and the standard
+streams are process wide. While it is busy, the other clients run their commands by themselves.
+Interrupting a client (Ctrl+C or SIGTERM) aborts its command in the daemon, with the processes
+it launched. Only the user owning the daemon can connect to its socket.
+
+This module is imported by the thin client in every command, keep its imports light.
+"""
+import array
+import json
+import os
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+from contextlib import closing
+
+import conans
+from conans import __version__ as client_version
+from conans.cli.exit_codes import ERROR_SIGTERM, USER_CTRL_C
+from conans.errors import ConanException
+from conans.util.files import load, mkdir
+
+DAEMON_SOCKET = "daemon.sock"
+DAEMON_LOG = "daemon.log"
+_STD_FDS = (0, 1, 2)
+_CANCEL_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+_START_TIMEOUT = 60  # seconds
+
+
+def daemon_socket_path(cache_folder):
+    return os.path.join(cache_folder, DAEMON_SOCKET)
+
+
+def _send(sock, data, fds=None):
+    message = (json.dumps(data) + "\n").encode("utf-8")
+    if fds:
+        fds_data = array.array("i", fds).tobytes()
+        sock.sendmsg([message], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, fds_data)])
+    else:
+        sock.sendall(message)
+
+
+def _receive(sock):
+    """ reads a message terminated by a newline, returns (data, received file descriptors)
+    or (None, []) if the connection was closed before receiving it
+    """
+    fds = array.array("i")
+    chunks = []
+    while True:
+        chunk, ancdata, _, _ = sock.recvmsg(4096, socket.CMSG_LEN(len(_STD_FDS) * fds.itemsize))
+        for level, kind, fds_data in ancdata:
+            if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+                fds.frombytes(fds_data[:len(fds_data) - (len(fds_data) % fds.itemsize)])
+        if not chunk:
+            return None, list(fds)
+        chunks.append(chunk)
+        if chunk.endswith(b"\n"):
+            return json.loads(b"".join(chunks).decode("utf-8")), list(fds)
+
+
+def _connect(cache_folder):
+    """ socket connected to the daemon serving this cache, None if there is no daemon running
+    """
+    socket_path = daemon_socket_path(cache_folder)
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except (socket.error, OSError):  # Stale socket of a daemon that is not running anymore
+        sock.close()
+        return None
+    return sock
+
+
+def _request(cache_folder, data, fds=None):
+    sock = _connect(cache_folder)
+    if sock is None:
+        return None
+    with closing(sock):
+        try:
+            _send(sock, data, fds)
+            response, _ = _receive(sock)
+        except (socket.error, OSError):  # The daemon is stopping
+            return None
+    return response
+
+
+def _interrupted_exit(signum):
+    """ the exit code of a command aborted by the signal, as the conan entry point does
+    """
+    if signum == signal.SIGINT:
+        print("You pressed Ctrl+C!")
+        return USER_CTRL_C
+    print("Received SIGTERM!")
+    return ERROR_SIGTERM
+
+
+def forward(cache_folder, args):
+    """ runs the command in the daemon serving this cache, with the standard input and output
+    of this process. Returns the exit code, or None if there is no daemon to run it, and then
+    it has to be run by this process. The SIGINT and SIGTERM received meanwhile abort the
+    command in the daemon
+    """
+    try:
+        cwd = os.getcwd()
+    except EnvironmentError:  # Let the local command report it
+        return None
+    sock = _connect(cache_folder)
+    if sock is None:
+        return None
+    command_id = os.urandom(16).hex()
+    interrupted = []
+
+    def cancel(signum, _):
+        if not interrupted:  # Also if the daemon didn't receive the command yet
+            _request(cache_folder, {"cancel": command_id, "signal": signum})
+        interrupted.append(signum)
+
+    handlers = {}
+    if threading.current_thread() is threading.main_thread():
+        handlers = {signum: signal.signal(signum, cancel) for signum in _CANCEL_SIGNALS}
+    try:
+        with closing(sock):
+            try:
+                _send(sock, {"version": client_version, "args": args, "cwd": cwd,
+                             "env": dict(os.environ), "id": command_id}, _STD_FDS)
+            except (socket.error, OSError):  # The daemon is stopping
+                return None
+            try:
+                response, _ = _receive(sock)
+            except (socket.error, OSError):
+                response = None
+    finally:
+        for signum, handler in handlers.items():
+            signal.signal(signum, handler)
+    if response is None:
+        sys.stderr.write("ERROR: Connection lost with the Conan daemon\n")
+        return 1
+    if interrupted and response.get("exit") is None:  # Not to be run by this process either
+        return _interrupted_exit(interrupted[0])
+    return response.get("exit")
+
+
+def daemon_status(cache_folder):
+    """ pid of the daemon serving this cache, None if not running
+    """
+    response = _request(cache_folder, {"status": True})
+    return response.get("pid") if response else None
+
+
+def start_daemon(cache_folder):
+    """ launches a daemon for this cache in the background and waits until it is serving. Its
+    errors are written to the 'daemon.log' file of the cache
+    """
+    if not hasattr(socket, "AF_UNIX") or not hasattr(socket.socket, "sendmsg"):
+        raise ConanException("The Conan daemon is not supported in this platform")
+    if getattr(sys, "frozen", False):
+        raise ConanException("The Conan daemon is not supported by the Conan installers")
+    pid = daemon_status(cache_folder)
+    if pid is not None:
+        return pid
+    mkdir(cache_folder)
+    log_path = os.path.join(cache_folder, DAEMON_LOG)
+    # The daemon imports this Conan, wherever the current folder of the client is
+    env = dict(os.environ)
+    conans_root = os.path.dirname(os.path.dirname(os.path.abspath(conans.__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (conans_root, env.get("PYTHONPATH")) if p)
+    with open(os.devnull, "r+") as devnull, open(log_path, "w") as log:
+        process = subprocess.Popen([sys.executable, "-m", "conans.client.daemon", cache_folder],
+                                   stdin=devnull, stdout=log, stderr=log, close_fds=True,
+                                   start_new_session=True, cwd=cache_folder, env=env)
+    deadline = time.time() + _START_TIMEOUT
+    while time.time() < deadline:
+        pid = daemon_status(cache_folder)
+        if pid is not None:
+            return pid
+        if process.poll() is not None:
+            raise ConanException("The Conan daemon failed to start (%s):\n%s"
+                                 % (log_path, load(log_path)))
+        time.sleep(0.05)
+    raise ConanException("Timeout waiting for the Conan daemon to start, check %s" % log_path)
+
+
+def stop_daemon(cache_folder):
+    """ stops the daemon serving this cache, returns its pid, or None if it was not running
+    """
+    response = _request(cache_folder, {"stop": True})
+    return response.get("pid") if response else None
+
+
+def _peer_uid(connection):
+    """ the user of the process connected to the socket, None if it cannot be known (then the
+    permissions of the socket file protect it)
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED,
+                                        struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", credentials)
+    return uid
+
+
+class ConanDaemon(object):
+    """ Runs the commands forwarded by the thin clients in the main thread, one at a time, as
+    the current folder, environment and standard streams are process wide. The connections are
+    accepted by another thread, answering the status and cancel requests, and the commands
+    received while busy, that the clients run by themselves.
+    """
+
+    def __init__(self, cache_folder):
+        self._cache_folder = cache_folder
+        self._socket_path = daemon_socket_path(cache_folder)
+        self._conan_api = None
+        self._conan_conf_key = None
+        self._commands = None  # Queue of (connection, request, fds) to run, None to stop
+        self._busy = threading.Lock()
+        self._running = None  # id of the command running
+        self._in_command = False
+        self._cancelled = {}  # {command id: signal}, also for commands not received yet
+
+    def _bind(self):
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if os.path.exists(self._socket_path):
+            os.remove(self._socket_path)
+        # Only the owner can connect, the socket is never accessible to others
+        old_umask = os.umask(0o177)
+        try:
+            mkdir(self._cache_folder)
+            server.bind(self._socket_path)
+            os.chmod(self._socket_path, 0o600)
+        except (socket.error, OSError) as e:
+            server.close()
+            raise ConanException("Cannot start the Conan daemon at %s: %s"
+                                 % (self._socket_path, str(e)))
+        finally:
+            os.umask(old_umask)
+        return server
+
+    def serve(self):
+        import queue
+        server = self._bind()
+        self._commands = queue.Queue()
+        for signum in _CANCEL_SIGNALS:
+            signal.signal(signum, self._signal_handler)
+        try:
+            server.listen(16)
+            listener = threading.Thread(target=self._listen, args=(server, ), daemon=True)
+            listener.start()
+            while True:
+                command = self._commands.get()
+                if command is None:
+                    break
+                self._run_connection(*command)
+        finally:
+            server.close()
+            if os.path.exists(self._socket_path):
+                os.remove(self._socket_path)
+
+    def _signal_handler(self, signum, _):
+        if self._in_command:  # The client was interrupted, abort its command
+            sys.exit(_interrupted_exit(signum))
+        if signum == signal.SIGTERM and self._running is None:
+            sys.exit(0)
+
+    def _listen(self, server):
+        while True:
+            try:
+                connection, _ = server.accept()
+            except (socket.error, OSError):  # Closed, the daemon is stopping
+                return
+            threading.Thread(target=self._handle, args=(connection, ), daemon=True).start()
+
+    def _handle(self, connection):
+        fds = []
+        try:
+            uid = _peer_uid(connection)
+            if uid is not None and uid != os.getuid():
+                connection.close()
+                return
+            request, fds = _receive(connection)
+            if request is None:
+                pass
+            elif request.get("stop"):
+                # New clients won't connect while this one is informed
+                os.remove(self._socket_path)
+                _send(connection, {"pid": os.getpid()})
+                self._commands.put(None)
+            elif request.get("status"):
+                _send(connection, {"pid": os.getpid()})
+            elif request.get("cancel"):
+                self._cancel(request["cancel"], request.get("signal"))
+                _send(connection, {"pid": os.getpid()})
+            elif request.get("version") != client_version or len(fds) != len(_STD_FDS):
+                # The client will run the command by itself
+                _send(connection, {"exit": None})
+            elif not self._busy.acquire(False):
+                # Running the command of another client, this one will run it by itself
+                _send(connection, {"exit": None})
+            else:
+                self._running = request.get("id")
+                self._commands.put((connection, request, fds))
+                return  # The connection and fds are closed when the command finishes
+        except (socket.error, OSError):  # The client went away
+            pass
+        for fd in fds:
+            os.close(fd)
+        connection.close()
+
+    def _cancel(self, command_id, signum):
+        """ sends the signal to this process, aborting the command, and to the processes it
+        launched, in the same process group as the daemon starts its own session
+        """
+        if signum not in _CANCEL_SIGNALS:
+            return
+        if len(self._cancelled) > 1000:  # Of clients that ran their commands by themselves
+            self._cancelled.clear()
+        # Checked by the command before running, if it is not running yet
+        self._cancelled[command_id] = signum
+        if command_id != self._running:
+            return
+        if os.getpgrp() == os.getpid():
+            os.killpg(os.getpid(), signum)
+        else:
+            os.kill(os.getpid(), signum)
+
+    def _run_connection(self, connection, request, fds):
+        try:
+            exit_code = self._run(request, fds)
+            _send(connection, {"exit": int(exit_code or 0)})
+        except (socket.error, OSError):  # The client went away
+            pass
+        finally:
+            self._running = None
+            self._cancelled.pop(request.get("id"), None)
+            for fd in fds:
+                os.close(fd)
+            connection.close()
+            self._busy.release()
+
+    def _run(self, request, fds):
+        saved_fds = [os.dup(fd) for fd in _STD_FDS]
+        saved_env = dict(os.environ)
+        saved_cwd = os.getcwd()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            for new_fd, fd in zip(fds, _STD_FDS):
+                os.dup2(new_fd, fd)
+            os.environ.clear()
+            os.environ.update(request["env"])
+            os.chdir(request["cwd"])
+            self._in_command = True
+            try:
+                cancelled = self._cancelled.get(request.get("id"))
+                if cancelled is not None:
+                    return _interrupted_exit(cancelled)
+                return self._run_command(request["args"])
+            except SystemExit as exc:  # Interrupted out of the Command
+                return exc.code
+            finally:
+                self._in_command = False
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            for saved_fd, fd in zip(saved_fds, _STD_FDS):
+                os.dup2(saved_fd, fd)
+                os.close(saved_fd)
+            os.environ.clear()
+            os.environ.update(saved_env)
+            os.chdir(saved_cwd)
+
+    def _run_command(self, args):
+        from conans.cli.exit_codes import ERROR_GENERAL, ERROR_MIGRATION
+        from conans.client.command import Command
+        from conans.client.output import ConanOutput, colorama_initialize
+        from conans.client.userio import UserIO
+        from conans.errors import ConanMigrationError
+
+        try:
+            conan_api = self._api()
+        except ConanMigrationError:
+            return ERROR_MIGRATION
+        except ConanException as e:
+            sys.stderr.write("Error in Conan initialization: {}".format(e))
+            return ERROR_GENERAL
+        # The output depends on the terminal and environment of each client
+        conan_api.color = colorama_initialize()
+        conan_api.out = ConanOutput(sys.stdout, sys.stderr, conan_api.color)
+        conan_api.user_io = UserIO(ins=sys.stdin, out=conan_api.out)
+        return Command(conan_api).run(args)
+
+    def _api(self):
+        """ The API, with the HTTP session and its connection pools, is reused while the
+        conan.conf doesn't change
+        """
+        from conans.client.cache.cache import CONAN_CONF
+        conan_conf = os.path.join(self._cache_folder, CONAN_CONF)
+        try:
+            st = os.stat(conan_conf)
+            conan_conf_key = st.st_mtime_ns, st.st_size, st.st_ino
+        except OSError:
+            conan_conf_key = None
+        if self._conan_api is None or conan_conf_key != self._conan_conf_key:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from conans.client.cache.cache import ClientCache
+            from conans.client.conan_api import Conan
+            from conans.client.output import ConanOutput
+            from conans.client.rest.conan_requester import ConanRequester
+
+            self._conan_api = None  # If creating it fails, retry in next command
+            config = ClientCache(self._cache_folder, ConanOutput(sys.stdout, sys.stderr)).config
+            session = requests.Session()
+            adapter = HTTPAdapter(max_retries=ConanRequester.get_retries(config.retry))
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._conan_api = Conan(cache_folder=self._cache_folder, http_requester=session)
+            self._conan_conf_key = conan_conf_key
+        return self._conan_api
+
+
+if __name__ == "__main__":
+    ConanDaemon(sys.argv[1]).serve()
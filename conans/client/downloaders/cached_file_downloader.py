@@ -1,5 +1,8 @@
+import json
 import os
 import shutil
+import time
+import uuid
 from contextlib import contextmanager
 from threading import Lock
 
@@ -8,18 +11,31 @@ from six.moves.urllib_parse import urlsplit, urlunsplit
 from conans.client.downloaders.file_downloader import check_checksum
 from conans.errors import ConanException
 from conans.util.log import logger
-from conans.util.files import mkdir, set_dirty, clean_dirty, is_dirty, remove
+from conans.util.files import mkdir, set_dirty, clean_dirty, is_dirty, remove, \
+    file_checksums, store_file_checksums, load, ARTIFACT_CHECKSUMS
 from conans.util.locks import SimpleLock
 from conans.util.sha import sha256 as sha256_sum
 
 
+DOWNLOAD_CACHE_INDEX = "index.json"
+# The hits not recorded in the index yet, a line "<hash> <size>" per hit
+DOWNLOAD_CACHE_STATS = "stats.log"
+_INDEX_LOCK = "index"
+_HASH_LENGTH = 64  # sha256 hexdigest, the name of every cached file
+
+
 class CachedFileDownloader(object):
     _thread_locks = {}  # Needs to be shared among all instances
 
-    def __init__(self, cache_folder, file_downloader, user_download=False):
+    def __init__(self, cache_folder, file_downloader, user_download=False, max_size=None):
+        """ max_size: maximum size in bytes of the cached files, when exceeded, the least
+        recently used ones are removed. Only then every access is recorded in the index, an
+        unbounded cache writes it just for the new files, and appends the hits to the stats log
+        """
         self._cache_folder = cache_folder
         self._file_downloader = file_downloader
         self._user_download = user_download
+        self._max_size = max_size
 
     @contextmanager
     def _lock(self, lock_id):
@@ -58,20 +74,118 @@ class CachedFileDownloader(object):
                     logger.error("Cached file corrupt, redownloading")
                     remove(cached_path)
 
-            if not os.path.exists(cached_path):
+            hit = os.path.exists(cached_path)
+            if not hit:
                 set_dirty(cached_path)
                 self._file_downloader.download(url=url, file_path=cached_path, md5=md5,
                                                sha1=sha1, sha256=sha256, **kwargs)
                 clean_dirty(cached_path)
+            if not hit or self._max_size is not None:
+                # Known if computed while downloading, the checksum allows finding it by contents
+                sha1_sum = None if hit else file_checksums(cached_path, ("sha1",))["sha1"]
+                self._record_access(h, os.path.getsize(cached_path), hit, sha1_sum)
+            else:
+                self._record_hit(h, os.path.getsize(cached_path))
 
             if file_path is not None:
                 file_path = os.path.abspath(file_path)
                 mkdir(os.path.dirname(file_path))
                 shutil.copy2(cached_path, file_path)
+                if not hit:  # Known, computed while downloading
+                    store_file_checksums(file_path,
+                                         file_checksums(cached_path, ARTIFACT_CHECKSUMS))
+                result = None
             else:
                 with open(cached_path, 'rb') as handle:
-                    tmp = handle.read()
-                return tmp
+                    result = handle.read()
+
+        if not hit and self._max_size is not None:
+            self._evict(keep=h)
+        return result
+
+    @contextmanager
+    def _update_index(self):
+        """ The index keeps the size and last access time of every cached file, and the
+        hits/misses statistics. It is always read and written under its own lock, taken after
+        the lock of a cached file if any, never before
+        """
+        with self._lock(_INDEX_LOCK):
+            index = load_download_cache_index(self._cache_folder)
+            stats_path = os.path.join(self._cache_folder, DOWNLOAD_CACHE_STATS)
+            _merge_hits(index, stats_path)
+            yield index
+            # Write + rename, a process killed while writing never leaves a truncated index
+            index_path = os.path.join(self._cache_folder, DOWNLOAD_CACHE_INDEX)
+            tmp_path = "%s.%s" % (index_path, uuid.uuid4().hex)
+            with open(tmp_path, "w") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, index_path)
+            if os.path.exists(stats_path):
+                os.remove(stats_path)
+
+    def stats(self):
+        with self._lock(_INDEX_LOCK):
+            index = load_download_cache_index(self._cache_folder)
+            _merge_hits(index, os.path.join(self._cache_folder, DOWNLOAD_CACHE_STATS))
+        entries = index.pop("entries")
+        index["files"] = len(entries)
+        index["size"] = sum(e["size"] for e in entries.values())
+        index["max_size"] = self._max_size
+        return index
+
+    def _record_access(self, h, size, hit, sha1=None):
+        with self._update_index() as index:
+            entry = index["entries"].setdefault(h, {"size": size, "hits": 0})
+            entry["size"] = size
+            entry["last_access"] = time.time()
+            if sha1 is not None:
+                entry["sha1"] = sha1
+            if hit:
+                entry["hits"] += 1
+                index["hits"] += 1
+                index["bytes_saved"] += size
+            else:
+                index["misses"] += 1
+
+    def _record_hit(self, h, size):
+        """ a hit in an unbounded cache doesn't need to update the last access, it is just
+        counted, appending it to the stats log, much cheaper than writing the whole index
+        """
+        with self._lock(_INDEX_LOCK):
+            with open(os.path.join(self._cache_folder, DOWNLOAD_CACHE_STATS), "a") as f:
+                f.write("%s %s\n" % (h, size))
+
+    def _evict(self, keep):
+        """ removes the least recently used files, except the 'keep' one, until the total size
+        is below the max_size
+        """
+        with self._update_index() as index:
+            entries = index["entries"]
+            total_size = sum(e["size"] for e in entries.values())
+            victims = []
+            for h in sorted(entries, key=lambda k: entries[k]["last_access"]):
+                if total_size <= self._max_size:
+                    break
+                if h != keep:
+                    victims.append(h)
+                    total_size -= entries[h]["size"]
+
+        evicted = []
+        for h in victims:
+            # Under the file lock, nobody else is reading or downloading it
+            with self._lock(h):
+                cached_path = os.path.join(self._cache_folder, h)
+                if os.path.exists(cached_path):
+                    os.remove(cached_path)
+                if is_dirty(cached_path):
+                    clean_dirty(cached_path)
+                evicted.append(h)
+        if evicted:
+            logger.debug("DOWNLOAD CACHE: evicted %s files" % len(evicted))
+            with self._update_index() as index:
+                for h in evicted:
+                    index["entries"].pop(h, None)
+                index["evictions"] += len(evicted)
 
     def _get_hash(self, url, checksum=None):
         """ For Api V2, the cached downloads always have recipe and package REVISIONS in the URL,
@@ -89,3 +203,58 @@ class CachedFileDownloader(object):
             url += checksum
         h = sha256_sum(url.encode())
         return h
+
+
+def load_download_cache_index(cache_folder):
+    """ The index of the download cache. If it doesn't exist or it is broken, it is created
+    again from the files in the cache, without statistics
+    """
+    index_path = os.path.join(cache_folder, DOWNLOAD_CACHE_INDEX)
+    try:
+        index = json.loads(load(index_path))
+        if not isinstance(index.get("entries"), dict):
+            raise ValueError("Invalid download cache index")
+    except Exception:
+        index = {"entries": {}}
+        if os.path.isdir(cache_folder):
+            for f in os.listdir(cache_folder):
+                path = os.path.join(cache_folder, f)
+                if len(f) == _HASH_LENGTH and os.path.isfile(path) and not is_dirty(path):
+                    index["entries"][f] = {"size": os.path.getsize(path),
+                                           "last_access": os.path.getmtime(path),
+                                           "hits": 0}
+    for stat in ("hits", "misses", "bytes_saved", "evictions"):
+        index.setdefault(stat, 0)
+    return index
+
+
+def _merge_hits(index, stats_path):
+    """ adds the hits of the stats log to the index statistics
+    """
+    try:
+        lines = load(stats_path).splitlines()
+    except Exception:  # No hits since the index was written
+        return
+    for line in lines:
+        try:
+            h, size = line.split()
+            size = int(size)
+        except ValueError:  # A line partially written by a killed process
+            continue
+        entry = index["entries"].get(h)
+        if entry is not None:
+            entry["hits"] += 1
+        index["hits"] += 1
+        index["bytes_saved"] += size
+
+
+def find_download_cache_file(cache_folder, sha1):
+    """ path of a file in the download cache with the given sha1 checksum, None if there isn't.
+    The checksums are in the index, recorded when the files were downloaded
+    """
+    index = load_download_cache_index(cache_folder)
+    for h, entry in index["entries"].items():
+        if entry.get("sha1") == sha1:
+            path = os.path.join(cache_folder, h)
+            if os.path.isfile(path) and not is_dirty(path):
+                return path
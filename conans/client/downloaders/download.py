@@ -3,9 +3,19 @@ from conans.client.downloaders.file_downloader import FileDownloader
 
 
 def run_downloader(requester, output, verify, retry, retry_wait, download_cache, user_download=False,
-                   **kwargs):
+                   download_cache_max_size=None, **kwargs):
     downloader = FileDownloader(requester=requester, output=output, verify=verify,
                                 config_retry=retry, config_retry_wait=retry_wait)
     if download_cache:
-        downloader = CachedFileDownloader(download_cache, downloader, user_download=user_download)
+        downloader = CachedFileDownloader(download_cache, downloader, user_download=user_download,
+                                          max_size=download_cache_max_size)
     return downloader.download(**kwargs)
+
+
+def run_extracting_downloader(requester, output, verify, url, filename, destination, **kwargs):
+    """ downloads and extracts the tar archive at the same time, without storing it. Returns
+    False if it wasn't possible, so it has to be downloaded with run_downloader() and extracted
+    """
+    downloader = FileDownloader(requester=requester, output=output, verify=verify,
+                                config_retry=None, config_retry_wait=None)
+    return downloader.extract(url, filename, destination, **kwargs)
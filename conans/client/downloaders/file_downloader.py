@@ -1,27 +1,36 @@
+import hashlib
 import os
 import re
+import tempfile
 import time
 import traceback
 
 import six
 
 from conans.client.rest import response_to_str
-from conans.client.tools.files import check_md5, check_sha1, check_sha256
 from conans.errors import ConanException, NotFoundException, AuthenticationException, \
     ForbiddenException, ConanConnectionError, RequestErrorException
 from conans.util import progress_bar
-from conans.util.files import mkdir
+from conans.util.archives import extract_tar_stream
+from conans.util.files import mkdir, HashingWriter, store_file_checksums, merge_directories, \
+    rmdir, check_with_algorithm_sum, ARTIFACT_CHECKSUMS
 from conans.util.log import logger
+from conans.util.profiler import span
 from conans.util.tracer import log_download
 
+# Size of the chunks read from the response and written to the downloaded file
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
-def check_checksum(file_path, md5, sha1, sha256):
-    if md5 is not None:
-        check_md5(file_path, md5)
-    if sha1 is not None:
-        check_sha1(file_path, sha1)
-    if sha256 is not None:
-        check_sha256(file_path, sha256)
+
+def check_checksum(file_path, md5, sha1, sha256, checksums=None):
+    """ checksums: the ones computed while writing the file, the file is read to compute any
+    other. Never the remembered file_checksums(), they could be stale
+    """
+    checksums = checksums or {}
+    for algorithm_name, signature in (("md5", md5), ("sha1", sha1), ("sha256", sha256)):
+        if signature is not None:
+            check_with_algorithm_sum(algorithm_name, file_path, signature,
+                                     checksums.get(algorithm_name))
 
 
 class FileDownloader(object):
@@ -52,18 +61,26 @@ class FileDownloader(object):
                 # the dest folder before
                 raise ConanException("Error, the file to download already exists: '%s'" % file_path)
 
+        # The ones of the Conan artifacts, and the ones to check
+        algorithms = ARTIFACT_CHECKSUMS + (("sha256",) if sha256 else ())
         try:
-            r = _call_with_retry(self._output, retry, retry_wait, self._download_file, url, auth,
-                                 headers, file_path)
+            name = os.path.basename(file_path) if file_path else url
+            with span("download %s" % name, "download", url=url.split("?")[0]):
+                r, checksums = _call_with_retry(self._output, retry, retry_wait,
+                                                self._download_file, url, auth, headers,
+                                                file_path, algorithms)
             if file_path:
-                check_checksum(file_path, md5, sha1, sha256)
+                check_checksum(file_path, md5, sha1, sha256, checksums)
             return r
         except Exception:
             if file_path and os.path.exists(file_path):
                 os.remove(file_path)
             raise
 
-    def _download_file(self, url, auth, headers, file_path, try_resume=False):
+    def _download_file(self, url, auth, headers, file_path, algorithms, try_resume=False):
+        """ returns the downloaded contents, if not written to file_path, and the checksums of
+        the written file, if they were computed while writing it
+        """
         t1 = time.time()
         if try_resume and file_path and os.path.exists(file_path):
             range_start = os.path.getsize(file_path)
@@ -96,23 +113,28 @@ class FileDownloader(object):
 
         def write_chunks(chunks, path):
             ret = None
+            checksums = None
             downloaded_size = range_start
             if path:
                 mkdir(os.path.dirname(path))
                 mode = "ab" if range_start else "wb"
                 with open(path, mode) as file_handler:
+                    writer = HashingWriter(file_handler, algorithms)
                     for chunk in chunks:
                         assert ((six.PY3 and isinstance(chunk, bytes)) or
                                 (six.PY2 and isinstance(chunk, str)))
-                        file_handler.write(chunk)
+                        writer.write(chunk)
                         downloaded_size += len(chunk)
+                # A resumed download only hashed the last part of the file
+                if not range_start:
+                    checksums = writer.checksums
             else:
                 ret_data = bytearray()
                 for chunk in chunks:
                     ret_data.extend(chunk)
                     downloaded_size += len(chunk)
                 ret = bytes(ret_data)
-            return ret, downloaded_size
+            return ret, downloaded_size, checksums
 
         def get_total_length():
             if range_start:
@@ -134,8 +156,8 @@ class FileDownloader(object):
             progress = progress_bar.Progress(total_length, self._output, description)
             progress.initial_value(range_start)
 
-            chunk_size = 1024 if not file_path else 1024 * 100
-            written_chunks, total_downloaded_size = write_chunks(
+            chunk_size = 1024 if not file_path else DOWNLOAD_CHUNK_SIZE
+            written_chunks, total_downloaded_size, checksums = write_chunks(
                 progress.update(read_response(chunk_size)),
                 file_path
             )
@@ -145,15 +167,20 @@ class FileDownloader(object):
             if total_downloaded_size != total_length and not gzip:
                 if (file_path and total_length > total_downloaded_size > range_start
                     and response.headers.get("Accept-Ranges") == "bytes"):
-                    written_chunks = self._download_file(url, auth, headers, file_path,
-                                                         try_resume=True)
+                    written_chunks, checksums = self._download_file(url, auth, headers,
+                                                                    file_path, algorithms,
+                                                                    try_resume=True)
                 else:
                     raise ConanException("Transfer interrupted before complete: %s < %s"
                                          % (total_downloaded_size, total_length))
+            elif checksums is not None:
+                # Computed while writing, saves reading the file again to check them or to
+                # store them in the package metadata
+                store_file_checksums(file_path, checksums)
 
             duration = time.time() - t1
             log_download(url, duration)
-            return written_chunks
+            return written_chunks, checksums
 
         except Exception as e:
             logger.debug(e.__class__)
@@ -162,6 +189,74 @@ class FileDownloader(object):
             raise ConanConnectionError("Download failed, check server, possibly try again\n%s"
                                        % str(e))
 
+    def extract(self, url, filename, destination, pattern=None, strip_root=False, auth=None,
+                headers=None, md5=None, sha1=None, sha256=None):
+        """ downloads the tar archive 'filename' extracting it at the same time, without storing
+        it. The contents are extracted to a temporary folder inside the destination, and moved
+        to the destination once the checksums are verified.
+        Returns False if the download failed, so it can be downloaded normally, with retries
+        """
+        try:
+            response = self._requester.get(url, stream=True, verify=self._verify_ssl, auth=auth,
+                                           headers=headers)
+        except Exception as exc:
+            logger.debug("DOWNLOAD: Cannot extract while downloading %s: %s" % (url, exc))
+            return False
+        if not response.ok:
+            response.close()
+            return False
+
+        t1 = time.time()
+        expected = {"md5": md5, "sha1": sha1, "sha256": sha256}
+        hashes = {name: hashlib.new(name) for name, value in expected.items() if value}
+        total_length = int(response.headers.get("Content-Length") or 0)
+        gzip = (response.headers.get("content-encoding") == "gzip")
+        downloaded = [0]
+
+        def read_response():
+            for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                for h in hashes.values():
+                    h.update(chunk)
+                downloaded[0] += len(chunk)
+                yield chunk
+
+        destination = os.path.abspath(destination)
+        mkdir(destination)
+        tmp_folder = tempfile.mkdtemp(prefix=".conan_extract_", dir=destination)
+        try:
+            logger.debug("DOWNLOAD: %s" % url)
+            progress = progress_bar.Progress(total_length, self._output,
+                                             "Downloading {}".format(filename))
+            try:
+                with span("download %s" % filename, "download", url=url.split("?")[0]):
+                    extract_tar_stream(progress.update(read_response()), tmp_folder, pattern,
+                                       strip_root)
+            except Exception as exc:
+                # Interrupted, or not a valid archive: downloading it checks the file first
+                logger.debug("DOWNLOAD: Cannot extract while downloading %s: %s" % (url, exc))
+                return False
+            finally:
+                response.close()
+            if total_length and downloaded[0] != total_length and not gzip:
+                return False
+            for name, h in hashes.items():
+                check_with_algorithm_sum(name, filename, expected[name], h.hexdigest())
+
+            for entry in os.listdir(tmp_folder):
+                src, dst = os.path.join(tmp_folder, entry), os.path.join(destination, entry)
+                if os.path.isdir(src) and os.path.isdir(dst) and not os.path.islink(dst):
+                    merge_directories(src, dst)
+                else:
+                    if os.path.isdir(dst) and not os.path.islink(dst):
+                        rmdir(dst)
+                    elif os.path.lexists(dst):
+                        os.remove(dst)
+                    os.replace(src, dst)
+        finally:
+            rmdir(tmp_folder)
+        log_download(url, time.time() - t1)
+        return True
+
 
 def _call_with_retry(out, retry, retry_wait, method, *args, **kwargs):
     for counter in range(retry + 1):
@@ -1,10 +1,10 @@
-import fnmatch
 import os
-import shutil
 from collections import defaultdict
 
 from conans.errors import ConanException
-from conans.util.files import mkdir, walk
+from conans.util.file_selection import compile_patterns, current_snapshots
+from conans.util.files import mkdir
+from conans.util.staging import STAGING_COPY, copy_files
 
 
 def report_copied_files(copied, output, message_suffix="Copied"):
@@ -33,7 +33,7 @@ class FileCopier(object):
     imports: package folder -> user folder
     export: user folder -> store "export" folder
     """
-    def __init__(self, source_folders, root_destination_folder):
+    def __init__(self, source_folders, root_destination_folder, staging=STAGING_COPY):
         """
         Takes the base folders to copy resources src -> dst. These folders names
         will not be used in the relative names while copying
@@ -41,11 +41,15 @@ class FileCopier(object):
                                   store build folder
         param root_destination_folder: The base folder to copy things to, typically the
                                        store package folder
+        param staging: how the files are copied, see conans.util.staging
         """
         assert isinstance(source_folders, list), "source folders must be a list"
         self._src_folders = source_folders
         self._dst_folder = root_destination_folder
+        self._staging = staging
         self._copied = []
+        # All the copies of the recipe method walk every folder once
+        self._snapshots = current_snapshots()
 
     def report(self, output):
         return report_copied_files(self._copied, output)
@@ -105,24 +109,21 @@ class FileCopier(object):
         self._copied.extend(files_to_copy)
         return copied_files
 
-    @staticmethod
-    def _filter_files(src, pattern, links, excludes, ignore_case, excluded_folders):
+    def _filter_files(self, src, pattern, links, excludes, ignore_case, excluded_folders):
 
         """ return a list of the files matching the patterns
         The list will be relative path names wrt to the root src folder
         """
-        filenames = []
+        files_to_copy = []
         linked_folders = []
 
-        if excludes:
-            if not isinstance(excludes, (tuple, list)):
-                excludes = (excludes, )
-            if ignore_case:
-                excludes = [e.lower() for e in excludes]
-        else:
-            excludes = []
+        if excludes and not isinstance(excludes, (tuple, list)):
+            excludes = (excludes, )
+        included = compile_patterns([pattern], ignore_case, normcase=ignore_case)
+        excluded_file = compile_patterns(excludes, ignore_case, normcase=ignore_case)
+        excluded_folder = compile_patterns(excludes, ignore_case, normcase=True)
 
-        for root, subfolders, files in walk(src, followlinks=True):
+        for root, subfolders, files in self._snapshots.walk(src, followlinks=True):
             if root in excluded_folders:
                 subfolders[:] = []
                 continue
@@ -143,29 +144,15 @@ class FileCopier(object):
                     pass
 
             relative_path = os.path.relpath(root, src)
-            compare_relative_path = relative_path.lower() if ignore_case else relative_path
-            for exclude in excludes:
-                if fnmatch.fnmatch(compare_relative_path, exclude):
-                    subfolders[:] = []
-                    files = []
-                    break
+            prefix = "" if relative_path == "." else relative_path + os.sep
+            if excluded_folder and excluded_folder(relative_path):
+                subfolders[:] = []
+                continue
             for f in files:
-                relative_name = os.path.normpath(os.path.join(relative_path, f))
-                filenames.append(relative_name)
-
-        if ignore_case:
-            pattern = pattern.lower()
-            files_to_copy = [n for n in filenames if fnmatch.fnmatch(os.path.normpath(n.lower()),
-                                                                     pattern)]
-        else:
-            files_to_copy = [n for n in filenames if fnmatch.fnmatchcase(os.path.normpath(n),
-                                                                         pattern)]
-
-        for exclude in excludes:
-            if ignore_case:
-                files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatch(f.lower(), exclude)]
-            else:
-                files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatchcase(f, exclude)]
+                relative_name = prefix + f
+                if included(relative_name) and not (excluded_file and
+                                                    excluded_file(relative_name)):
+                    files_to_copy.append(relative_name)
 
         return files_to_copy, linked_folders
 
@@ -215,21 +202,18 @@ class FileCopier(object):
                         break  # not empty
                     base_path = os.path.dirname(base_path)
 
-    @staticmethod
-    def _copy_files(files, src, dst, keep_path, symlinks):
+    def _copy_files(self, files, src, dst, keep_path, symlinks):
         """ executes a multiple file copy from [(src_file, dst_file), (..)]
         managing symlinks if necessary
         """
         copied_files = []
+        files_to_copy = []
         for filename in files:
             abs_src_name = os.path.join(src, filename)
             filename = filename if keep_path else os.path.basename(filename)
             abs_dst_name = os.path.normpath(os.path.join(dst, filename))
-            try:
-                os.makedirs(os.path.dirname(abs_dst_name))
-            except Exception:
-                pass
             if symlinks and os.path.islink(abs_src_name):
+                mkdir(os.path.dirname(abs_dst_name))
                 linkto = os.readlink(abs_src_name)  # @UndefinedVariable
                 try:
                     os.remove(abs_dst_name)
@@ -237,6 +221,7 @@ class FileCopier(object):
                     pass
                 os.symlink(linkto, abs_dst_name)  # @UndefinedVariable
             else:
-                shutil.copy2(abs_src_name, abs_dst_name)
+                files_to_copy.append((abs_src_name, abs_dst_name))
             copied_files.append(abs_dst_name)
+        copy_files(files_to_copy, self._staging)
         return copied_files
@@ -1,73 +1,74 @@
+import json
 import os
+import sys
 import traceback
+from importlib import import_module
+from multiprocessing.pool import ThreadPool
 from os.path import join
 
 from conan.tools.env import VirtualRunEnv
-from conans.client.generators.cmake_find_package import CMakeFindPackageGenerator
-from conans.client.generators.cmake_find_package_multi import CMakeFindPackageMultiGenerator
-from conans.client.generators.compiler_args import CompilerArgsGenerator
-from conans.client.generators.pkg_config import PkgConfigGenerator
 from conans.client.subsystems import deduce_subsystem, subsystem_path
 from conans.errors import ConanException, conanfile_exception_formatter
 from conans.util.env_reader import get_env
-from conans.util.files import normalize, save, mkdir
-from .b2 import B2Generator
-from .boostbuild import BoostBuildGenerator
-from .cmake import CMakeGenerator
-from .cmake_multi import CMakeMultiGenerator
-from .cmake_paths import CMakePathsGenerator
-from .deploy import DeployGenerator
-from .gcc import GCCGenerator
-from .json_generator import JsonGenerator
-from .make import MakeGenerator
-from .markdown import MarkdownGenerator
-from .premake import PremakeGenerator
-from .qbs import QbsGenerator
-from .qmake import QmakeGenerator
-from .scons import SConsGenerator
-from .text import TXTGenerator
-from .virtualbuildenv import VirtualBuildEnvGenerator
-from .virtualenv import VirtualEnvGenerator
-from .virtualenv_python import VirtualEnvPythonGenerator
-from .virtualrunenv import VirtualRunEnvGenerator
-from .visualstudio import VisualStudioGenerator
-from .visualstudio_multi import VisualStudioMultiGenerator
-from .visualstudiolegacy import VisualStudioLegacyGenerator
-from .xcode import XCodeGenerator
-from .ycm import YouCompleteMeGenerator
-from ..tools import chdir
+from conans.util.files import normalize, save, mkdir, load, md5, to_file_bytes, add_saved_file
+from conans.util.profiler import span
+from conans.util.sha import sha256
+from ..tools import chdir, cpu_count
+
+# {generator name: (module, class)}. The generator modules are imported the first time they
+# are used, importing all of them is a significant part of the startup time of every command
+_BUILT_IN_GENERATORS = {"txt": ("text", "TXTGenerator"),
+                        "gcc": ("gcc", "GCCGenerator"),
+                        "compiler_args": ("compiler_args", "CompilerArgsGenerator"),
+                        "cmake": ("cmake", "CMakeGenerator"),
+                        "cmake_multi": ("cmake_multi", "CMakeMultiGenerator"),
+                        "cmake_paths": ("cmake_paths", "CMakePathsGenerator"),
+                        "cmake_find_package": ("cmake_find_package",
+                                               "CMakeFindPackageGenerator"),
+                        "cmake_find_package_multi": ("cmake_find_package_multi",
+                                                     "CMakeFindPackageMultiGenerator"),
+                        "qmake": ("qmake", "QmakeGenerator"),
+                        "qbs": ("qbs", "QbsGenerator"),
+                        "scons": ("scons", "SConsGenerator"),
+                        "visual_studio": ("visualstudio", "VisualStudioGenerator"),
+                        "visual_studio_multi": ("visualstudio_multi",
+                                                "VisualStudioMultiGenerator"),
+                        "visual_studio_legacy": ("visualstudiolegacy",
+                                                 "VisualStudioLegacyGenerator"),
+                        "xcode": ("xcode", "XCodeGenerator"),
+                        "ycm": ("ycm", "YouCompleteMeGenerator"),
+                        "virtualenv": ("virtualenv", "VirtualEnvGenerator"),
+                        "virtualenv_python": ("virtualenv_python", "VirtualEnvPythonGenerator"),
+                        "virtualbuildenv": ("virtualbuildenv", "VirtualBuildEnvGenerator"),
+                        "virtualrunenv": ("virtualrunenv", "VirtualRunEnvGenerator"),
+                        "boost-build": ("boostbuild", "BoostBuildGenerator"),
+                        "pkg_config": ("pkg_config", "PkgConfigGenerator"),
+                        "json": ("json_generator", "JsonGenerator"),
+                        "b2": ("b2", "B2Generator"),
+                        "premake": ("premake", "PremakeGenerator"),
+                        "make": ("make", "MakeGenerator"),
+                        "deploy": ("deploy", "DeployGenerator"),
+                        "markdown": ("markdown", "MarkdownGenerator")}
+_GENERATOR_MODULES = {class_name: module for module, class_name in _BUILT_IN_GENERATORS.values()}
+
+
+def __getattr__(name):
+    """ The generator classes are still importable from this package, e.g.
+    'from conans.client.generators import CMakeGenerator'
+    """
+    try:
+        module = _GENERATOR_MODULES[name]
+    except KeyError:
+        raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+    value = getattr(import_module("%s.%s" % (__name__, module)), name)
+    globals()[name] = value
+    return value
 
 
 class GeneratorManager(object):
     def __init__(self):
-        self._generators = {"txt": TXTGenerator,
-                            "gcc": GCCGenerator,
-                            "compiler_args": CompilerArgsGenerator,
-                            "cmake": CMakeGenerator,
-                            "cmake_multi": CMakeMultiGenerator,
-                            "cmake_paths": CMakePathsGenerator,
-                            "cmake_find_package": CMakeFindPackageGenerator,
-                            "cmake_find_package_multi": CMakeFindPackageMultiGenerator,
-                            "qmake": QmakeGenerator,
-                            "qbs": QbsGenerator,
-                            "scons": SConsGenerator,
-                            "visual_studio": VisualStudioGenerator,
-                            "visual_studio_multi": VisualStudioMultiGenerator,
-                            "visual_studio_legacy": VisualStudioLegacyGenerator,
-                            "xcode": XCodeGenerator,
-                            "ycm": YouCompleteMeGenerator,
-                            "virtualenv": VirtualEnvGenerator,
-                            "virtualenv_python": VirtualEnvPythonGenerator,
-                            "virtualbuildenv": VirtualBuildEnvGenerator,
-                            "virtualrunenv": VirtualRunEnvGenerator,
-                            "boost-build": BoostBuildGenerator,
-                            "pkg_config": PkgConfigGenerator,
-                            "json": JsonGenerator,
-                            "b2": B2Generator,
-                            "premake": PremakeGenerator,
-                            "make": MakeGenerator,
-                            "deploy": DeployGenerator,
-                            "markdown": MarkdownGenerator}
+        # The built-in ones are (module, class) until they are used
+        self._generators = dict(_BUILT_IN_GENERATORS)
         self._new_generators = ["CMakeToolchain", "CMakeDeps", "MSBuildToolchain",
                                 "MesonToolchain", "MSBuildDeps", "QbsToolchain", "msbuild",
                                 "VirtualRunEnv", "VirtualBuildEnv", "AutotoolsDeps",
@@ -83,7 +84,11 @@ class GeneratorManager(object):
         return name in self._generators
 
     def __getitem__(self, key):
-        return self._generators[key]
+        generator_class = self._generators[key]
+        if isinstance(generator_class, tuple):
+            generator_class = __getattr__(generator_class[1])
+            self._generators[key] = generator_class
+        return generator_class
 
     def _new_generator(self, generator_name, output):
         if generator_name not in self._new_generators:
@@ -163,11 +168,16 @@ class GeneratorManager(object):
             raise ConanException("Internal Conan error: Generator '{}' "
                                  "not commplete".format(generator_name))
 
-    def write_generators(self, conanfile, old_gen_folder, new_gen_folder, output):
+    def write_generators(self, conanfile, old_gen_folder, new_gen_folder, output,
+                         manifests_folder=None):
         """ produces auxiliary files, required to build a project or a package.
+        :param manifests_folder: folder of the client cache where a manifest of the files
+                                 written in the output folder is kept, so unchanged files are
+                                 not read nor touched in subsequent installs
         """
         _receive_conf(conanfile)
 
+        legacy_generators = []
         for generator_name in set(conanfile.generators):
             generator_class = self._new_generator(generator_name, output)
             if generator_class:
@@ -176,7 +186,8 @@ class GeneratorManager(object):
                     output.highlight("Generator '{}' calling 'generate()'".format(generator_name))
                     mkdir(new_gen_folder)
                     with chdir(new_gen_folder):
-                        generator.generate()
+                        with span("generator %s" % generator_name, "generators"):
+                            generator.generate()
                     continue
                 except Exception as e:
                     output.error(traceback.format_exc())
@@ -184,7 +195,7 @@ class GeneratorManager(object):
                                                                               str(e)))
 
             try:
-                generator_class = self._generators[generator_name]
+                generator_class = self[generator_name]
             except KeyError:
                 available = list(self._generators.keys()) + self._new_generators
                 raise ConanException("Invalid generator '%s'. Available types: %s" %
@@ -195,10 +206,25 @@ class GeneratorManager(object):
                 # To allow old-style generator packages to work (e.g. premake)
                 output.warn("Generator %s failed with new __init__(), trying old one")
                 generator = generator_class(conanfile.deps_cpp_info, conanfile.cpp_info)
+            generator.output_path = old_gen_folder
+            legacy_generators.append((generator_name, generator))
 
+        if not legacy_generators:
+            return
+
+        parallel = conanfile.conf.get("tools.generators:parallel", check_type=int)
+        if parallel is None:
+            parallel = cpu_count(output)
+        contents = _generators_contents(conanfile, legacy_generators, parallel)
+        generators_manifest = _GeneratorsManifest(old_gen_folder, manifests_folder)
+        for generator_name, generator in legacy_generators:
+            content, error = contents[generator_name]
             try:
-                generator.output_path = old_gen_folder
-                content = generator.content
+                if error is not None:
+                    exc, trace = error
+                    if get_env("CONAN_VERBOSE_TRACEBACK", False):
+                        output.error(trace)
+                    raise exc
                 if generator_name != "txt":
                     conanfile.output.warn(f"\n"
                                           f"     ************************************************\n"
@@ -213,17 +239,124 @@ class GeneratorManager(object):
                         if generator.normalize:  # To not break existing behavior, to be removed 2.0
                             v = normalize(v)
                         output.info("Generator %s created %s" % (generator_name, k))
-                        save(join(old_gen_folder, k), v, only_if_modified=True)
+                        generators_manifest.save(k, v)
                 else:
                     content = normalize(content)
                     output.info("Generator %s created %s" % (generator_name, generator.filename))
-                    save(join(old_gen_folder, generator.filename), content, only_if_modified=True)
+                    generators_manifest.save(generator.filename, content)
             except Exception as e:
-                if get_env("CONAN_VERBOSE_TRACEBACK", False):
+                if error is None and get_env("CONAN_VERBOSE_TRACEBACK", False):
                     output.error(traceback.format_exc())
                 output.error("Generator %s(file:%s) failed\n%s"
                              % (generator_name, generator.filename, str(e)))
                 raise ConanException(e)
+            finally:
+                generators_manifest.write()
+
+
+# The DepCppInfo values computed and cached the first time they are read
+_LAZY_CPP_INFO_ATTRIBUTES = ("include_paths", "lib_paths", "bin_paths", "build_paths",
+                             "res_paths", "src_paths", "framework_paths", "build_modules_paths",
+                             "libs", "system_libs", "frameworks", "defines", "cxxflags",
+                             "cflags", "sharedlinkflags", "exelinkflags", "objects", "requires")
+
+
+def _load_lazy_cpp_info(conanfile):
+    """ reads the lazily computed values of the dependencies cpp_info, so the generators
+    computing their contents concurrently only read the shared dependencies information
+    """
+    for _, dep_cpp_info in conanfile.deps_cpp_info.dependencies:
+        for cpp_info in [dep_cpp_info] + list(dep_cpp_info.configs.values()):
+            for attribute in _LAZY_CPP_INFO_ATTRIBUTES:
+                try:
+                    getattr(cpp_info, attribute)
+                except Exception:  # Raised again by the generator reading it
+                    pass
+
+
+def _generators_contents(conanfile, generators, parallel):
+    """ computes the content of the legacy generators, the built-in ones concurrently in up to
+    'parallel' threads. They only read the conanfile and its dependencies information, but
+    custom generators can do anything, they are computed sequentially in the main thread.
+    Returns {generator_name: (content, error)}
+    """
+    def _content(name_generator):
+        name, generator = name_generator
+        try:
+            with span("generator %s" % name, "generators"):
+                return generator.content, None
+        except Exception as e:
+            return None, (e, traceback.format_exc())
+
+    built_in = [(name, generator) for name, generator in generators
+                if name in _BUILT_IN_GENERATORS and
+                type(generator).__module__.startswith(__name__ + ".")]
+    result = {}
+    if parallel > 1 and len(built_in) > 1:
+        _load_lazy_cpp_info(conanfile)
+        thread_pool = ThreadPool(min(parallel, len(built_in)))
+        contents = thread_pool.map(_content, built_in)
+        thread_pool.close()
+        thread_pool.join()
+        result = {name: content for (name, _), content in zip(built_in, contents)}
+    for name, generator in generators:
+        if name not in result:
+            result[name] = _content((name, generator))
+    return result
+
+
+class _GeneratorsManifest(object):
+    """ Keeps the md5, size and mtime of the files written by the legacy generators, so
+    unchanged outputs can be detected without reading the files and are not touched, keeping
+    their mtimes, which avoids re-running build systems configure steps (e.g. CMake).
+    It is stored in the client cache, one file per output folder, not in the user folders
+    """
+
+    def __init__(self, folder, manifests_folder=None):
+        self._folder = folder
+        self._persistent = manifests_folder is not None
+        self._path = None
+        if self._persistent:
+            folder_hash = sha256(os.path.abspath(folder).encode("utf-8"))
+            self._path = join(manifests_folder, "%s.json" % folder_hash)
+        self._files = {}
+        self._modified = False
+        if self._persistent and os.path.isfile(self._path):
+            try:
+                self._files = json.loads(load(self._path)).get("files", {})
+            except Exception:  # A corrupted manifest is discarded, files will be compared
+                pass
+
+    def save(self, filename, content):
+        path = join(self._folder, filename)
+        if not self._persistent:
+            save(path, content, only_if_modified=True)
+            return
+        content_bytes = to_file_bytes(content)
+        checksum = md5(content_bytes)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+        entry = self._files.get(filename)
+        if stat is not None and entry is not None and \
+                entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime_ns:
+            # The file is the one we wrote, no need to read it to compare
+            if entry["md5"] == checksum:
+                add_saved_file(path)
+                return
+            save(path, content_bytes)
+        else:
+            save(path, content_bytes, only_if_modified=True)
+        stat = os.stat(path)
+        self._files[filename] = {"md5": checksum, "size": stat.st_size,
+                                 "mtime": stat.st_mtime_ns}
+        self._modified = True
+
+    def write(self):
+        if self._modified:
+            save(self._path, json.dumps({"files": self._files}, indent=2))
+            self._modified = False
 
 
 def _receive_conf(conanfile):
@@ -320,3 +453,8 @@ def _generate_aggregated_env(conanfile):
             save(os.path.join(conanfile.generators_folder, filename), ps1_content(ps1s))
             save(os.path.join(conanfile.generators_folder, "deactivate_{}".format(filename)),
                  ps1_content(deactivates(ps1s)))
+
+
+if sys.version_info < (3, 7):  # No module __getattr__ (PEP 562)
+    for _generator_class in _GENERATOR_MODULES:
+        __getattr__(_generator_class)
@@ -6,6 +6,7 @@ from conans.model.manifest import FileTreeManifest
 from conans.paths import BUILD_INFO_DEPLOY
 from conans.util.dates import timestamp_now
 from conans.util.files import mkdir, md5sum
+from conans.util.staging import copy_files, get_imports_staging_method
 
 
 FILTERED_FILES = ["conaninfo.txt", "conanmanifest.txt"]
@@ -29,6 +30,7 @@ class DeployGenerator(Generator):
     @property
     def content(self):
         copied_files = []
+        files_to_copy = []
 
         for dep_name in self.conanfile.deps_cpp_info.deps:
             rootpath = self.conanfile.deps_cpp_info[dep_name].rootpath
@@ -41,8 +43,8 @@ class DeployGenerator(Generator):
                     dst = os.path.join(self.output_path, dep_name,
                                        os.path.relpath(root, rootpath), f)
                     dst = os.path.normpath(dst)
-                    mkdir(os.path.dirname(dst))
                     if os.path.islink(src):
+                        mkdir(os.path.dirname(dst))
                         link_target = os.readlink(src)
                         if not os.path.isabs(link_target):
                             link_target = os.path.join(os.path.dirname(src), link_target)
@@ -51,7 +53,9 @@ class DeployGenerator(Generator):
                             os.unlink(dst)
                         os.symlink(linkto, dst)
                     else:
-                        shutil.copy(src, dst)
+                        files_to_copy.append((src, dst))
                     if f not in dirs:
                         copied_files.append(dst)
+        # Deployed files get new timestamps, as they always did, they are not copied with copy2
+        copy_files(files_to_copy, get_imports_staging_method(), copy_function=shutil.copy)
         return self.deploy_manifest_content(copied_files)
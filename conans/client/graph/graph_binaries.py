@@ -10,6 +10,7 @@ from conans.model.info import ConanInfo, PACKAGE_ID_UNKNOWN, PACKAGE_ID_INVALID
 from conans.model.manifest import FileTreeManifest
 from conans.model.ref import PackageReference
 from conans.util.conan_v2_mode import conan_v2_property
+from conans.util.profiler import span
 
 
 class GraphBinariesAnalyzer(object):
@@ -457,7 +458,8 @@ class GraphBinariesAnalyzer(object):
                 # annotate pattern, so unused patterns in --build are not displayed as errors
                 build_mode.forced(node.conanfile, node.ref)
                 continue
-            self._evaluate_node(node, build_mode, update, remotes)
+            with span("binary %s" % node.conanfile.display_name, "binaries"):
+                self._evaluate_node(node, build_mode, update, remotes)
         deps_graph.mark_private_skippable(nodes_subset=nodes_subset, root=root)
 
     def reevaluate_node(self, node, remotes, build_mode, update):
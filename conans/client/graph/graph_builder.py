@@ -8,6 +8,7 @@ from conans.model.conan_file import get_env_context_manager
 from conans.model.ref import ConanFileReference
 from conans.model.requires import Requirements, Requirement
 from conans.util.log import logger
+from conans.util.profiler import span
 
 
 class DepsGraphBuilder(object):
@@ -126,17 +127,19 @@ class DepsGraphBuilder(object):
                     values
         param down_ref: ConanFileReference of who is depending on current node for this expansion
         """
-        # basic node configuration: calling configure() and requirements() and version-ranges
-        new_options, new_reqs = self._get_node_requirements(node, graph, down_ref, down_options,
-                                                            down_reqs, graph_lock, update, remotes)
-
-        # Expand each one of the current requirements
-        for require in node.conanfile.requires.values():
-            if require.override:
-                continue
-            self._expand_require(require, node, graph, check_updates, update, remotes, profile_host,
-                                 profile_build, new_reqs, new_options, graph_lock,
-                                 context_switch=False)
+        with span("expand %s" % node.conanfile.display_name, "graph"):
+            # basic node configuration: calling configure() and requirements() and version-ranges
+            new_options, new_reqs = self._get_node_requirements(node, graph, down_ref,
+                                                                down_options, down_reqs,
+                                                                graph_lock, update, remotes)
+
+            # Expand each one of the current requirements
+            for require in node.conanfile.requires.values():
+                if require.override:
+                    continue
+                self._expand_require(require, node, graph, check_updates, update, remotes,
+                                     profile_host, profile_build, new_reqs, new_options,
+                                     graph_lock, context_switch=False)
 
     def _resolve_ranges(self, graph, requires, consumer, update, remotes):
         for require in requires:
@@ -429,8 +432,9 @@ class DepsGraphBuilder(object):
                                                  new_ref.user, new_ref.channel)
 
         try:
-            result = self._proxy.get_recipe(requirement.ref, check_updates, update,
-                                            remotes, self._recorder)
+            with span("get recipe %s" % str(requirement.ref), "graph"):
+                result = self._proxy.get_recipe(requirement.ref, check_updates, update,
+                                                remotes, self._recorder)
         except ConanException as e:
             if current_node.ref:
                 self._output.error("Failed requirement '%s' from '%s'"
@@ -440,8 +444,13 @@ class DepsGraphBuilder(object):
 
         locked_id = requirement.locked_id
         lock_py_requires = graph_lock.python_requires(locked_id) if locked_id is not None else None
-        dep_conanfile = self._loader.load_conanfile(conanfile_path, profile, ref=requirement.ref,
-                                                    lock_python_requires=lock_py_requires)
+        # Editable recipes are user folders that can change, they can't be cached by revision
+        revision = new_ref.revision if recipe_status != RECIPE_EDITABLE else None
+        with span("load %s" % str(requirement.ref), "graph"):
+            dep_conanfile = self._loader.load_conanfile(conanfile_path, profile,
+                                                        ref=requirement.ref,
+                                                        lock_python_requires=lock_py_requires,
+                                                        revision=revision)
         if recipe_status == RECIPE_EDITABLE:
             dep_conanfile.in_local_cache = False
             dep_conanfile.develop = True
@@ -1,7 +1,5 @@
 import os
 
-from requests.exceptions import RequestException
-
 from conans.client.graph.graph import (RECIPE_DOWNLOADED, RECIPE_INCACHE, RECIPE_NEWER,
                                        RECIPE_NOT_IN_REMOTE, RECIPE_NO_REMOTE, RECIPE_UPDATEABLE,
                                        RECIPE_UPDATED, RECIPE_EDITABLE)
@@ -113,6 +111,7 @@ class ConanProxy(object):
         return conanfile_path, status, selected_remote, ref
 
     def _download_recipe(self, layout, ref, output, remotes, remote, recorder):
+        from requests.exceptions import RequestException
 
         def _retrieve_from_remote(the_remote):
             output.info("Trying with '%s'..." % the_remote.name)
@@ -92,7 +92,7 @@ class PyRequireLoader(object):
         if isinstance(py_requires_refs, str):
             py_requires_refs = [py_requires_refs, ]
 
-        py_requires = self._resolve_py_requires(py_requires_refs, lock_python_requires, loader)
+        py_requires = self.resolve_py_requires(py_requires_refs, lock_python_requires, loader)
         if hasattr(conanfile, "python_requires_extend"):
             py_requires_extend = conanfile.python_requires_extend
             if isinstance(py_requires_extend, str):
@@ -103,7 +103,7 @@ class PyRequireLoader(object):
                 conanfile.__bases__ = (base_class,) + conanfile.__bases__
         conanfile.python_requires = py_requires
 
-    def _resolve_py_requires(self, py_requires_refs, lock_python_requires, loader):
+    def resolve_py_requires(self, py_requires_refs, lock_python_requires, loader):
         result = PyRequires()
         for py_requires_ref in py_requires_refs:
             py_requires_ref = self._resolve_ref(py_requires_ref, lock_python_requires)
@@ -141,7 +141,8 @@ class PyRequireLoader(object):
                                         remotes=self._remotes, recorder=ActionRecorder())
         path, _, _, new_ref = recipe
         conanfile, module = loader.load_basic_module(path, lock_python_requires, user=new_ref.user,
-                                                     channel=new_ref.channel)
+                                                     channel=new_ref.channel,
+                                                     revision=new_ref.revision)
         conanfile.name = new_ref.name
         # FIXME Conan 2.0 version should be a string, not a Version object
         conanfile.version = new_ref.version
@@ -3,6 +3,7 @@ import re
 from conans.errors import ConanException
 from conans.model.ref import ConanFileReference
 from conans.search.search import search_recipes
+from conans.util.profiler import span
 
 re_param = re.compile(r"^(?P<function>include_prerelease|loose)\s*=\s*(?P<value>True|False)$")
 re_version = re.compile(r"^((?!(include_prerelease|loose))[a-zA-Z0-9_+.\-~<>=|*^\s])*$")
@@ -101,6 +102,10 @@ class RangeResolver(object):
         if version_range is None:
             return
 
+        with span("resolve %s" % str(require.ref), "graph"):
+            self._resolve_range(require, version_range, base_conanref, update, remotes)
+
+    def _resolve_range(self, require, version_range, base_conanref, update, remotes):
         if require.is_resolved:
             ref = require.ref
             resolved_ref = self._resolve_version(version_range, [ref])
@@ -11,6 +11,7 @@ from conans.model.manifest import FileTreeManifest
 from conans.util.dates import timestamp_now
 from conans.util.env_reader import get_env
 from conans.util.files import load, md5sum, mkdir
+from conans.util.staging import get_imports_staging_method
 
 IMPORTS_MANIFESTS = "conan_imports_manifest.txt"
 
@@ -67,7 +68,10 @@ def _make_files_writable(file_names):
         return
 
     for file_name in file_names:
-        os.chmod(file_name, os.stat(file_name).st_mode | stat.S_IWRITE)
+        st = os.stat(file_name)
+        if st.st_nlink > 1:  # Hard linked to the read-only package file, it must stay read-only
+            continue
+        os.chmod(file_name, st.st_mode | stat.S_IWRITE)
 
 
 def run_imports(conanfile):
@@ -103,7 +107,8 @@ def run_deploy(conanfile, install_folder):
     # This is necessary to capture FileCopier full destination paths
     # Maybe could be improved in FileCopier
     def file_copier(*args, **kwargs):
-        file_copy = FileCopier([conanfile.package_folder], install_folder)
+        file_copy = FileCopier([conanfile.package_folder], install_folder,
+                               staging=get_imports_staging_method())
         copied = file_copy(*args, **kwargs)
         _make_files_writable(copied)
         package_copied.update(copied)
@@ -159,7 +164,8 @@ class _FileImporter(object):
         src_dirs = [src]  # hardcoded src="bin" origin
         for pkg_name, cpp_info in pkgs:
             final_dst_path = os.path.join(real_dst_folder, pkg_name) if folder else real_dst_folder
-            file_copier = FileCopier([cpp_info.rootpath], final_dst_path)
+            file_copier = FileCopier([cpp_info.rootpath], final_dst_path,
+                                     staging=get_imports_staging_method())
             if symbolic_dir_name:  # Syntax for package folder symbolic names instead of hardcoded
                 try:
                     src_dirs = getattr(cpp_info, symbolic_dir_name)
@@ -0,0 +1,168 @@
+import json
+import os
+import sys
+
+from conans import __version__ as client_version
+from conans.client.graph.graph import RECIPE_CONSUMER, RECIPE_VIRTUAL, RECIPE_EDITABLE, \
+    BINARY_SKIP
+from conans.model.conan_file import ConanFile
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import DATA_YML
+from conans.util.files import load, save
+from conans.util.log import logger
+from conans.util.sha import sha256
+
+FINGERPRINT_FILE = "conanfingerprint.json"
+
+
+def _file_stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _sha256(path):
+    # Not the cached checksums, a file modified within the mtime granularity would not change
+    return sha256(load(path, binary=True))
+
+
+class InstallFingerprint(object):
+    """ Fingerprint of a consumer 'conan install', stored in the install folder. It contains a
+    hash of all the install inputs (conanfile and the local modules it imports, profiles,
+    lockfile, arguments and client configuration), the resolved nodes, and the files written by
+    the install (generators, conaninfo, imports). If the inputs of a new install have the same
+    hash, the nodes revisions are still the ones in the cache and the written files are still
+    there, unmodified, nothing would change, and the install can be skipped without loading
+    the graph.
+
+    Version ranges are not evaluated again while the fingerprint matches, they behave as if
+    locked to the versions resolved by the install that wrote it.
+    """
+
+    def __init__(self, cache, install_folder, conanfile_path, graph_info, args):
+        self._cache = cache
+        self._path = os.path.join(install_folder, FINGERPRINT_FILE)
+        self._inputs = self._inputs_hash(cache, conanfile_path, graph_info, args)
+
+    @staticmethod
+    def _inputs_hash(cache, conanfile_path, graph_info, args):
+        inputs = ["version=%s" % client_version]
+        conanfile_folder = os.path.dirname(conanfile_path)
+        files = [conanfile_path, os.path.join(conanfile_folder, DATA_YML), cache.conan_conf_path,
+                 cache.new_config_path, cache.settings_path, cache.remotes_path]
+        for f in files:
+            content = load(f) if os.path.isfile(f) else ""
+            inputs.append("%s=%s" % (f, sha256(content.encode("utf-8"))))
+        inputs.append(graph_info.profile_host.dumps())
+        if graph_info.profile_build:
+            inputs.append(graph_info.profile_build.dumps())
+        if graph_info.graph_lock:
+            inputs.append(json.dumps(graph_info.graph_lock.serialize(), sort_keys=True))
+        inputs.append(json.dumps(args, sort_keys=True, default=str))
+        return sha256("\n".join(inputs).encode("utf-8"))
+
+    def _load(self):
+        try:
+            data = json.loads(load(self._path))
+        except Exception:  # Missing or corrupted
+            return None
+        return data if data.get("inputs") == self._inputs else None
+
+    def _nodes_match(self, nodes):
+        for node in nodes:
+            ref = ConanFileReference.loads(node["ref"])
+            layout = self._cache.package_layout(ref)
+            try:
+                if layout.recipe_revision() != ref.revision:
+                    logger.debug("FINGERPRINT: recipe %s changed" % node["ref"])
+                    return False
+                if node["package_id"] is not None:
+                    pref = PackageReference(ref, node["package_id"])
+                    if layout.package_revision(pref) != node["prev"]:
+                        logger.debug("FINGERPRINT: package %s changed" % str(pref))
+                        return False
+            except Exception:  # The recipe or package is not in the cache anymore
+                return False
+            folder = node["package_folder"]
+            if folder is not None and not os.path.isdir(folder):
+                logger.debug("FINGERPRINT: package folder %s doesn't exist" % folder)
+                return False
+        return True
+
+    def matches(self, recorder=None):
+        """ True if the stored fingerprint has the same inputs and the cache packages and
+        installed files are the same. Then the recorder, if any, gets the installed packages
+        as fetched from the cache, with their stored cpp_info
+        """
+        data = self._load()
+        if data is None:
+            return False
+        for path, digest in data["local_files"].items():
+            if not os.path.isfile(path) or _sha256(path) != digest:
+                logger.debug("FINGERPRINT: local file %s changed" % path)
+                return False
+        for path, stat in data["outputs"].items():
+            if _file_stat(path) != stat:
+                logger.debug("FINGERPRINT: installed file %s changed" % path)
+                return False
+        if not self._nodes_match(data["nodes"]):
+            return False
+        if recorder is not None:
+            for node in data["nodes"]:
+                ref = ConanFileReference.loads(node["ref"])
+                recorder.recipe_fetched_from_cache(ref)
+                if node["package_id"] is not None:
+                    pref = PackageReference(ref, node["package_id"], node["prev"])
+                    recorder.package_fetched_from_cache(pref)
+                    if node["cpp_info"] is not None:
+                        recorder.restore_package_cpp_info(pref, node["cpp_info"])
+        return True
+
+    def save(self, deps_graph, output_files, recorder=None):
+        """ stores the fingerprint of the installed graph and the files written by the install.
+        Graphs with editable packages are not fingerprinted, as their contents are user folders
+        that can change at any time, neither consumers with system_requirements(), that have to
+        run every time
+        """
+        conanfile = deps_graph.root.conanfile
+        if type(conanfile).system_requirements != ConanFile.system_requirements:
+            return
+        nodes = []
+        for node in deps_graph.nodes:
+            if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+                continue
+            if node.recipe == RECIPE_EDITABLE:
+                return
+            node_data = {"ref": node.ref.full_str(), "package_id": None, "prev": None,
+                         "package_folder": None, "cpp_info": None}
+            if node.binary != BINARY_SKIP:
+                cpp_info = recorder.package_cpp_info_doc(node.pref) if recorder else None
+                node_data.update({"package_id": node.package_id, "prev": node.prev,
+                                  "package_folder": node.conanfile.package_folder,
+                                  "cpp_info": cpp_info})
+            nodes.append(node_data)
+
+        # The modules imported by the conanfile from its folder, renamed by the loader
+        local_modules = type(conanfile).__module__ + "."
+        local_files = {}
+        for name, module in list(sys.modules.items()):
+            module_file = getattr(module, "__file__", None)
+            if name.startswith(local_modules) and module_file and os.path.isfile(module_file):
+                local_files[module_file] = _sha256(module_file)
+
+        outputs = {}
+        for path in output_files:
+            stat = _file_stat(path)
+            if stat is not None:
+                outputs[path] = stat
+        data = {"inputs": self._inputs,
+                "local_files": local_files,
+                "nodes": nodes,
+                "outputs": outputs}
+        save(self._path, json.dumps(data, indent=2))
+
+    def invalidate(self):
+        if os.path.isfile(self._path):
+            os.remove(self._path)
@@ -1,5 +1,4 @@
 import os
-import shutil
 import textwrap
 import time
 from multiprocessing.pool import ThreadPool
@@ -8,7 +7,8 @@ from conans.client import tools
 from conans.client.conanfile.build import run_build_method
 from conans.client.conanfile.package import run_package_method
 from conans.client.file_copier import report_copied_files
-from conans.client.generators import TXTGenerator, write_toolchain
+from conans.client.generators import write_toolchain
+from conans.client.generators.text import TXTGenerator
 from conans.client.graph.graph import BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_EDITABLE, \
     BINARY_MISSING, BINARY_SKIP, BINARY_UPDATE, BINARY_UNKNOWN, CONTEXT_HOST, BINARY_INVALID
 from conans.client.importer import remove_imports, run_imports
@@ -34,6 +34,8 @@ from conans.paths import BUILD_INFO, CONANINFO, RUN_LOG_NAME
 from conans.util.env_reader import get_env
 from conans.util.files import clean_dirty, is_dirty, make_read_only, mkdir, rmdir, save, set_dirty
 from conans.util.log import logger
+from conans.util.profiler import span
+from conans.util.staging import copy_tree, get_staging_method
 from conans.util.tracer import log_package_built, log_package_got_from_local_cache
 
 
@@ -113,13 +115,13 @@ class _PackageBuilder(object):
                       self._hook_manager, self._cache)
 
     @staticmethod
-    def _copy_sources(conanfile, source_folder, build_folder):
+    def _copy_sources(conanfile, source_folder, build_folder, staging):
         # Copies the sources to the build-folder, unless no_copy_source is defined
         _remove_folder_raising(build_folder)
         if not getattr(conanfile, 'no_copy_source', False):
             conanfile.output.info('Copying sources to build folder')
             try:
-                shutil.copytree(source_folder, build_folder, symlinks=True)
+                copy_tree(source_folder, build_folder, staging)
             except Exception as e:
                 msg = str(e)
                 if "206" in msg:  # System error shutil.Error 206: Filename or extension too long
@@ -204,7 +206,8 @@ class _PackageBuilder(object):
             with package_layout.conanfile_write_lock(self._output):
                 set_dirty(base_build)
                 self._prepare_sources(conanfile, pref, package_layout, remotes)
-                self._copy_sources(conanfile, base_source, base_build)
+                self._copy_sources(conanfile, base_source, base_build,
+                                   get_staging_method(self._cache.new_config))
 
         # BUILD & PACKAGE
         with package_layout.conanfile_read_lock(self._output):
@@ -491,7 +494,8 @@ class BinaryInstaller(object):
             output.info("Rewriting files of editable package "
                         "'{}' at '{}'".format(conanfile.name, conanfile.generators_folder))
             self._generator_manager.write_generators(conanfile, conanfile.install_folder,
-                                                     conanfile.generators_folder, output)
+                                                     conanfile.generators_folder, output,
+                                                     self._cache.generators_manifests_folder)
             write_toolchain(conanfile, conanfile.generators_folder, output)
             output.info("Generated toolchain")
             graph_info_node = GraphInfo(profile_host, root_ref=node.ref)
@@ -518,7 +522,9 @@ class BinaryInstaller(object):
             if build_folder is not None:
                 build_folder = os.path.join(base_path, build_folder)
                 output = conanfile.output
-                self._generator_manager.write_generators(conanfile, build_folder, build_folder, output)
+                self._generator_manager.write_generators(conanfile, build_folder, build_folder,
+                                                         output,
+                                                         self._cache.generators_manifests_folder)
                 write_toolchain(conanfile, build_folder, output)
                 save(os.path.join(build_folder, CONANINFO), conanfile.info.dumps())
                 output.info("Generated %s" % CONANINFO)
@@ -700,7 +706,8 @@ class BinaryInstaller(object):
                         else:
                             conanfile.cpp_info.filter_empty = False
 
-                    conanfile.package_info()
+                    with span("package_info %s" % conanfile.display_name, "package_info"):
+                        conanfile.package_info()
 
                     if hasattr(conanfile, "layout") and is_editable:
                         # Adjust the folders of the layout to consolidate the rootfolder of the
@@ -1,18 +1,20 @@
 import fnmatch
 import inspect
+import marshal
 import os
 import re
 import sys
+import threading
 import types
 import uuid
-
-import yaml
+from collections import OrderedDict
+from importlib.abc import MetaPathFinder
+from importlib.machinery import PathFinder, SourceFileLoader
+from importlib.util import spec_from_file_location, module_from_spec
 
 from pathlib import Path
 
-from conan.tools.cmake import cmake_layout
-from conan.tools.google import bazel_layout
-from conan.tools.microsoft import vs_layout
+from conans import DEFAULT_REVISION_V1
 from conans.client.conf.required_version import validate_conan_version
 from conans.client.loader_txt import ConanFileTextLoader
 from conans.client.tools.files import chdir
@@ -24,13 +26,64 @@ from conans.model.options import OptionsValues
 from conans.model.ref import ConanFileReference
 from conans.model.settings import Settings
 from conans.paths import DATA_YML
-from conans.util.files import load
+from conans.util.files import load, mkdir
+from conans.util.log import logger
+from conans.util.sha import sha256
+
+
+# Recipe classes loaded from the cache in this process, shared by all the loaders, so different
+# ConanApp instances (like consecutive ConanAPIV1 calls) don't execute the same recipes again
+# {(conanfile_path, recipe_revision): (declared python_requires, {py_requires_key: (class, module)})
+# Bounded, a long running process (the daemon) would keep every recipe revision it ever loaded
+_RECIPE_CLASSES_MAX = 500
+_recipe_classes = OrderedDict()
+_recipe_classes_lock = threading.Lock()
+
+
+def _get_recipe_classes(key):
+    with _recipe_classes_lock:
+        entry = _recipe_classes.get(key)
+        if entry is not None:
+            _recipe_classes.move_to_end(key)
+        return entry
+
+
+def _add_recipe_class(key, declared_py_requires, py_requires, conanfile, module):
+    """ stores the loaded class, removing the least recently used recipes if there are too
+    many, and their modules, so they can be freed
+    """
+    with _recipe_classes_lock:
+        entry = _recipe_classes.setdefault(key, (declared_py_requires, {}))
+        _recipe_classes.move_to_end(key)
+        entry[1][_py_requires_key(py_requires)] = (conanfile, module)
+        while len(_recipe_classes) > _RECIPE_CLASSES_MAX:
+            _, (_, evicted) = _recipe_classes.popitem(last=False)
+            for _, evicted_module in evicted.values():
+                prefix = evicted_module.__name__ + "."
+                for name in [m for m in sys.modules if m.startswith(prefix)]:
+                    del sys.modules[name]
+                sys.modules.pop(evicted_module.__name__, None)
+
+
+def _py_requires_key(py_requires):
+    if py_requires is None:
+        return ()
+    return tuple(sorted(r.full_str() for r in py_requires.all_refs()))
+
+
+def _add_generators(module, module_id, generator_manager):
+    for name, attr in module.__dict__.items():
+        if (name.startswith("_") or not inspect.isclass(attr) or
+                attr.__dict__.get("__module__") != module_id):
+            continue
+        if issubclass(attr, Generator) and attr != Generator:
+            generator_manager.add(attr.__name__, attr, custom=True)
 
 
 class ConanFileLoader(object):
 
     def __init__(self, runner, output, python_requires, generator_manager=None, pyreq_loader=None,
-                 requester=None):
+                 requester=None, bytecode_folder=None):
         self._runner = runner
         self._generator_manager = generator_manager
         self._output = output
@@ -39,6 +92,7 @@ class ConanFileLoader(object):
         sys.modules["conans"].python_requires = python_requires
         self._cached_conanfile_classes = {}
         self._requester = requester
+        self._bytecode_folder = bytecode_folder
         if sys.version_info.major >= 3 and sys.version_info.minor >= 12:
             from importlib import invalidate_caches
             invalidate_caches()
@@ -51,28 +105,38 @@ class ConanFileLoader(object):
                                       display)[0]
 
     def load_basic_module(self, conanfile_path, lock_python_requires=None, user=None, channel=None,
-                          display=""):
+                          display="", revision=None):
         """ loads a conanfile basic object without evaluating anything, returns the module too
+        :param revision: the recipe revision of recipes in the cache, their classes are reused
+                         by all the loaders in this process
         """
         cached = self._cached_conanfile_classes.get(conanfile_path)
         if cached and cached[1] == lock_python_requires:
-            conanfile = cached[0](self._output, self._runner, display, user, channel)
-            conanfile._conan_requester = self._requester
-            if hasattr(conanfile, "init") and callable(conanfile.init):
-                with conanfile_exception_formatter(str(conanfile), "init"):
-                    conanfile.init()
-            return conanfile, cached[2]
-
-        if lock_python_requires is not None:
-            self._python_requires.locked_versions = {r.name: r for r in lock_python_requires}
+            return self._new_conanfile(cached[0], display, user, channel), cached[2]
+        if revision == DEFAULT_REVISION_V1:  # Not computed from the contents, cannot be reused
+            revision = None
+
         try:
+            if revision is not None:
+                cached = self._get_revision_cached(conanfile_path, revision, lock_python_requires)
+                if cached is not None:
+                    conanfile, module = cached
+                    _add_generators(module, module.__name__, self._generator_manager)
+                    self._cached_conanfile_classes[conanfile_path] = (conanfile,
+                                                                      lock_python_requires,
+                                                                      module)
+                    return self._new_conanfile(conanfile, display, user, channel), module
+
+            if lock_python_requires is not None:
+                self._python_requires.locked_versions = {r.name: r for r in lock_python_requires}
             self._python_requires.valid = True
             module, conanfile = parse_conanfile(conanfile_path, self._python_requires,
-                                                self._generator_manager)
+                                                self._generator_manager, self._bytecode_folder)
             self._python_requires.valid = False
 
             self._python_requires.locked_versions = None
 
+            declared_py_requires = getattr(conanfile, "python_requires", None)
             # This is the new py_requires feature, to supersede the old python_requires
             if self._pyreq_loader:
                 self._pyreq_loader.load_py_requires(conanfile, lock_python_requires, self)
@@ -95,15 +159,42 @@ class ConanFileLoader(object):
 
             self._cached_conanfile_classes[conanfile_path] = (conanfile, lock_python_requires,
                                                               module)
-            result = conanfile(self._output, self._runner, display, user, channel)
-            result._conan_requester = self._requester
-            if hasattr(result, "init") and callable(result.init):
-                with conanfile_exception_formatter(str(result), "init"):
-                    result.init()
-            return result, module
+            # The old python_requires are resolved while executing the module, cannot be reused
+            if revision is not None and not isinstance(declared_py_requires, dict):
+                py_requires = getattr(conanfile, "python_requires", None)
+                _add_recipe_class((conanfile_path, revision), declared_py_requires, py_requires,
+                                  conanfile, module)
+
+            return self._new_conanfile(conanfile, display, user, channel), module
         except ConanException as e:
             raise ConanException("Error loading conanfile at '{}': {}".format(conanfile_path, e))
 
+    def _new_conanfile(self, conanfile_class, display, user, channel):
+        result = conanfile_class(self._output, self._runner, display, user, channel)
+        result._conan_requester = self._requester
+        if hasattr(result, "init") and callable(result.init):
+            with conanfile_exception_formatter(str(result), "init"):
+                result.init()
+        return result
+
+    def _get_revision_cached(self, conanfile_path, revision, lock_python_requires):
+        """ returns the (conanfile class, module) loaded by any loader in this process for this
+        recipe revision, if its python_requires resolve to the same revisions
+        """
+        entry = _get_recipe_classes((conanfile_path, revision))
+        if entry is None:
+            return None
+        declared_py_requires, classes = entry
+        py_requires = None
+        if declared_py_requires:
+            if self._pyreq_loader is None:
+                return None
+            if isinstance(declared_py_requires, str):
+                declared_py_requires = [declared_py_requires, ]
+            py_requires = self._pyreq_loader.resolve_py_requires(declared_py_requires,
+                                                                 lock_python_requires, self)
+        return classes.get(_py_requires_key(py_requires))
+
     def load_generators(self, conanfile_path):
         """ Load generator classes from a module. Any non-generator classes
         will be ignored. python_requires is not processed.
@@ -112,13 +203,8 @@ class ConanFileLoader(object):
             to the provided generator list
             @param conanfile_module: the module to be processed
             """
-        conanfile_module, module_id = _parse_conanfile(conanfile_path)
-        for name, attr in conanfile_module.__dict__.items():
-            if (name.startswith("_") or not inspect.isclass(attr) or
-                    attr.__dict__.get("__module__") != module_id):
-                continue
-            if issubclass(attr, Generator) and attr != Generator:
-                self._generator_manager.add(attr.__name__, attr, custom=True)
+        conanfile_module, module_id = _parse_conanfile(conanfile_path, self._bytecode_folder)
+        _add_generators(conanfile_module, module_id, self._generator_manager)
 
     @staticmethod
     def _load_data(conanfile_path):
@@ -126,6 +212,7 @@ class ConanFileLoader(object):
         if not os.path.exists(data_path):
             return None
 
+        import yaml
         try:
             data = yaml.safe_load(load(data_path))
         except Exception as e:
@@ -247,13 +334,15 @@ class ConanFileLoader(object):
         except Exception as e:  # re-raise with file name
             raise ConanException("%s: %s" % (conanfile_path, str(e)))
 
-    def load_conanfile(self, conanfile_path, profile, ref, lock_python_requires=None):
+    def load_conanfile(self, conanfile_path, profile, ref, lock_python_requires=None,
+                       revision=None):
         """ load a conanfile with a full reference, name, version, user and channel are obtained
         from the reference, not evaluated. Main way to load from the cache
         """
         try:
             conanfile, _ = self.load_basic_module(conanfile_path, lock_python_requires,
-                                                  ref.user, ref.channel, str(ref))
+                                                  ref.user, ref.channel, str(ref),
+                                                  revision=revision)
         except Exception as e:
             raise ConanException("%s: Cannot load recipe.\n%s" % (str(ref), str(e)))
 
@@ -315,6 +404,9 @@ class ConanFileLoader(object):
                 conanfile.build_requires = []
             conanfile.build_requires.append(build_reference)
         if parser.layout:
+            from conan.tools.cmake import cmake_layout
+            from conan.tools.google import bazel_layout
+            from conan.tools.microsoft import vs_layout
             layout_method = {"cmake_layout": cmake_layout,
                              "vs_layout": vs_layout,
                              "bazel_layout": bazel_layout}.get(parser.layout)
@@ -401,9 +493,9 @@ def _parse_module(conanfile_module, module_id, generator_manager):
     return result
 
 
-def parse_conanfile(conanfile_path, python_requires, generator_manager):
+def parse_conanfile(conanfile_path, python_requires, generator_manager, bytecode_folder=None):
     with python_requires.capture_requires() as py_requires:
-        module, filename = _parse_conanfile(conanfile_path)
+        module, filename = _parse_conanfile(conanfile_path, bytecode_folder)
         try:
             conanfile = _parse_module(module, filename, generator_manager)
 
@@ -425,7 +517,81 @@ def parse_conanfile(conanfile_path, python_requires, generator_manager):
             raise ConanException("%s: %s" % (conanfile_path, str(e)))
 
 
-def _parse_conanfile(conan_file_path):
+class _RecipeFolderFinder(MetaPathFinder):
+    """ Import hook that records the modules imported from the recipe folder (and their
+    submodules), so they can be isolated from other recipes modules with the same name without
+    scanning all the sys.modules
+    """
+    def __init__(self, folder):
+        self._folder = folder
+        self.modules = []
+        self._namespaces = []
+
+    def find_spec(self, fullname, path, target=None):
+        if path is None:  # Top level module, only from the recipe folder
+            path = [self._folder]
+        elif fullname.rpartition(".")[0] not in self.modules + self._namespaces:
+            return None
+        spec = PathFinder.find_spec(fullname, path, target)
+        if spec is None:
+            return None
+        if spec.origin is None:
+            # Namespace package portion, other sys.path entries can have a regular package
+            # with the same name that has priority, let the default finders decide
+            self._namespaces.append(fullname)
+            return None
+        if not spec.origin.startswith(self._folder):
+            return None
+        self.modules.append(fullname)
+        return spec
+
+    def loaded_modules(self):
+        """ names of the modules in sys.modules that were loaded from the recipe folder
+        """
+        result = [m for m in self.modules if m in sys.modules]
+        for namespace in self._namespaces:
+            module = sys.modules.get(namespace)
+            paths = getattr(module, "__path__", None) or []
+            if any(p.startswith(self._folder) for p in paths):
+                result.append(namespace)
+        return result
+
+
+def _compile_conanfile(conan_file_path, bytecode_folder):
+    """ compiles the recipe source, reusing the code object stored in the bytecode_folder
+    if the recipe at the same path, with the same contents, was compiled before by the same
+    Python implementation and version. There is one file per recipe path, overwritten when the
+    recipe changes, that starts with the hash of the source it was compiled from
+    """
+    with open(conan_file_path, "rb") as f:
+        source = f.read()
+    if bytecode_folder is None:
+        return compile(source, conan_file_path, "exec", dont_inherit=True)
+
+    key = "\n".join([sys.implementation.cache_tag, conan_file_path]).encode("utf-8")
+    bytecode_path = os.path.join(bytecode_folder, "%s.pyc" % sha256(key))
+    source_hash = sha256(source).encode("ascii")
+    try:
+        with open(bytecode_path, "rb") as f:
+            if f.read(len(source_hash)) == source_hash:
+                return marshal.load(f)
+    except Exception:  # Not existing or corrupted, compile it
+        pass
+    code = compile(source, conan_file_path, "exec", dont_inherit=True)
+    try:
+        mkdir(bytecode_folder)
+        # Write + rename, so concurrent processes never read a partially written file
+        tmp_path = "%s.%s" % (bytecode_path, uuid.uuid4().hex)
+        with open(tmp_path, "wb") as f:
+            f.write(source_hash)
+            marshal.dump(code, f)
+        os.replace(tmp_path, bytecode_path)
+    except Exception as e:  # The bytecode cache is an optimization, never fail because of it
+        logger.debug("LOADER: Cannot store bytecode of %s: %s" % (conan_file_path, str(e)))
+    return code
+
+
+def _parse_conanfile(conan_file_path, bytecode_folder=None):
     """ From a given path, obtain the in memory python import module
     """
 
@@ -435,21 +601,20 @@ def _parse_conanfile(conan_file_path):
     module_id = str(uuid.uuid1())
     current_dir = os.path.dirname(conan_file_path)
     sys.path.insert(0, current_dir)
+    finder = _RecipeFolderFinder(current_dir)
+    sys.meta_path.insert(0, finder)
     try:
-        old_modules = list(sys.modules.keys())
         with chdir(current_dir):
             old_dont_write_bytecode = sys.dont_write_bytecode
             try:
                 sys.dont_write_bytecode = True
-                # imp is deprecated in favour of importlib, removed in 3.12
-                if sys.version_info.major >= 3 and sys.version_info.minor >= 12:
-                    from importlib import util as imp_util
-                    spec = imp_util.spec_from_file_location(module_id, conan_file_path)
-                    loaded = imp_util.module_from_spec(spec)
-                    spec.loader.exec_module(loaded)
-                else:
-                    import imp
-                    loaded = imp.load_source(module_id, conan_file_path)
+                # Explicit loader, the file might not have a .py extension
+                loader = SourceFileLoader(module_id, conan_file_path)
+                spec = spec_from_file_location(module_id, conan_file_path, loader=loader)
+                loaded = module_from_spec(spec)
+                sys.modules[module_id] = loaded
+                code = _compile_conanfile(conan_file_path, bytecode_folder)
+                exec(code, loaded.__dict__)
                 sys.dont_write_bytecode = old_dont_write_bytecode
             except ImportError:
                 version_txt = _get_required_conan_version_without_loading(conan_file_path)
@@ -463,24 +628,9 @@ def _parse_conanfile(conan_file_path):
 
         # These lines are necessary, otherwise local conanfile imports with same name
         # collide, but no error, and overwrite other packages imports!!
-        added_modules = set(sys.modules).difference(old_modules)
-        for added in added_modules:
-            module = sys.modules[added]
-            if module:
-                try:
-                    try:
-                        # Most modules will have __file__ != None
-                        folder = os.path.dirname(module.__file__)
-                    except (AttributeError, TypeError):
-                        # But __file__ might not exist or equal None
-                        # Like some builtins and Namespace packages py3
-                        folder = module.__path__._path[0]
-                except AttributeError:  # In case the module.__path__ doesn't exist
-                    pass
-                else:
-                    if folder.startswith(current_dir):
-                        module = sys.modules.pop(added)
-                        sys.modules["%s.%s" % (module_id, added)] = module
+        for added in finder.loaded_modules():
+            module = sys.modules.pop(added)
+            sys.modules["%s.%s" % (module_id, added)] = module
     except ConanException:
         raise
     except Exception:
@@ -489,6 +639,7 @@ def _parse_conanfile(conan_file_path):
         raise ConanException("Unable to load conanfile in %s\n%s" % (conan_file_path,
                                                                      '\n'.join(trace[3:])))
     finally:
+        sys.meta_path.remove(finder)
         sys.path.pop(0)
 
     return loaded, module_id
@@ -4,6 +4,7 @@ from conans.client.graph.build_mode import BuildMode
 from conans.client.graph.graph import RECIPE_CONSUMER, RECIPE_VIRTUAL
 from conans.client.graph.printer import print_graph
 from conans.client.importer import run_deploy, run_imports
+from conans.client.install_fingerprint import InstallFingerprint
 from conans.client.installer import BinaryInstaller, call_system_requirements
 from conans.client.manifest_manager import ManifestManager
 from conans.client.output import Color
@@ -15,7 +16,7 @@ from conans.model.conan_file import ConanFile
 from conans.model.ref import ConanFileReference
 from conans.model.graph_lock import GraphLockFile
 from conans.paths import CONANINFO
-from conans.util.files import normalize, save
+from conans.util.files import normalize, save, record_saved_files
 
 
 def deps_install(app, ref_or_path, install_folder, base_folder, graph_info, remotes=None,
@@ -23,7 +24,7 @@ def deps_install(app, ref_or_path, install_folder, base_folder, graph_info, remo
                  manifest_interactive=False, generators=None, no_imports=False,
                  create_reference=None, keep_build=False, recorder=None, lockfile_node_id=None,
                  is_build_require=False, add_txt_generator=True, require_overrides=None,
-                 conanfile_path=None, test=None, output_folder=None):
+                 conanfile_path=None, test=None, output_folder=None, fingerprint=False):
 
     """ Fetch and build all dependencies for the given reference
     @param app: The ConanApp instance with all collaborators
@@ -38,6 +39,8 @@ def deps_install(app, ref_or_path, install_folder, base_folder, graph_info, remo
     @param generators: List of generators from command line.
     @param no_imports: Install specified packages but avoid running imports
     @param add_txt_generator: Add the txt to the list of generators
+    @param fingerprint: Skip the install if the stored fingerprint of a previous consumer
+    install in install_folder matches, only if enabled by the 'core.install:fingerprint' conf
 
     """
 
@@ -55,6 +58,23 @@ def deps_install(app, ref_or_path, install_folder, base_folder, graph_info, remo
         out.info("Configuration:")
         out.writeln(profile_host.dumps())
 
+    install_fingerprint = None
+    if fingerprint and install_folder and not manifest_folder and not update and \
+            cache.new_config.get("core.install:fingerprint", check_type=bool) and \
+            not isinstance(ref_or_path, ConanFileReference):
+        # build_modes are not an input, only those that don't force builds can skip the install
+        args = {"generators": generators, "no_imports": no_imports,
+                "add_txt_generator": add_txt_generator, "require_overrides": require_overrides,
+                "output_folder": output_folder, "base_folder": base_folder,
+                "remote": remotes.selected.name if remotes and remotes.selected else None}
+        install_fingerprint = InstallFingerprint(cache, install_folder, ref_or_path, graph_info,
+                                                 args)
+        if set(build_modes or []).issubset({"missing", "never"}) and \
+                install_fingerprint.matches(recorder):
+            out.info("Install inputs and installed packages unchanged, skipping install")
+            return install_folder, None
+        install_fingerprint.invalidate()  # Until this install succeeds
+
     deps_graph = graph_manager.load_graph(ref_or_path, create_reference, graph_info, build_modes,
                                           False, update, remotes, recorder,
                                           lockfile_node_id=lockfile_node_id,
@@ -115,31 +135,36 @@ def deps_install(app, ref_or_path, install_folder, base_folder, graph_info, remo
         output.error(msg)
 
     if install_folder:
-        # Write generators
-        tmp = list(conanfile.generators)  # Add the command line specified generators
-        generators = set(generators) if generators else set()
-        tmp.extend([g for g in generators if g not in tmp])
-        if add_txt_generator:
-            tmp.append("txt")
-        conanfile.generators = tmp
-        app.generator_manager.write_generators(conanfile, install_folder,
-                                               conanfile.generators_folder,
-                                               output)
-        write_toolchain(conanfile, conanfile.generators_folder, output)
-
-        if not isinstance(ref_or_path, ConanFileReference):
-            # Write conaninfo
-            content = normalize(conanfile.info.dumps())
-            save(os.path.join(install_folder, CONANINFO), content)
-            output.info("Generated %s" % CONANINFO)
-            graph_info.save(install_folder)
-            output.info("Generated graphinfo")
-            graph_lock_file = GraphLockFile(profile_host, profile_build, graph_lock)
-            graph_lock_file.save(os.path.join(install_folder, "conan.lock"))
-        if not no_imports:
-            run_imports(conanfile)
-        if type(conanfile).system_requirements != ConanFile.system_requirements:
-            call_system_requirements(conanfile, conanfile.output)
+        # The files written by the install, checked by the fingerprint to skip the next one
+        with record_saved_files() as output_files:
+            # Write generators
+            tmp = list(conanfile.generators)  # Add the command line specified generators
+            generators = set(generators) if generators else set()
+            tmp.extend([g for g in generators if g not in tmp])
+            if add_txt_generator:
+                tmp.append("txt")
+            conanfile.generators = tmp
+            app.generator_manager.write_generators(conanfile, install_folder,
+                                                   conanfile.generators_folder,
+                                                   output,
+                                                   app.cache.generators_manifests_folder)
+            write_toolchain(conanfile, conanfile.generators_folder, output)
+
+            if not isinstance(ref_or_path, ConanFileReference):
+                # Write conaninfo
+                content = normalize(conanfile.info.dumps())
+                save(os.path.join(install_folder, CONANINFO), content)
+                output.info("Generated %s" % CONANINFO)
+                graph_info.save(install_folder)
+                output.info("Generated graphinfo")
+                graph_lock_file = GraphLockFile(profile_host, profile_build, graph_lock)
+                graph_lock_file.save(os.path.join(install_folder, "conan.lock"))
+            if not no_imports:
+                output_files.update(os.path.abspath(f) for f in run_imports(conanfile))
+            if type(conanfile).system_requirements != ConanFile.system_requirements:
+                call_system_requirements(conanfile, conanfile.output)
+        if install_fingerprint is not None:
+            install_fingerprint.save(deps_graph, output_files, recorder)
 
         if not create_reference and isinstance(ref_or_path, ConanFileReference):
             # The conanfile loaded is a virtual one. The one w deploy is the first level one
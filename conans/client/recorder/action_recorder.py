@@ -119,6 +119,16 @@ class ActionRecorder(object):
         # assert isinstance(cpp_info, CppInfo)
         self._inst_packages_info[pref.copy_clear_revs()]['cpp_info'] = _cpp_info_to_dict(cpp_info)
 
+    def package_cpp_info_doc(self, pref):
+        """ the recorded cpp_info of the package, as stored in the info, None if not recorded
+        """
+        return self._inst_packages_info.get(pref.copy_clear_revs(), {}).get('cpp_info')
+
+    def restore_package_cpp_info(self, pref, cpp_info_doc):
+        """ records the cpp_info of a package from the one of a previous install
+        """
+        self._inst_packages_info[pref.copy_clear_revs()]['cpp_info'] = cpp_info_doc
+
     @property
     def install_errored(self):
         all_values = list(self._inst_recipes_actions.values()) + list(self._inst_packages_actions.values())
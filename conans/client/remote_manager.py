@@ -3,7 +3,6 @@ import shutil
 import time
 import traceback
 
-from requests.exceptions import ConnectionError
 
 from conans import DEFAULT_REVISION_V1
 from conans.client.cache.remote_registry import Remote
@@ -14,8 +13,10 @@ from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_N
 from conans.search.search import filter_packages
 from conans.util import progress_bar
 from conans.util.env_reader import get_env
-from conans.util.files import make_read_only, mkdir, tar_extract, touch_folder, md5sum, sha1sum
+from conans.util.files import make_read_only, mkdir, tar_extract, touch_folder, file_checksums, \
+    ARTIFACT_CHECKSUMS
 from conans.util.log import logger
+from conans.util.profiler import span
 # FIXME: Eventually, when all output is done, tracer functions should be moved to the recorder class
 from conans.util.tracer import (log_package_download,
                                 log_recipe_download, log_recipe_sources_download,
@@ -219,6 +220,28 @@ class RemoteManager(object):
             output.error("Exception: %s %s" % (type(e), str(e)))
             raise
 
+    def get_recipe_files(self, ref, remote, dest_folder):
+        """ downloads the files of the recipe, including the exported sources, as they are
+        stored in the remote, without extracting them
+
+        returns dict relative_filepath:abs_path
+        """
+        assert ref.revision, "get_recipe_files requires RREV"
+        zipped_files = self._call_remote(remote, "get_recipe", ref, dest_folder)
+        sources_files = self._call_remote(remote, "get_recipe_sources", ref, dest_folder)
+        zipped_files.update(sources_files or {})
+        return zipped_files
+
+    def get_package_files(self, pref, remote, dest_folder):
+        """ downloads the files of the binary package as they are stored in the remote, without
+        extracting them
+
+        returns dict relative_filepath:abs_path
+        """
+        assert pref.ref.revision, "get_package_files requires RREV"
+        assert pref.revision, "get_package_files requires PREV"
+        return self._call_remote(remote, "get_package", pref, dest_folder)
+
     def search_recipes(self, remote, pattern=None, ignorecase=True):
         """
         returns (dict str(ref): {packages_info}
@@ -283,11 +306,14 @@ class RemoteManager(object):
         return pref
 
     def _call_remote(self, remote, method, *args, **kwargs):
+        from requests.exceptions import ConnectionError
         assert (isinstance(remote, Remote))
         if remote.disabled:
             raise ConanException("Remote '%s' is disabled" % remote.name)
         try:
-            return self._auth_manager.call_rest_api_method(remote, method, *args, **kwargs)
+            name = "%s %s" % (method, args[0]) if args else method
+            with span(name, "remote", remote=remote.name):
+                return self._auth_manager.call_rest_api_method(remote, method, *args, **kwargs)
         except ConnectionError as exc:
             raise ConanConnectionError(("%s\n\nUnable to connect to %s=%s\n" +
                                         "1. Make sure the remote is reachable or,\n" +
@@ -303,8 +329,11 @@ class RemoteManager(object):
 
 
 def calc_files_checksum(files):
-    return {file_name: {"md5": md5sum(path), "sha1": sha1sum(path)}
-            for file_name, path in files.items()}
+    result = {}
+    for file_name, path in files.items():
+        checksums = file_checksums(path, ARTIFACT_CHECKSUMS)
+        result[file_name] = {"md5": checksums["md5"], "sha1": checksums["sha1"]}
+    return result
 
 
 def is_package_snapshot_complete(snapshot):
@@ -327,10 +356,11 @@ def check_compressed_files(tgz_name, files):
 def uncompress_file(src_path, dest_folder, output):
     t1 = time.time()
     try:
-        with progress_bar.open_binary(src_path, output,
-                                      "Decompressing %s" % os.path.basename(src_path)) \
-                as file_handler:
-            tar_extract(file_handler, dest_folder)
+        with span("unpack %s" % os.path.basename(src_path), "unpack", src=src_path):
+            with progress_bar.open_binary(src_path, output,
+                                          "Decompressing %s" % os.path.basename(src_path)) \
+                    as file_handler:
+                tar_extract(file_handler, dest_folder)
     except Exception as e:
         error_msg = "Error while extracting downloaded file '%s' to %s\n%s\n"\
                     % (src_path, dest_folder, str(e))
@@ -4,20 +4,21 @@ from conans.client.cache.remote_registry import Remote
 from conans.errors import ConanException, PackageNotFoundException, RecipeNotFoundException
 from conans.errors import NotFoundException
 from conans.model.ref import ConanFileReference, PackageReference, check_valid_ref
-from conans.paths import SYSTEM_REQS, rm_conandir
+from conans.paths import SYSTEM_REQS
 from conans.search.search import filter_outdated, search_packages, search_recipes
 from conans.util.log import logger
 
 
 class DiskRemover(object):
 
-    def _remove(self, path, ref, msg=""):
+    def _remove(self, package_layout, path, msg=""):
         try:
             logger.debug("REMOVE: folder %s" % path)
-            rm_conandir(path)
+            package_layout.remove_folder(path)
         except OSError:
             error_msg = "Folder busy (open or some file open): %s" % path
-            raise ConanException("%s: Unable to remove %s\n\t%s" % (repr(ref), msg, error_msg))
+            raise ConanException("%s: Unable to remove %s\n\t%s" % (repr(package_layout.ref), msg,
+                                                                    error_msg))
 
     def _remove_file(self, path, ref, msg=""):
         try:
@@ -41,7 +42,7 @@ class DiskRemover(object):
         self.remove_recipe(package_layout, output=output)
         self.remove_builds(package_layout)
         self.remove_packages(package_layout)
-        self._remove(package_layout.base_folder(), package_layout.ref)
+        self._remove(package_layout, package_layout.base_folder())
 
     def remove_src(self, package_layout):
         package_layout.sources_remove()
@@ -50,14 +51,13 @@ class DiskRemover(object):
         if not ids:
             path = package_layout.builds()
             for build in package_layout.conan_builds():
-                self._remove(os.path.join(path, build), package_layout.ref,
-                             "build folder:%s" % build)
-            self._remove(path, package_layout.ref, "builds")
+                self._remove(package_layout, os.path.join(path, build), "build folder:%s" % build)
+            self._remove(package_layout, path, "builds")
         else:
             for id_ in ids:
                 # Removal build IDs should be those of the build_id if present
                 pkg_path = package_layout.build(PackageReference(package_layout.ref, id_))
-                self._remove(pkg_path, package_layout.ref, "package:%s" % id_)
+                self._remove(package_layout, pkg_path, "package:%s" % id_)
 
     def remove_packages(self, package_layout, ids_filter=None):
         if not ids_filter:  # Remove all
@@ -66,7 +66,7 @@ class DiskRemover(object):
             for package_id in package_layout.package_ids():
                 pref = PackageReference(package_layout.ref, package_id)
                 package_layout.package_remove(pref)
-            self._remove(path, package_layout.ref, "packages")
+            self._remove(package_layout, path, "packages")
             self._remove_file(package_layout.system_reqs(), package_layout.ref, SYSTEM_REQS)
         else:
             for package_id in ids_filter:  # remove just the specified packages
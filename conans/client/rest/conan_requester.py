@@ -10,6 +10,7 @@ import requests
 from requests.adapters import HTTPAdapter
 
 from conans import __version__ as client_version
+from conans.client.rest.http_metrics import HttpMetrics, TimedHTTPAdapter
 from conans.util.files import save
 from conans.util.tracer import log_client_rest_api_call
 
@@ -22,11 +23,16 @@ logging.captureWarnings(True)
 class ConanRequester(object):
 
     def __init__(self, config, http_requester=None):
+        self.metrics = None
+        if config.http_metrics or config.http_metrics_file:
+            self.metrics = HttpMetrics(config.http_metrics, config.http_metrics_file)
         if http_requester:
             self._http_requester = http_requester
         else:
             self._http_requester = requests.Session()
-            adapter = HTTPAdapter(max_retries=self._get_retries(config.retry))
+            # The adapter timing the connections only if the metrics are enabled
+            adapter_class = TimedHTTPAdapter if self.metrics else HTTPAdapter
+            adapter = adapter_class(max_retries=self.get_retries(config.retry))
 
             self._http_requester.mount("http://", adapter)
             self._http_requester.mount("https://", adapter)
@@ -63,7 +69,8 @@ class ConanRequester(object):
             else:
                 self._client_certificates = self._client_cert_path
 
-    def _get_retries(self, retry):
+    @staticmethod
+    def get_retries(retry):
         retry = retry if retry is not None else 2
         if retry == 0:
             return 0
@@ -137,7 +144,10 @@ class ConanRequester(object):
         try:
             t1 = time.time()
             all_kwargs = self._add_kwargs(url, kwargs)
-            tmp = getattr(self._http_requester, method)(url, **all_kwargs)
+            if self.metrics is None:
+                tmp = getattr(self._http_requester, method)(url, **all_kwargs)
+            else:
+                tmp = self._call_with_metrics(method, url, all_kwargs)
             duration = time.time() - t1
             log_client_rest_api_call(url, method.upper(), duration, all_kwargs.get("headers"))
             return tmp
@@ -145,3 +155,16 @@ class ConanRequester(object):
             if popped:
                 os.environ.clear()
                 os.environ.update(old_env)
+
+    def _call_with_metrics(self, method, url, kwargs):
+        self.metrics.start_request()
+        t1 = time.time()
+        response = None
+        try:
+            response = getattr(self._http_requester, method)(url, **kwargs)
+            return response
+        finally:
+            request = getattr(response, "request", None)
+            sent = int(request.headers.get("Content-Length") or 0) if request is not None else 0
+            self.metrics.end_request(url, response, time.time() - t1,
+                                     streamed=kwargs.get("stream", False), sent=sent)
@@ -7,7 +7,11 @@ from conans.client.rest import response_to_str
 from conans.errors import AuthenticationException, ConanException, \
     NotFoundException, ForbiddenException, RequestErrorException, InternalErrorException
 from conans.util import progress_bar
-from conans.util.files import sha1sum
+from conans.util.files import file_checksums
+
+# The HTTP layer sends whatever every read() of the upload body returns, big chunks keep the
+# Python overhead per transferred byte negligible, so the upload runs at the network speed
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 class FileUploader(object):
@@ -57,7 +61,7 @@ class FileUploader(object):
 
         # Send always the header with the Sha1
         headers = copy(headers) or {}
-        headers["X-Checksum-Sha1"] = sha1sum(abs_path)
+        headers["X-Checksum-Sha1"] = file_checksums(abs_path, ("sha1",))["sha1"]
         if dedup:
             response = self._dedup(url, headers, auth)
             if response:
@@ -86,10 +90,9 @@ class FileUploader(object):
             file_name) if not display_name else "Uploaded {} -> {}".format(file_name, display_name)
 
         def load_in_chunks(_file):
-            """Lazy function (generator) to read a file piece by piece.
-            Default chunk size: 1k."""
+            """Lazy function (generator) to read a file piece by piece."""
             while True:
-                chunk = _file.read(1024)
+                chunk = _file.read(UPLOAD_CHUNK_SIZE)
                 if not chunk:
                     break
                 yield chunk
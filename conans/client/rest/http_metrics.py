@@ -0,0 +1,252 @@
+""" Metrics of the HTTP requests of a command, enabled with CONAN_HTTP_METRICS (a summary printed
+at the end of the command) or CONAN_HTTP_METRICS_FILE (the absolute path of a JSON file with
+them), or the 'http_metrics' and 'http_metrics_file' items of the [log] section of conan.conf.
+
+The requests are aggregated by remote (the servers not being a remote by their scheme and host)
+and by endpoint family (ping, auth, search, revisions, manifest, file, other), with the time of
+every phase:
+
+- dns, connect, tls: the DNS resolution, the TCP connection and the TLS handshake of the new
+  connections. The requests without new connections reused one of the pool
+- ttfb: time to first byte, since the request is sent (including its body, for uploads) until the
+  headers of the response are received
+- transfer: reading the body of the response
+"""
+import json
+import socket
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from six.moves.urllib.parse import urlsplit
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+from conans.util.files import save
+
+_PHASES = ("dns", "connect", "tls", "ttfb", "transfer")
+# The phases of the connections opened by every thread, while doing a request
+_connections = threading.local()
+
+
+def _add_connection_time(phase, duration):
+    timings = getattr(_connections, "timings", None)
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0) + duration
+
+
+class _TimedHTTPConnection(HTTPConnection):
+
+    def _new_conn(self):
+        """ resolves the host before connecting to its addresses, to time both separately
+        """
+        start = time.time()
+        host = self._dns_host
+        try:
+            addresses = socket.getaddrinfo(host, self.port, allowed_gai_family(),
+                                           socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            raise NewConnectionError(self, "Failed to establish a new connection: %s" % e)
+        resolved = time.time()
+        try:
+            for i, address in enumerate(addresses):
+                self._dns_host = address[4][0]
+                try:
+                    conn = super(_TimedHTTPConnection, self)._new_conn()
+                    break
+                except ConnectTimeoutError:  # Also NewConnectionError, try the next address
+                    if i == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = host
+        _add_connection_time("dns", resolved - start)
+        _add_connection_time("connect", time.time() - resolved)
+        _add_connection_time("connections", 1)
+        return conn
+
+
+class _TimedHTTPSConnection(_TimedHTTPConnection, HTTPSConnection):
+
+    def connect(self):
+        """ the TLS handshake is the time of connect() not creating the socket (_new_conn())
+        """
+        def socket_time():
+            timings = getattr(_connections, "timings", None) or {}
+            return timings.get("dns", 0) + timings.get("connect", 0)
+
+        start, start_socket = time.time(), socket_time()
+        super(_TimedHTTPSConnection, self).connect()
+        _add_connection_time("tls", time.time() - start - (socket_time() - start_socket))
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+_TIMED_POOLS = {"http": _TimedHTTPConnectionPool, "https": _TimedHTTPSConnectionPool}
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """ HTTPAdapter whose connections time their DNS resolution, connection and TLS handshake
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(TimedHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _TIMED_POOLS
+
+    def proxy_manager_for(self, *args, **kwargs):
+        manager = super(TimedHTTPAdapter, self).proxy_manager_for(*args, **kwargs)
+        if hasattr(manager, "pool_classes_by_scheme"):
+            manager.pool_classes_by_scheme = _TIMED_POOLS
+        return manager
+
+
+def endpoint_family(url):
+    path = urlsplit(url).path.rstrip("/")
+    if path.endswith("/ping"):
+        return "ping"
+    if "/users/" in path:
+        return "auth"
+    if "/search" in path:
+        return "search"
+    if path.endswith(("/digest", "conanmanifest.txt")):
+        return "manifest"
+    if path.endswith(("/latest", "/revisions")):
+        return "revisions"
+    if "/files" in path or path.endswith(("/download_urls", "/upload_urls")):
+        return "file"
+    return "other"
+
+
+class _EndpointMetrics(object):
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.connections = 0
+        self.received = 0
+        self.sent = 0
+        self.times = {phase: 0.0 for phase in _PHASES}
+
+    def as_dict(self):
+        result = {"requests": self.requests, "errors": self.errors,
+                  "new_connections": self.connections,
+                  "reused_connections": max(self.requests - self.connections, 0),
+                  "bytes_received": self.received, "bytes_sent": self.sent}
+        result.update({phase: round(t, 4) for phase, t in self.times.items()})
+        return result
+
+
+class HttpMetrics(object):
+    """ collects the metrics of the requests done by the ConanRequester, from all the threads
+    """
+
+    def __init__(self, summary=True, json_file=None):
+        self._summary = summary
+        self._json_file = json_file
+        self._lock = threading.Lock()
+        self._metrics = {}  # {remote: {family: _EndpointMetrics}}
+        self._remotes = []  # [(url, name)], reverse sorted, the more specific urls first
+
+    def set_remotes(self, remotes):
+        self._remotes = sorted(((r.url.rstrip("/"), r.name) for r in remotes.values()),
+                               reverse=True)
+
+    def _remote(self, url):
+        for remote_url, name in self._remotes:
+            if url.startswith(remote_url):
+                return name
+        scheme, netloc, _, _, _ = urlsplit(url)
+        return "%s://%s" % (scheme, netloc)
+
+    @staticmethod
+    def start_request():
+        _connections.timings = {}
+
+    def _add(self, url, function):
+        key = self._remote(url), endpoint_family(url)
+        with self._lock:
+            metrics = self._metrics.setdefault(key[0], {}).get(key[1])
+            if metrics is None:
+                metrics = self._metrics[key[0]][key[1]] = _EndpointMetrics()
+            function(metrics)
+
+    def end_request(self, url, response, duration, streamed, sent):
+        """ records the request, completed unless 'streamed'. The transfer of the streamed
+        responses is timed while they are read
+        """
+        timings = getattr(_connections, "timings", None) or {}
+        _connections.timings = None
+        elapsed = getattr(response, "elapsed", None)
+        elapsed = elapsed.total_seconds() if elapsed is not None else duration
+        connecting = sum(timings.get(phase, 0) for phase in ("dns", "connect", "tls"))
+        received = 0 if streamed else len(getattr(response, "content", None) or b"")
+
+        def record(metrics):
+            metrics.requests += 1
+            metrics.errors += 1 if response is None or response.status_code >= 400 else 0
+            metrics.connections += timings.get("connections", 0)
+            metrics.received += received
+            metrics.sent += sent
+            for phase in ("dns", "connect", "tls"):
+                metrics.times[phase] += timings.get(phase, 0)
+            metrics.times["ttfb"] += max(elapsed - connecting, 0)
+            if not streamed:
+                metrics.times["transfer"] += max(duration - elapsed, 0)
+
+        self._add(url, record)
+        if streamed and response is not None:
+            self._time_transfer(url, response)
+
+    def _time_transfer(self, url, response):
+        iter_content = response.iter_content
+
+        def timed_iter_content(*args, **kwargs):
+            start = time.time()
+            received = 0
+            try:
+                for chunk in iter_content(*args, **kwargs):
+                    received += len(chunk)
+                    yield chunk
+            finally:
+                duration = time.time() - start
+
+                def record(metrics):
+                    metrics.received += received
+                    metrics.times["transfer"] += duration
+                self._add(url, record)
+
+        response.iter_content = timed_iter_content
+
+    def as_dict(self):
+        with self._lock:
+            return {remote: {family: m.as_dict() for family, m in sorted(families.items())}
+                    for remote, families in sorted(self._metrics.items())}
+
+    def report(self, output):
+        """ prints the summary and writes the JSON file, if enabled, with the metrics of the
+        requests done, if any
+        """
+        metrics = self.as_dict()
+        if not metrics:  # Not overwriting the file with the API calls not doing requests
+            return
+        if self._json_file:
+            save(self._json_file, json.dumps(metrics, indent=True))
+        if not self._summary:
+            return
+        output.info("HTTP metrics (seconds):")
+        for remote, families in metrics.items():
+            output.info("  %s" % remote)
+            for family, m in families.items():
+                output.info("    %s: %d requests (%d errors), %d new connections, %d reused, "
+                            "dns %.3f, connect %.3f, tls %.3f, ttfb %.3f, transfer %.3f, "
+                            "received %d bytes, sent %d bytes"
+                            % (family, m["requests"], m["errors"], m["new_connections"],
+                               m["reused_connections"], m["dns"], m["connect"], m["tls"],
+                               m["ttfb"], m["transfer"], m["bytes_received"], m["bytes_sent"]))
@@ -49,6 +49,7 @@ class RestV1Methods(RestCommonMethods):
         retry = self._config.retry
         retry_wait = self._config.retry_wait
         download_cache = self._config.download_cache
+        max_size = self._config.download_cache_max_size if download_cache else None
         for filename, resource_url in sorted(file_urls.items(), reverse=True):
             auth, _ = self._file_server_capabilities(resource_url)
             md5 = snapshot_md5.get(filename, None) if snapshot_md5 else None
@@ -56,6 +57,7 @@ class RestV1Methods(RestCommonMethods):
                 "if download_cache is set, we need the file checksums"
             contents = run_downloader(self.requester, None, self.verify_ssl, retry=retry,
                                       retry_wait=retry_wait, download_cache=download_cache,
+                                      download_cache_max_size=max_size,
                                       url=resource_url, auth=auth, md5=md5)
             yield os.path.normpath(filename), contents
 
@@ -193,6 +195,7 @@ class RestV1Methods(RestCommonMethods):
         retry = self._config.retry
         retry_wait = self._config.retry_wait
         download_cache = self._config.download_cache
+        max_size = self._config.download_cache_max_size if download_cache else None
         for filename, resource_url in sorted(file_urls.items(), reverse=True):
             if self._output and not self._output.is_terminal:
                 self._output.writeln("Downloading %s" % filename)
@@ -203,6 +206,7 @@ class RestV1Methods(RestCommonMethods):
                 "if download_cache is set, we need the file checksums"
             run_downloader(self.requester, self._output, self.verify_ssl, retry=retry,
                            retry_wait=retry_wait, download_cache=download_cache,
+                           download_cache_max_size=max_size,
                            url=resource_url, file_path=abs_path, auth=auth, md5=md5)
             ret[filename] = abs_path
         return ret
@@ -43,8 +43,10 @@ class RestV2Methods(RestCommonMethods):
         retry = self._config.retry
         retry_wait = self._config.retry_wait
         download_cache = False if not use_cache else self._config.download_cache
+        max_size = self._config.download_cache_max_size if download_cache else None
         contents = run_downloader(self.requester, None, self.verify_ssl, retry=retry,
-                                  retry_wait=retry_wait, download_cache=download_cache, url=url,
+                                  retry_wait=retry_wait, download_cache=download_cache,
+                                  download_cache_max_size=max_size, url=url,
                                   auth=self.auth, headers=headers)
         return contents
 
@@ -224,6 +226,7 @@ class RestV2Methods(RestCommonMethods):
         retry = self._config.retry
         retry_wait = self._config.retry_wait
         download_cache = False if not use_cache else self._config.download_cache
+        max_size = self._config.download_cache_max_size if download_cache else None
         for filename in sorted(files, reverse=True):
             if self._output and not self._output.is_terminal:
                 self._output.writeln("Downloading %s" % filename)
@@ -231,6 +234,7 @@ class RestV2Methods(RestCommonMethods):
             abs_path = os.path.join(dest_folder, filename)
             run_downloader(self.requester, self._output, self.verify_ssl, retry=retry,
                            retry_wait=retry_wait, download_cache=download_cache,
+                           download_cache_max_size=max_size,
                            url=resource_url, file_path=abs_path, auth=self.auth)
 
     def _remove_conanfile_files(self, ref, files):
@@ -13,6 +13,8 @@ from conans.paths import CONANFILE, CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME, EXP
 from conans.util.conan_v2_mode import conan_v2_property
 from conans.util.files import (is_dirty, mkdir, rmdir, set_dirty_context_manager,
                                merge_directories, clean_dirty)
+from conans.util.profiler import span
+from conans.util.staging import get_staging_method, STAGING_COPY, STAGING_REFLINK
 
 
 def retrieve_exports_sources(remote_manager, cache, conanfile, ref, remotes):
@@ -106,15 +108,21 @@ def config_source(export_folder, export_source_folder, scm_sources_folder, conan
     if not os.path.exists(conanfile.folders.base_source):  # No source folder, need to get it
         with set_dirty_context_manager(conanfile.folders.base_source):
             mkdir(conanfile.source_folder)
+            # Never hard links from the exports, writing a file in place in source() or build()
+            # would modify the exported recipe and sources, not matching its revision anymore
+            staging = get_staging_method(cache.new_config)
+            staging = STAGING_COPY if staging == STAGING_COPY else STAGING_REFLINK
 
             def get_sources_from_exports():
                 # First of all get the exported scm sources (if auto) or clone (if fixed)
                 _run_cache_scm(conanfile, scm_sources_folder, output)
                 if not hasattr(conanfile, "layout"):
                     # so self exported files have precedence over python_requires ones
-                    merge_directories(export_folder, conanfile.folders.base_source)
+                    merge_directories(export_folder, conanfile.folders.base_source,
+                                      staging=staging)
                 # Now move the export-sources to the right location
-                merge_directories(export_source_folder, conanfile.folders.base_source)
+                merge_directories(export_source_folder, conanfile.folders.base_source,
+                                  staging=staging)
 
             _run_source(conanfile, conanfile_path, hook_manager, reference, cache,
                         get_sources_from_exports=get_sources_from_exports)
@@ -154,7 +162,8 @@ def _run_source(conanfile, conanfile_path, hook_manager, reference, cache,
                                            "'self.settings' access in source() method is deprecated"):
                         with conan_v2_property(conanfile, 'options',
                                                "'self.options' access in source() method is deprecated"):
-                            conanfile.source()
+                            with span("source %s" % conanfile.display_name, "source"):
+                                conanfile.source()
 
                 hook_manager.execute("post_source", conanfile=conanfile,
                                      conanfile_path=conanfile_path,
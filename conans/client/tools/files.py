@@ -13,8 +13,9 @@ from patch_ng import fromfile, fromstring
 
 from conans.client.output import ConanOutput
 from conans.errors import ConanException
+from conans.util.archives import extract_tar, extract_zip, zip_size
 from conans.util.fallbacks import default_output
-from conans.util.files import (_generic_algorithm_sum, load, save)
+from conans.util.files import check_with_algorithm_sum, load, save
 
 UNIT_SIZE = 1000.0
 # Library extensions supported by collect_libs
@@ -104,96 +105,21 @@ def unzip(filename, destination=".", keep_permissions=False, pattern=None, outpu
             pass
 
     with zipfile.ZipFile(filename, "r") as z:
-        zip_info = z.infolist()
-        if pattern:
-            zip_info = [zi for zi in zip_info if fnmatch(zi.filename, pattern)]
-        if strip_root:
-            names = [n.replace("\\", "/") for n in z.namelist()]
-            common_folder = os.path.commonprefix(names).split("/", 1)[0]
-            if not common_folder and len(names) > 1:
-                raise ConanException("The zip file contains more than 1 folder in the root")
-            if len(names) == 1 and len(names[0].split("/", 1)) == 1:
-                raise ConanException("The zip file contains a file in the root")
-            # Remove the directory entry if present
-            # Note: The "zip" format contains the "/" at the end if it is a directory
-            zip_info = [m for m in zip_info if m.filename != (common_folder + "/")]
-            for member in zip_info:
-                name = member.filename.replace("\\", "/")
-                member.filename = name.split("/", 1)[1]
-
-        uncompress_size = sum((file_.file_size for file_ in zip_info))
+        uncompress_size = zip_size(z, pattern)
         if uncompress_size > 100000:
             output.info("Unzipping %s, this can take a while" % human_size(uncompress_size))
         else:
             output.info("Unzipping %s" % human_size(uncompress_size))
-        extracted_size = 0
-
         print_progress.last_size = -1
-        if platform.system() == "Windows":
-            for file_ in zip_info:
-                extracted_size += file_.file_size
-                print_progress(extracted_size, uncompress_size)
-                try:
-                    z.extract(file_, full_path)
-                except Exception as e:
-                    output.error("Error extract %s\n%s" % (file_.filename, str(e)))
-        else:  # duplicated for, to avoid a platform check for each zipped file
-            for file_ in zip_info:
-                extracted_size += file_.file_size
-                print_progress(extracted_size, uncompress_size)
-                try:
-                    z.extract(file_, full_path)
-                    if keep_permissions:
-                        # Could be dangerous if the ZIP has been created in a non nix system
-                        # https://bugs.python.org/issue15795
-                        perm = file_.external_attr >> 16 & 0xFFF
-                        os.chmod(os.path.join(full_path, file_.filename), perm)
-                except Exception as e:
-                    output.error("Error extract %s\n%s" % (file_.filename, str(e)))
+        extract_zip(z, full_path, pattern, strip_root, keep_permissions, output,
+                    lambda extracted_size: print_progress(extracted_size, uncompress_size))
         output.writeln("")
 
 
 def untargz(filename, destination=".", pattern=None, strip_root=False):
     import tarfile
     with tarfile.TarFile.open(filename, 'r:*') as tarredgzippedFile:
-        if not pattern and not strip_root:
-            tarredgzippedFile.extractall(destination)
-        else:
-            members = tarredgzippedFile.getmembers()
-
-            if strip_root:
-                names = [n.replace("\\", "/") for n in tarredgzippedFile.getnames()]
-                common_folder = os.path.commonprefix(names).split("/", 1)[0]
-                if not common_folder and len(names) > 1:
-                    raise ConanException("The tgz file contains more than 1 folder in the root")
-                if len(names) == 1 and len(names[0].split("/", 1)) == 1:
-                    raise ConanException("The tgz file contains a file in the root")
-                # Remove the directory entry if present
-                members = [m for m in members if m.name != common_folder]
-                for member in members:
-                    name = member.name.replace("\\", "/")
-                    member.name = name.split("/", 1)[1]
-                    member.path = member.name
-                    if member.linkpath.startswith(common_folder):
-                        # https://github.com/conan-io/conan/issues/11065
-                        linkpath = member.linkpath.replace("\\", "/")
-                        member.linkpath = linkpath.split("/", 1)[1]
-                        member.linkname = member.linkpath
-            if pattern:
-                members = list(filter(lambda m: fnmatch(m.name, pattern),
-                                      tarredgzippedFile.getmembers()))
-            tarredgzippedFile.extractall(destination, members=members)
-
-
-def check_with_algorithm_sum(algorithm_name, file_path, signature):
-    real_signature = _generic_algorithm_sum(file_path, algorithm_name)
-    if real_signature != signature.lower():
-        raise ConanException("%s signature failed for '%s' file. \n"
-                             " Provided signature: %s  \n"
-                             " Computed signature: %s" % (algorithm_name,
-                                                          os.path.basename(file_path),
-                                                          signature,
-                                                          real_signature))
+        extract_tar(tarredgzippedFile, destination, pattern, strip_root)
 
 
 def check_sha1(file_path, signature):
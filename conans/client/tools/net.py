@@ -1,8 +1,9 @@
 import os
 
-from conans.client.downloaders.download import run_downloader
+from conans.client.downloaders.download import run_downloader, run_extracting_downloader
 from conans.client.tools.files import check_md5, check_sha1, check_sha256, unzip
 from conans.errors import ConanException
+from conans.util.archives import is_tar
 from conans.util.fallbacks import default_output, default_requester
 
 
@@ -19,6 +20,16 @@ def get(url, md5=None, sha1=None, sha256=None, destination=".", filename="", kee
                                  "parameter.".format(url_base))
         filename = os.path.basename(url_base)
 
+    if _extract_while_downloading(url, filename, md5, sha1, sha256):
+        out = default_output(output, 'conans.client.tools.net.get')
+        requester = default_requester(requester, 'conans.client.tools.net.get')
+        if run_extracting_downloader(requester=requester, output=out, verify=verify, url=url,
+                                     filename=filename, destination=destination, pattern=pattern,
+                                     strip_root=strip_root, auth=auth, headers=headers, md5=md5,
+                                     sha1=sha1, sha256=sha256):
+            out.writeln("")
+            return
+
     download(url, filename, out=output, requester=requester, verify=verify, retry=retry,
              retry_wait=retry_wait, overwrite=overwrite, auth=auth, headers=headers,
              md5=md5, sha1=sha1, sha256=sha256)
@@ -27,6 +38,15 @@ def get(url, md5=None, sha1=None, sha256=None, destination=".", filename="", kee
     os.unlink(filename)
 
 
+def _extract_while_downloading(url, filename, md5, sha1, sha256):
+    """ a single URL of a tar archive with a checksum is extracted while downloaded, unless it has
+    to be stored in the download cache
+    """
+    from conans.tools import _global_config as config
+    return (bool(sha256 or sha1 or md5) and is_tar(filename) and not config.download_cache and
+            not isinstance(url, (list, tuple)) and url.startswith(("http://", "https://")))
+
+
 def ftp_download(ip, filename, login='', password=''):
     import ftplib
     try:
@@ -88,11 +108,13 @@ def download(url, filename, verify=True, out=None, retry=None, retry_wait=None,
 
     checksum = sha256 or sha1 or md5
     download_cache = config.download_cache if checksum else None
+    max_size = config.download_cache_max_size if download_cache else None
 
     def _download_file(file_url):
         # The download cache is only used if a checksum is provided, otherwise, a normal download
         run_downloader(requester=requester, output=out, verify=verify,
-                       user_download=True, download_cache=download_cache, url=file_url,
+                       user_download=True, download_cache=download_cache,
+                       download_cache_max_size=max_size, url=file_url,
                        file_path=filename, retry=retry, retry_wait=retry_wait, overwrite=overwrite,
                        auth=auth, headers=headers, md5=md5, sha1=sha1, sha256=sha256)
         out.writeln("")
@@ -1,7 +1,9 @@
 import os
 import platform
 import re
+import threading
 import xml.etree.ElementTree as ET
+from contextlib import contextmanager
 from subprocess import CalledProcessError
 
 from six.moves.urllib.parse import quote_plus, unquote, urlparse
@@ -26,6 +28,120 @@ def _check_repo(cmd, folder):
             raise ConanException(msg)
 
 
+def _git_root(folder):
+    """ the root folder of the git repository containing the folder, None if it is not in one.
+    It doesn't run git, so it can be checked for every recipe
+    """
+    folder = os.path.abspath(folder)
+    while True:
+        if os.path.exists(os.path.join(folder, ".git")):
+            return folder
+        parent = os.path.dirname(folder)
+        if parent == folder:
+            return None
+        folder = parent
+
+
+class GitSnapshot(object):
+    """ state of a git repository, captured once and shared by all the recipes exported from any
+    folder of the repository: the commit, the branch, if there are uncommitted changes and the
+    ignored files (relative to the root), all of them with a single 'git status'. The remotes are
+    requested the first time they are needed
+    """
+
+    def __init__(self, root, commit, branch, pristine, ignored):
+        self.root = root
+        self.commit = commit
+        self.branch = branch
+        self.pristine = pristine
+        self.ignored = ignored
+        self._remotes = None
+
+    @staticmethod
+    def capture(root):
+        try:
+            status = Git(root).run("status --porcelain=v2 --branch --ignored -z")
+        except Exception:
+            raise ConanException("'{0}' is not a valid 'git' repository or 'git' not "
+                                 "found.".format(root))
+        commit = branch = None
+        pristine = True
+        ignored = []
+        entries = iter(status.split("\0"))
+        for entry in entries:
+            if entry.startswith("# branch.oid "):
+                commit = entry.split(" ", 2)[2]
+                commit = None if commit == "(initial)" else commit  # No commits yet
+            elif entry.startswith("# branch.head "):
+                branch = entry.split(" ", 2)[2]
+                branch = None if branch == "(detached)" else branch
+            elif entry.startswith("! "):
+                ignored.append(entry[2:].rstrip("/"))
+            elif entry and not entry.startswith("#"):
+                pristine = False
+                if entry.startswith("2 "):  # Renamed or copied, followed by the original path
+                    next(entries, None)
+        return GitSnapshot(root, commit, branch, pristine, ignored)
+
+    @property
+    def remotes(self):
+        """ the output of 'git remote -v'
+        """
+        if self._remotes is None:
+            self._remotes = Git(self.root).run("remote -v")
+        return self._remotes
+
+    def excluded_files(self, folder):
+        """ the ignored files and folders inside the folder, relative to it
+        """
+        prefix = os.path.relpath(os.path.abspath(folder), self.root).replace("\\", "/")
+        prefix = "" if prefix == "." else prefix + "/"
+        return [path[len(prefix):] for path in self.ignored if path.startswith(prefix)]
+
+
+_scope = threading.local()
+
+
+@contextmanager
+def git_snapshots(snapshots=None):
+    """ inside, the state of every git repository is captured the first time it is used (or
+    taken from the 'snapshots' dict, repository root: GitSnapshot), and reused. Used while
+    exporting recipes, the repositories are not expected to change meanwhile. Without
+    'snapshots', the ones of the enclosing git_snapshots() are used, if any
+    """
+    previous = getattr(_scope, "snapshots", None)
+    if snapshots is None:
+        snapshots = previous if previous is not None else {}
+    _scope.snapshots = snapshots
+    try:
+        yield _scope.snapshots
+    finally:
+        _scope.snapshots = previous
+
+
+def capture_git_snapshots(folders):
+    """ the snapshots of the repositories containing the folders, to share them with
+    git_snapshots()
+    """
+    snapshots = {}
+    for root in set(filter(None, (_git_root(f) for f in folders))):
+        _capture_snapshot(snapshots, root)
+    return snapshots
+
+
+def _capture_snapshot(snapshots, root):
+    """ the snapshot of the repository, captured the first time. If it cannot be captured (e.g.
+    'git' older than 2.11, without 'status --porcelain=v2'), it is None, and the Git methods run
+    their own commands
+    """
+    if root not in snapshots:
+        try:
+            snapshots[root] = GitSnapshot.capture(root)
+        except ConanException:
+            snapshots[root] = None
+    return snapshots[root]
+
+
 class SCMBase(object):
     cmd_command = None
 
@@ -230,6 +346,9 @@ class Git(SCMBase):
                                  % submodule)
 
     def excluded_files(self):
+        snapshot = self._snapshot()
+        if snapshot is not None:
+            return snapshot.excluded_files(self.folder)
         ret = []
         try:
             file_paths = [os.path.normpath(
@@ -252,7 +371,8 @@ class Git(SCMBase):
     def get_remote_url(self, remote_name=None, remove_credentials=False):
         self.check_repo()
         remote_name = remote_name or "origin"
-        remotes = self.run("remote -v")
+        snapshot = self._snapshot()
+        remotes = snapshot.remotes if snapshot is not None else self.run("remote -v")
         for remote in remotes.splitlines():
             name, url = remote.split(None, 1)
             if name == remote_name:
@@ -268,7 +388,19 @@ class Git(SCMBase):
         url = self.get_remote_url()
         return os.path.exists(url)
 
+    def _snapshot(self):
+        snapshots = getattr(_scope, "snapshots", None)
+        if snapshots is None or self._runner is not None:
+            return None
+        root = _git_root(self.folder)
+        if root is None:
+            return None
+        return _capture_snapshot(snapshots, root)
+
     def get_commit(self):
+        snapshot = self._snapshot()
+        if snapshot is not None and snapshot.commit is not None:
+            return snapshot.commit
         self.check_repo()
         try:
             commit = self.run("rev-parse HEAD")
@@ -288,6 +420,9 @@ class Git(SCMBase):
             return None
 
     def is_pristine(self):
+        snapshot = self._snapshot()
+        if snapshot is not None:
+            return snapshot.pristine
         self.check_repo()
         status = self.run("status --porcelain").strip()
         if not status:
@@ -296,10 +431,16 @@ class Git(SCMBase):
             return False
 
     def get_repo_root(self):
+        snapshot = self._snapshot()
+        if snapshot is not None:
+            return snapshot.root
         self.check_repo()
         return self.run("rev-parse --show-toplevel")
 
     def get_branch(self):
+        snapshot = self._snapshot()
+        if snapshot is not None and snapshot.branch is not None:
+            return snapshot.branch
         self.check_repo()
         try:
             status = self.run("status -bs --porcelain")
@@ -320,6 +461,8 @@ class Git(SCMBase):
 
     def check_repo(self):
         """ Check if it is a valid GIT repo """
+        if self._snapshot() is not None:
+            return
         _check_repo(["git", "status"], folder=self.folder)
 
 
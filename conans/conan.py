@@ -1,14 +1,31 @@
 import sys
 import os
 
-if os.getenv("CONAN_V2_CLI"):
-    from conans.cli.cli import main
-else:
-    from conans.client.command import main
-
 
 def run():
-    main(sys.argv[1:])
+    args = sys.argv[1:]
+    if not os.getenv("CONAN_V2_CLI"):
+        if args in (["-v"], ["--version"]):
+            # Fast path, no need to load the whole client just to print the version
+            from conans import __version__
+            sys.stdout.write("Conan version %s\n" % __version__)
+            sys.exit(0)
+        if args[:1] != ["daemon"]:
+            # If there is a daemon serving this cache, it will run the command
+            from conans.client.daemon import forward
+            from conans.paths import get_conan_user_home
+            exit_code = forward(os.path.join(get_conan_user_home(), ".conan"), args)
+            if exit_code is not None:
+                sys.exit(exit_code)
+    main(args)
+
+
+def main(args):
+    if os.getenv("CONAN_V2_CLI"):
+        from conans.cli.cli import main as cli_main
+    else:
+        from conans.client.command import main as cli_main
+    cli_main(args)
 
 
 if __name__ == '__main__':
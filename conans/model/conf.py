@@ -11,6 +11,8 @@ BUILT_IN_CONFS = {
     "core.package_id:msvc_visual_incompatible": "Allows opting-out the fallback from the new msvc compiler to the Visual Studio compiler existing binaries",
     "core:default_profile": "Defines the default host profile ('default' by default)",
     "core:default_build_profile": "Defines the default build profile (None by default)",
+    "core.sources:staging": "Method to stage the sources from the export to the source folder and to the build folders: 'copy' (default), 'reflink' (copy-on-write clones if the file system supports them, copy otherwise) or 'auto' (reflink, otherwise hard links, otherwise copy)",
+    "core.install:fingerprint": "Skip consumer 'conan install' if its inputs and the installed packages didn't change since the previous one (False by default)",
     "tools.android:ndk_path": "Argument for the CMAKE_ANDROID_NDK",
     "tools.build:skip_test": "Do not execute CMake.test() and Meson.test() when enabled",
     "tools.build:jobs": "Default compile jobs number -jX Ninja, Make, /MP VS (default: max CPUs)",
@@ -25,6 +27,7 @@ BUILT_IN_CONFS = {
     "tools.cmake.cmaketoolchain.presets:max_schema_version": "Generate CMakeUserPreset.json compatible with the supplied schema version",
     "tools.env.virtualenv:auto_use": "Automatically activate virtualenv file generation",
     "tools.cmake.cmake_layout:build_folder_vars": "Settings and Options that will produce a different build folder and different CMake presets names",
+    "tools.generators:parallel": "Number of threads to compute the content of several built-in legacy generators concurrently (the number of CPUs by default, 1 to compute them sequentially)",
     "tools.files.download:retry": "Number of retries in case of failure when downloading",
     "tools.files.download:retry_wait": "Seconds to wait between download attempts",
     "tools.gnu:make_program": "Indicate path to make program",
@@ -64,6 +67,8 @@ BUILT_IN_CONFS = {
     "tools.meson.mesontoolchain:backend": "Set the Meson backend. Possible values: 'ninja', 'vs', 'vs2010', 'vs2015', 'vs2017', 'vs2019', 'xcode'",
     "tools.meson.mesontoolchain:extra_machine_files": "List of paths for any additional native/cross file references to be appended to the existing Conan ones",
     "tools.files.download:download_cache": "Location for the download cache",
+    "tools.files.get:extracted_cache": "Folder to keep the archives extracted by get() with a checksum, the next get() of the same archive copies them from there, or clones them with reflinks if allowed by 'core.sources:staging'",
+    "tools.files.get:extracted_cache_max_size": "Maximum size in MB of the 'tools.files.get:extracted_cache', the least recently used archives are removed when exceeded",
     "tools.build.cross_building:can_run": "Set the return value for the 'conan.tools.build.can_run()' tool",
 }
 
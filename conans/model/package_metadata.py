@@ -74,6 +74,14 @@ class _BinaryPackageMetadata(object):
         return ret
 
 
+class _SharedPackages(dict):
+    """ packages of a metadata shared by several readers. Missing package IDs return an empty
+    metadata, like the defaultdict of a PackageMetadata, but they are not added to it
+    """
+    def __missing__(self, package_id):
+        return _BinaryPackageMetadata()
+
+
 class PackageMetadata(object):
 
     def __init__(self):
@@ -105,6 +113,13 @@ class PackageMetadata(object):
         self.recipe = _RecipeMetadata()
         self.packages = defaultdict(_BinaryPackageMetadata)
 
+    def shared(self):
+        """ makes this metadata safe to be shared by several readers, reading missing packages
+        doesn't modify it
+        """
+        self.packages = _SharedPackages(self.packages)
+        return self
+
     def clear_package(self, package_id):
         if package_id in self.packages:
             del self.packages[package_id]
@@ -1,5 +1,3 @@
-import yaml
-
 from conans.errors import ConanException
 from conans.model.values import Values
 
@@ -246,6 +244,7 @@ class Settings(object):
 
     @staticmethod
     def loads(text):
+        import yaml
         try:
             return Settings(yaml.safe_load(text) or {})
         except (yaml.YAMLError, AttributeError) as ye:
@@ -39,12 +39,26 @@ def short_path(func):
 class PackageCacheLayout(object):
     """ This is the package layout for Conan cache """
 
-    def __init__(self, base_folder, ref, short_paths, no_lock):
+    def __init__(self, base_folder, ref, short_paths, no_lock, metadata_cache=None, trash=None):
+        """ metadata_cache: {metadata_path: (stat_key, PackageMetadata)} dict to share the loaded
+        metadata among the layouts of the same ClientCache
+        trash: Trash of the cache where the removed folders are moved, if None they are removed
+        in place
+        """
         assert isinstance(ref, ConanFileReference)
         self._ref = ref
         self._base_folder = os.path.normpath(base_folder)
         self._short_paths = short_paths
         self._no_lock = no_lock
+        self._metadata_cache = metadata_cache if metadata_cache is not None else {}
+        self._trash = trash
+
+    def remove_folder(self, path):
+        """ removes a folder of this layout, moving it to the trash if the cache has one """
+        if self._trash is not None:
+            self._trash.discard(path)
+        else:
+            rm_conandir(path)
 
     @property
     def ref(self):
@@ -139,11 +153,11 @@ class PackageCacheLayout(object):
         assert pref.ref == self._ref, "{!r} != {!r}".format(pref.ref, self._ref)
         # Remove the tgz storage
         tgz_folder = self.download_package(pref)
-        rmdir(tgz_folder)
+        self.remove_folder(tgz_folder)
         # This is NOT the short paths, but the standard cache one
         pkg_folder = os.path.join(self._base_folder, PACKAGES_FOLDER, pref.id)
         try:
-            rm_conandir(pkg_folder)  # This will remove the shortened path too if exists
+            self.remove_folder(pkg_folder)  # This will remove the shortened path too if exists
         except OSError as e:
             raise ConanException("%s\n\nFolder: %s\n"
                                  "Couldn't remove folder, might be busy or open\n"
@@ -157,28 +171,32 @@ class PackageCacheLayout(object):
     def sources_remove(self):
         src_folder = os.path.join(self._base_folder, SRC_FOLDER)
         try:
-            rm_conandir(src_folder)  # This will remove the shortened path too if exists
+            self.remove_folder(src_folder)  # This will remove the shortened path too if exists
         except OSError as e:
             raise ConanException("%s\n\nFolder: %s\n"
                                  "Couldn't remove folder, might be busy or open\n"
                                  "Close any app using it, and retry" % (src_folder, str(e)))
         scm_folder = os.path.join(self._base_folder, SCM_SRC_FOLDER)
         try:
-            rm_conandir(scm_folder)  # This will remove the shortened path too if exists
+            self.remove_folder(scm_folder)  # This will remove the shortened path too if exists
         except OSError as e:
             raise ConanException("%s\n\nFolder: %s\n"
                                  "Couldn't remove folder, might be busy or open\n"
                                  "Close any app using it, and retry" % (scm_folder, str(e)))
 
-    def export_remove(self):
+    def export_remove(self, keep_download=False):
+        """ keep_download: do not remove the compressed files of the recipe, as they will be
+        removed later only if the recipe changes
+        """
         export_folder = self.export()
-        rmdir(export_folder)
+        self.remove_folder(export_folder)
         export_src_folder = os.path.join(self._base_folder, EXPORT_SRC_FOLDER)
-        rm_conandir(export_src_folder)
-        download_export = self.download_export()
-        rmdir(download_export)
+        self.remove_folder(export_src_folder)
+        if not keep_download:
+            download_export = self.download_export()
+            self.remove_folder(download_export)
         scm_folder = os.path.join(self._base_folder, SCM_SRC_FOLDER)
-        rm_conandir(scm_folder)
+        self.remove_folder(scm_folder)
 
     def package_metadata(self):
         return os.path.join(self._base_folder, PACKAGE_METADATA)
@@ -238,6 +256,23 @@ class PackageCacheLayout(object):
 
     # Metadata
     def load_metadata(self):
+        """ The metadata is parsed only once while the file is not modified, the returned object
+        is shared with other readers and must not be modified, use update_metadata() instead
+        """
+        metadata_path = self.package_metadata()
+        try:
+            st = os.stat(metadata_path)
+        except OSError:
+            raise RecipeNotFoundException(self._ref)
+        stat_key = st.st_mtime_ns, st.st_size, st.st_ino
+        cached = self._metadata_cache.get(metadata_path)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+        metadata = self._read_metadata().shared()
+        self._metadata_cache[metadata_path] = stat_key, metadata
+        return metadata
+
+    def _read_metadata(self):
         try:
             text = load(self.package_metadata())
         except IOError:
@@ -256,11 +291,12 @@ class PackageCacheLayout(object):
             thread_lock.acquire()
             try:
                 try:
-                    metadata = self.load_metadata()
+                    metadata = self._read_metadata()
                 except RecipeNotFoundException:
                     metadata = PackageMetadata()
                 yield metadata
                 save(metadata_path, metadata.dumps())
+                self._metadata_cache.pop(metadata_path, None)
             finally:
                 thread_lock.release()
 
@@ -1,3 +1,4 @@
+import json
 import os
 import textwrap
 import time
@@ -8,7 +9,8 @@ from threading import Thread
 from bottle import static_file, request
 import pytest
 
-from conans.client.downloaders.cached_file_downloader import CachedFileDownloader
+from conans.client.downloaders.cached_file_downloader import CachedFileDownloader, \
+    DOWNLOAD_CACHE_INDEX, DOWNLOAD_CACHE_STATS
 from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import TestClient, StoppableThreadBottle
@@ -39,8 +41,8 @@ class DownloadCacheTest(unittest.TestCase):
         client.run("install mypkg/0.1@user/testing")
         content = load(log_trace_file)
         self.assertEqual(6, content.count('"_action": "DOWNLOAD"'))
-        # 6 files cached, plus "locks" folder = 7
-        self.assertEqual(7, len(os.listdir(cache_folder)))
+        # 6 files cached, plus "locks" folder and index = 8
+        self.assertEqual(8, len(os.listdir(cache_folder)))
 
         os.remove(log_trace_file)
         client.run("remove * -f")
@@ -170,9 +172,8 @@ class DownloadCacheTest(unittest.TestCase):
         self.assertTrue(os.path.exists(local_path2))
         self.assertEqual("some query", client.load("myfile2.txt"))
 
-        # 2 files cached, plus "locks" folder = 3
-        # "locks" folder + 2 files cached + .dirty file from previous failure
-        self.assertEqual(4, len(os.listdir(cache_folder)))
+        # "locks" folder + index + 2 files cached + .dirty file from previous failure
+        self.assertEqual(5, len(os.listdir(cache_folder)))
 
         # remove remote file
         os.remove(file_path)
@@ -247,9 +248,8 @@ class DownloadCacheTest(unittest.TestCase):
         self.assertTrue(os.path.exists(local_path2))
         self.assertEqual("some query", client.load("myfile2.txt"))
 
-        # 2 files cached, plus "locks" folder = 3
-        # "locks" folder + 2 files cached + .dirty file from previous failure
-        self.assertEqual(4, len(os.listdir(cache_folder)))
+        # "locks" folder + index + 2 files cached + .dirty file from previous failure
+        self.assertEqual(5, len(os.listdir(cache_folder)))
 
         # remove remote file
         os.remove(file_path)
@@ -387,3 +387,103 @@ class CachedDownloaderUnitTest(unittest.TestCase):
         self.cached_downloader.download("testurl", file_path)
         self.assertEqual(self.file_downloader.calls["testurl"], 1)
         self.assertEqual("testurl", load(file_path))
+
+    def test_lru_eviction(self):
+        cache_folder = temp_folder()
+        cached_downloader = CachedFileDownloader(cache_folder, self.file_downloader,
+                                                 max_size=len("testurl1") * 2)
+        folder = temp_folder()
+        for url in ("testurl1", "testurl2", "testurl1", "testurl3"):
+            file_path = os.path.join(folder, url)
+            cached_downloader.download(url, file_path)
+            self.assertEqual(url, load(file_path))
+        # testurl2 was the least recently used, evicted when testurl3 was downloaded
+        self.assertEqual(self.file_downloader.calls["testurl1"], 1)
+        cached_downloader.download("testurl2")
+        self.assertEqual(self.file_downloader.calls["testurl2"], 2)
+        cached_downloader.download("testurl3")
+        self.assertEqual(self.file_downloader.calls["testurl3"], 1)
+
+        stats = cached_downloader.stats()
+        self.assertEqual(stats["files"], 2)
+        self.assertEqual(stats["size"], len("testurl1") * 2)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 4)
+        self.assertEqual(stats["bytes_saved"], len("testurl1") * 2)
+        self.assertEqual(stats["evictions"], 2)
+
+    def test_unbounded_cache_hits_not_indexed(self):
+        cache_folder = temp_folder()
+        cached_downloader = CachedFileDownloader(cache_folder, self.file_downloader)
+        cached_downloader.download("testurl")
+        index_path = os.path.join(cache_folder, DOWNLOAD_CACHE_INDEX)
+        index = json.loads(load(index_path))
+        self.assertEqual(len(index["entries"]), 1)
+        # Only the eviction needs the accesses, the hits don't write the index
+        os.remove(index_path)
+        cached_downloader.download("testurl")
+        self.assertEqual(self.file_downloader.calls["testurl"], 1)
+        self.assertFalse(os.path.exists(index_path))
+        # But they are counted
+        cached_downloader.download("testurl")
+        stats = cached_downloader.stats()
+        self.assertEqual(stats["files"], 1)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["bytes_saved"], 2 * len("testurl"))
+        self.assertFalse(os.path.exists(index_path))
+        # Merged into the index the next time it is written
+        cached_downloader.download("otherurl")
+        index = json.loads(load(index_path))
+        self.assertEqual(index["hits"], 2)
+        self.assertEqual(index["misses"], 1)
+        self.assertFalse(os.path.exists(os.path.join(cache_folder, DOWNLOAD_CACHE_STATS)))
+        self.assertEqual(cached_downloader.stats()["hits"], 2)
+
+    def test_broken_index(self):
+        cache_folder = temp_folder()
+        cached_downloader = CachedFileDownloader(cache_folder, self.file_downloader,
+                                                 max_size=1000)
+        cached_downloader.download("testurl")
+        # Written with a temporary file and a rename, that doesn't remain
+        index_files = [f for f in os.listdir(cache_folder) if f.startswith(DOWNLOAD_CACHE_INDEX)]
+        self.assertEqual(index_files, [DOWNLOAD_CACHE_INDEX])
+        save(os.path.join(cache_folder, DOWNLOAD_CACHE_INDEX), "broken")
+        # The index is created again from the cached files
+        self.assertEqual(cached_downloader.stats()["files"], 1)
+        cached_downloader.download("testurl")
+        self.assertEqual(self.file_downloader.calls["testurl"], 1)
+        self.assertEqual(cached_downloader.stats()["hits"], 1)
+
+
+def test_download_stats():
+    client = TestClient(default_server_user=True)
+    client.run("config download-stats", assert_error=True)
+    assert "ERROR: There is no download cache" in client.out
+
+    client.save({"conanfile.py": GenConanfile()})
+    client.run("create . pkg/0.1@")
+    client.run("upload * --all -c")
+    cache_folder = temp_folder()
+    client.run('config set storage.download_cache="%s"' % cache_folder)
+    client.run("config set storage.download_cache_max_size=100")
+    client.run("remove * -f")
+    client.run("install pkg/0.1@")
+    client.run("remove * -f")
+    client.run("install pkg/0.1@")
+    client.run("config download-stats --json=stats.json")
+    assert "Download cache: %s" % cache_folder in client.out
+    assert "max size: unlimited" not in client.out
+    stats = json.loads(client.load("stats.json"))
+    assert stats["max_size"] == 100 * 1024 * 1024
+    assert stats["hits"] > 0 and stats["misses"] > 0
+    assert stats["files"] == stats["misses"]
+
+    client.run("config rm storage.download_cache_max_size")
+    client.run("remove * -f")
+    client.run("install pkg/0.1@")
+    client.run("config download-stats --json=stats.json")
+    assert "max size: unlimited" in client.out
+    unbounded_stats = json.loads(client.load("stats.json"))
+    assert unbounded_stats["max_size"] is None
+    assert unbounded_stats["hits"] > stats["hits"]
+    assert unbounded_stats["misses"] == stats["misses"]
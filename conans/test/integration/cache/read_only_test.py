@@ -58,3 +58,23 @@ class MyPkg(ConanFile):
             save(path, "Bye World")
         os.chmod(path, 0o777)
         save(path, "Bye World")
+
+    def test_hardlink_imports(self):
+        self.client.run("config set general.hardlink_imports=True")
+        conanfile = """from conans import ConanFile
+class Consumer(ConanFile):
+    requires = "Pkg/0.1@lasote/channel"
+    def imports(self):
+        self.copy("*.h", dst="include")
+"""
+        self.client.save({"conanfile.py": conanfile}, clean_first=True)
+        self.client.run("install .")
+        pref = PackageReference(ConanFileReference.loads("Pkg/0.1@lasote/channel"),
+                                NO_SETTINGS_PACKAGE_ID)
+        path = os.path.join(self.client.cache.package_layout(pref.ref).package(pref), "myheader.h")
+        imported = os.path.join(self.client.current_folder, "include", "myheader.h")
+        self.assertTrue(os.path.samefile(path, imported))
+
+        self.client.run("config set general.read_only_cache=False")
+        self.client.run("install .")
+        self.assertFalse(os.path.samefile(path, imported))
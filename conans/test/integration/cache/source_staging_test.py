@@ -0,0 +1,47 @@
+import os
+import textwrap
+
+from conans.model.ref import ConanFileReference
+from conans.test.utils.tools import TestClient
+
+
+def test_source_staging_hardlinks():
+    """ The sources of every configuration built in the cache are hard links to the same files
+    of the source folder, the build can modify them with the Conan helpers without modifying the
+    other ones. The exported files are never linked, they must not change
+    """
+    client = TestClient()
+    conanfile = textwrap.dedent("""
+        import os
+        from conans import ConanFile, tools
+
+        class Pkg(ConanFile):
+            settings = "build_type"
+            exports_sources = "*.txt"
+
+            def build(self):
+                tools.replace_in_file("source.txt", "source", str(self.settings.build_type))
+                self.output.info("BUILT: %s" % tools.load("source.txt"))
+                with open("conanfile.py", "a") as f:  # Not protected, but never the exported one
+                    f.write("# Modified")
+        """)
+    client.save({"conanfile.py": conanfile,
+                 "source.txt": "source contents"})
+    client.save({"global.conf": "core.sources:staging=auto"}, path=client.cache.cache_folder)
+    client.run("create . pkg/0.1@ -s build_type=Release")
+    assert "pkg/0.1: BUILT: Release contents" in client.out
+    client.run("create . pkg/0.1@ -s build_type=Debug --keep-source")
+    assert "pkg/0.1: BUILT: Debug contents" in client.out
+
+    layout = client.cache.package_layout(ConanFileReference.loads("pkg/0.1"))
+    export_source = os.path.join(layout.export_sources(), "source.txt")
+    source = os.path.join(layout.source(), "source.txt")
+    assert client.load(export_source) == "source contents"
+    assert client.load(source) == "source contents"
+    assert client.load(layout.conanfile()) == conanfile
+    assert not os.path.samefile(export_source, source)
+    assert os.stat(export_source).st_nlink == 1
+    assert os.stat(layout.conanfile()).st_nlink == 1
+    for build_folder in os.listdir(layout.builds()):
+        build_conanfile = os.path.join(layout.builds(), build_folder, "conanfile.py")
+        assert not os.path.samefile(build_conanfile, layout.conanfile())
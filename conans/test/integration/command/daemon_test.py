@@ -0,0 +1,141 @@
+import os
+import platform
+import signal
+import stat
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from conans.cli.exit_codes import USER_CTRL_C
+from conans.client.daemon import daemon_socket_path, daemon_status, start_daemon, stop_daemon
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, save
+
+
+def _conan_process(user_home, cwd, args, env=None):
+    """ launches the real 'conan' entry point in a new process, as the thin client does
+    """
+    process_env = dict(os.environ, CONAN_USER_HOME=user_home, PYTHONPATH=os.pathsep.join(sys.path))
+    process_env.update(env or {})
+    return subprocess.Popen([sys.executable, "-c", "from conans.conan import run; run()"] + args,
+                            cwd=cwd, env=process_env, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT)
+
+
+def _conan(user_home, cwd, args, env=None):
+    process = _conan_process(user_home, cwd, args, env)
+    out, _ = process.communicate()
+    return process.returncode, out.decode()
+
+
+def _wait_for(path, timeout=60):
+    deadline = time.time() + timeout
+    while not os.path.exists(path):
+        assert time.time() < deadline, "Timeout waiting for %s" % path
+        time.sleep(0.1)
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="Unix sockets")
+def test_daemon():
+    user_home = temp_folder(path_with_spaces=False)
+    cache_folder = os.path.join(user_home, ".conan")
+    cwd = temp_folder()
+    conanfile = textwrap.dedent("""
+        import os
+        from conans import ConanFile
+
+        class Pkg(ConanFile):
+            name = "pkg"
+            description = "%s-%s" % (os.getpid(), os.getenv("MY_VAR"))
+        """)
+    save(os.path.join(cwd, "conanfile.py"), conanfile)
+
+    assert daemon_status(cache_folder) is None
+    pid = start_daemon(cache_folder)
+    try:
+        assert daemon_status(cache_folder) == pid
+        # Only the owner can connect
+        assert stat.S_IMODE(os.stat(daemon_socket_path(cache_folder)).st_mode) == 0o600
+        # The command runs in the daemon process, with the client folder and environment
+        code, out = _conan(user_home, cwd, ["inspect", ".", "-a", "description"],
+                           env={"MY_VAR": "value1"})
+        assert code == 0
+        assert "description: %s-value1" % pid in out
+        code, out = _conan(user_home, cwd, ["inspect", ".", "-a", "description"],
+                           env={"MY_VAR": "value2"})
+        assert "description: %s-value2" % pid in out
+
+        code, out = _conan(user_home, cwd, ["unknown"])
+        assert code == 1
+        assert "'unknown' is not a Conan command" in out
+
+        code, out = _conan(user_home, cwd, ["daemon", "status"])
+        assert "Conan daemon running (pid %s)" % pid in out
+    finally:
+        assert stop_daemon(cache_folder) == pid
+
+    assert daemon_status(cache_folder) is None
+    # Without daemon, the command runs in the client process
+    code, out = _conan(user_home, cwd, ["inspect", ".", "-a", "description"],
+                       env={"MY_VAR": "value3"})
+    assert code == 0
+    assert "description: %s-value3" % pid not in out
+    assert "-value3" in out
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="Unix sockets")
+def test_daemon_busy_and_interrupted():
+    user_home = temp_folder(path_with_spaces=False)
+    cache_folder = os.path.join(user_home, ".conan")
+    cwd = temp_folder()
+    conanfile = textwrap.dedent("""
+        import os
+        import subprocess
+        import sys
+        import time
+        from conans import ConanFile
+
+        class Pkg(ConanFile):
+            name = "pkg"
+            description = str(os.getpid())
+
+            def source(self):
+                # A build tool, that has to be interrupted too
+                subprocess.Popen([sys.executable, "-c", "import time\\n"
+                                  "for i in range(600):\\n"
+                                  "    open('counter', 'w').write(str(i))\\n"
+                                  "    time.sleep(0.1)"])
+                time.sleep(60)
+                open("finished", "w").write("")
+        """)
+    save(os.path.join(cwd, "conanfile.py"), conanfile)
+
+    pid = start_daemon(cache_folder)
+    try:
+        process = _conan_process(user_home, cwd, ["source", "."])
+        _wait_for(os.path.join(cwd, "counter"))
+
+        # While busy, the other commands run in their own process
+        code, out = _conan(user_home, cwd, ["inspect", ".", "-a", "description"])
+        assert code == 0
+        assert "description: " in out
+        assert "description: %s" % pid not in out
+
+        # Interrupting the client aborts the command in the daemon, and its subprocesses
+        process.send_signal(signal.SIGINT)
+        out, _ = process.communicate(timeout=60)
+        assert process.returncode == USER_CTRL_C
+        assert "You pressed Ctrl+C!" in out.decode()
+        counter = load(os.path.join(cwd, "counter"))
+        time.sleep(0.5)
+        assert load(os.path.join(cwd, "counter")) == counter
+        assert not os.path.exists(os.path.join(cwd, "finished"))
+
+        # The daemon keeps serving
+        code, out = _conan(user_home, cwd, ["inspect", ".", "-a", "description"])
+        assert "description: %s" % pid in out
+    finally:
+        assert stop_daemon(cache_folder) == pid
@@ -0,0 +1,69 @@
+import os
+import textwrap
+
+import pytest
+from mock import patch
+
+from conans.client.tools.scm import SCMBase
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.scm import create_local_git_repo
+from conans.test.utils.tools import TestClient
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_export_batch(jobs):
+    client = TestClient()
+    for name in ("pkga", "pkgb", "pkgc"):
+        client.save({"%s/conanfile.py" % name: GenConanfile(name, "0.1")})
+    client.run("export-batch pkga pkgb pkgc/conanfile.py --user=user --channel=testing -j %s"
+               % jobs)
+    for name in ("pkga", "pkgb", "pkgc"):
+        assert "%s/0.1@user/testing: Exported revision" % name in client.out
+    assert "Exported 3 recipes" in client.out
+    # The output of the recipes is not mixed
+    out = str(client.out)
+    assert out.index("pkga/0.1@user/testing: Exported revision") < \
+        out.index("pkgb/0.1@user/testing: A new conanfile.py version was exported")
+
+    client.run("search")
+    for name in ("pkga", "pkgb", "pkgc"):
+        assert "%s/0.1@user/testing" % name in client.out
+
+
+@pytest.mark.tool_git
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_export_batch_scm_revision(jobs):
+    conanfile = textwrap.dedent("""
+        from conans import ConanFile
+        class Pkg(ConanFile):
+            name = "{}"
+            version = "0.1"
+            revision_mode = "scm"
+        """)
+    files = {"%s/conanfile.py" % name: conanfile.format(name) for name in ("pkga", "pkgb")}
+    folder, commit = create_local_git_repo(files)
+    client = TestClient(current_folder=folder)
+
+    run = SCMBase.run
+    with patch.object(SCMBase, "run", autospec=True, side_effect=run) as git_run:
+        client.run("export-batch pkga pkgb -j %s" % jobs)
+    assert str(client.out).count(": Exported revision: %s" % commit) == 2
+    # A single 'git status' for all the recipes of the repository
+    commands = [call[0][1] for call in git_run.call_args_list]
+    assert len(commands) == 1
+    assert commands[0].endswith("status --porcelain=v2 --branch --ignored -z")
+
+
+def test_export_batch_errors():
+    client = TestClient()
+    client.save({"pkga/conanfile.py": GenConanfile("pkga", "0.1"),
+                 "pkgb/conanfile.py": GenConanfile()})
+    client.run("export-batch pkga pkgb -j 2", assert_error=True)
+    assert "pkga/0.1: Exported revision" in client.out
+    assert "ERROR: Export of '%s' failed" % os.path.join(client.current_folder, "pkgb",
+                                                         "conanfile.py") in client.out
+    assert "conanfile didn't specify name" in client.out
+    assert "Errors exporting some recipes" in client.out
+
+    client.run("export-batch pkga --user=user", assert_error=True)
+    assert "Specify both --user and --channel, or none of them" in client.out
@@ -0,0 +1,188 @@
+import json
+import os
+import shutil
+import textwrap
+
+import pytest
+
+from conans.client.install_fingerprint import FINGERPRINT_FILE
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient, NO_SETTINGS_PACKAGE_ID
+from conans.util.files import save
+
+SKIP_MSG = "Install inputs and installed packages unchanged, skipping install"
+
+
+@pytest.fixture
+def client():
+    c = TestClient()
+    save(c.cache.new_config_path, "core.install:fingerprint=True")
+    c.save({"dep/conanfile.py": GenConanfile("dep", "0.1"),
+            "conanfile.py": GenConanfile().with_requires("dep/0.1")})
+    c.run("create dep")
+    return c
+
+
+def test_install_fingerprint_skip(client):
+    client.run("install .")
+    assert SKIP_MSG not in client.out
+    assert os.path.isfile(os.path.join(client.current_folder, FINGERPRINT_FILE))
+    client.run("install .")
+    assert SKIP_MSG in client.out
+    assert "dep/0.1" not in client.out
+
+    # Changing any input will install again
+    client.run("install . -s build_type=Debug")
+    assert SKIP_MSG not in client.out
+    client.run("install . -s build_type=Debug")
+    assert SKIP_MSG in client.out
+    client.run("install . -s build_type=Debug -g cmake")
+    assert SKIP_MSG not in client.out
+    client.run("install . -s build_type=Debug -g cmake --build=dep")
+    assert SKIP_MSG not in client.out
+    client.run("install . -s build_type=Debug -g cmake --build=missing")
+    assert SKIP_MSG in client.out
+
+
+def test_install_fingerprint_changed_conanfile(client):
+    client.run("install .")
+    client.save({"conanfile.py": GenConanfile().with_requires("dep/0.1")
+                                               .with_settings("os")})
+    client.run("install .")
+    assert SKIP_MSG not in client.out
+
+
+def test_install_fingerprint_removed_package(client):
+    client.run("install .")
+    client.run("remove dep/0.1 -p -f")
+    client.run("install .", assert_error=True)
+    assert SKIP_MSG not in client.out
+    assert "Missing prebuilt package for 'dep/0.1'" in client.out
+    # The failed install doesn't leave a fingerprint
+    assert not os.path.exists(os.path.join(client.current_folder, FINGERPRINT_FILE))
+
+
+def test_install_fingerprint_new_revision(client):
+    client.run("install .")
+    client.save({"dep/conanfile.py": GenConanfile("dep", "0.1").with_package_file("file.txt",
+                                                                                "contents")})
+    client.run("create dep")
+    client.run("install .")
+    assert SKIP_MSG not in client.out
+
+
+def test_install_fingerprint_disabled():
+    client = TestClient()
+    client.save({"conanfile.txt": ""})
+    client.run("install .")
+    client.run("install .")
+    assert SKIP_MSG not in client.out
+    assert not os.path.exists(os.path.join(client.current_folder, FINGERPRINT_FILE))
+
+
+def test_install_fingerprint_editable(client):
+    client.run("editable add dep dep/0.1@")
+    client.run("install .")
+    client.run("install .")
+    assert SKIP_MSG not in client.out
+    assert not os.path.exists(os.path.join(client.current_folder, FINGERPRINT_FILE))
+
+
+def test_install_fingerprint_removed_outputs(client):
+    client.run("install .")
+    os.remove(os.path.join(client.current_folder, "conanbuildinfo.txt"))
+    client.run("install .")
+    assert SKIP_MSG not in client.out
+    assert os.path.isfile(os.path.join(client.current_folder, "conanbuildinfo.txt"))
+    client.run("install .")
+    assert SKIP_MSG in client.out
+
+
+def test_install_fingerprint_layout_generators(client):
+    conanfile = textwrap.dedent("""
+        from conans import ConanFile
+        from conan.tools.cmake import cmake_layout
+
+        class Pkg(ConanFile):
+            settings = "os", "arch", "compiler", "build_type"
+            requires = "dep/0.1"
+            generators = "CMakeDeps"
+
+            def layout(self):
+                cmake_layout(self)
+        """)
+    client.save({"conanfile.py": conanfile})
+    client.run("install .")
+    generators = os.path.join(client.current_folder, "build", "Release", "generators")
+    assert os.path.isfile(os.path.join(generators, "dep-config.cmake"))
+    client.run("install .")
+    assert SKIP_MSG in client.out
+
+    shutil.rmtree(os.path.join(client.current_folder, "build"))
+    client.run("install .")
+    assert SKIP_MSG not in client.out
+    assert os.path.isfile(os.path.join(generators, "dep-config.cmake"))
+
+
+def test_install_fingerprint_imports(client):
+    conanfile = textwrap.dedent("""
+        from conans import ConanFile
+        import helper
+
+        class Pkg(ConanFile):
+            requires = "dep/0.1"
+
+            def imports(self):
+                self.copy("*.txt", dst="imported")
+        """)
+    client.save({"dep/conanfile.py": GenConanfile("dep", "0.1").with_package_file("file.txt",
+                                                                                "contents"),
+                 "conanfile.py": conanfile,
+                 "helper.py": "value = 1"})
+    client.run("create dep")
+    client.run("install .")
+    imported = os.path.join(client.current_folder, "imported", "file.txt")
+    assert os.path.isfile(imported)
+    client.run("install .")
+    assert SKIP_MSG in client.out
+
+    os.remove(imported)
+    client.run("install .")
+    assert SKIP_MSG not in client.out
+    assert os.path.isfile(imported)
+    client.run("install .")
+    assert SKIP_MSG in client.out
+
+    # The local modules imported by the conanfile are inputs
+    client.save({"helper.py": "value = 2"})
+    client.run("install .")
+    assert SKIP_MSG not in client.out
+
+
+def test_install_fingerprint_json(client):
+    client.run("install .")
+    client.run("install . --json=install.json")
+    assert SKIP_MSG in client.out
+    installed = json.loads(client.load("install.json"))["installed"]
+    assert len(installed) == 1
+    assert installed[0]["recipe"]["id"] == "dep/0.1"
+    assert installed[0]["packages"][0]["id"] == NO_SETTINGS_PACKAGE_ID
+    assert "cpp_info" in installed[0]["packages"][0]
+
+
+def test_install_fingerprint_system_requirements(client):
+    conanfile = textwrap.dedent("""
+        from conans import ConanFile
+
+        class Pkg(ConanFile):
+            requires = "dep/0.1"
+
+            def system_requirements(self):
+                self.output.info("Installing system requirements")
+        """)
+    client.save({"conanfile.py": conanfile})
+    client.run("install .")
+    client.run("install .")
+    assert SKIP_MSG not in client.out
+    assert "Installing system requirements" in client.out
+    assert not os.path.exists(os.path.join(client.current_folder, FINGERPRINT_FILE))
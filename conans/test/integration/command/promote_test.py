@@ -0,0 +1,83 @@
+import os
+from collections import OrderedDict
+
+import pytest
+from mock import patch
+
+from conans.client.remote_manager import RemoteManager
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient, TestServer
+
+
+@pytest.fixture()
+def client():
+    servers = OrderedDict([("staging", TestServer(users={"user": "password"})),
+                           ("release", TestServer(users={"user": "password"}))])
+    users = {"staging": [("user", "password")], "release": [("user", "password")]}
+    client = TestClient(servers=servers, users=users)
+    client.save({"conanfile.py": GenConanfile().with_settings("os").with_exports_sources("*")
+                .with_package_file("file.txt", "contents"),
+                 "source.txt": "source contents"})
+    for name in ("pkga", "pkgb"):
+        for os_ in ("Windows", "Linux"):
+            client.run("create . %s/0.1@user/testing -s os=%s" % (name, os_))
+    client.run("upload * --all -c -r staging")
+    client.run("remove * -f")
+    return client
+
+
+def test_promote(client):
+    with patch.object(RemoteManager, "get_recipe", side_effect=AssertionError), \
+            patch.object(RemoteManager, "get_package", side_effect=AssertionError):
+        client.run("promote pkg* staging release --all --parallel")
+    assert "pkga/0.1@user/testing: Promoted recipe to 'release'" in client.out
+    assert "Promoted package to 'release'" in client.out
+    assert "Compressing" not in client.out
+    # The local cache is not used at all
+    assert not os.listdir(client.cache.store)
+
+    client.run("search pkg* -r release")
+    assert "pkga/0.1@user/testing" in client.out
+    assert "pkgb/0.1@user/testing" in client.out
+    client.run("search pkgb/0.1@user/testing -r release")
+    assert "os: Windows" in client.out
+    assert "os: Linux" in client.out
+
+    client.run("install pkgb/0.1@user/testing -s os=Linux -r release")
+    assert "pkgb/0.1@user/testing: Package installed" in client.out
+    client.run("remove * -f")
+    client.run("install pkga/0.1@user/testing -s os=Linux --build -r release")
+    assert "pkga/0.1@user/testing: Copying sources to build folder" in client.out
+
+    # Promoting again doesn't transfer anything
+    client.run("promote pkga/0.1@user/testing staging release --all")
+    assert "pkga/0.1@user/testing: Recipe is up to date, promotion skipped" in client.out
+    assert str(client.out).count("Package is up to date, promotion skipped") == 2
+    assert "Promoted" not in client.out
+
+
+def test_promote_package(client):
+    ref = "pkga/0.1@user/testing"
+    client.run("search %s -r staging -q os=Linux" % ref)
+    package_id = str(client.out).split("Package_ID: ")[1].split()[0]
+    client.run("promote %s:%s staging release" % (ref, package_id))
+    assert "pkga/0.1@user/testing: Promoted recipe to 'release'" in client.out
+    assert "%s:%s" % (ref, package_id) in client.out
+
+    client.run("search %s -r release" % ref)
+    assert "os: Linux" in client.out
+    assert "os: Windows" not in client.out
+
+    client.run("promote pkgb/0.1@user/testing staging release -q os=Windows")
+    client.run("search pkgb/0.1@user/testing -r release")
+    assert "os: Windows" in client.out
+    assert "os: Linux" not in client.out
+
+
+def test_promote_errors(client):
+    client.run("promote pkga/0.1@user/testing staging staging", assert_error=True)
+    assert "The source and target remotes must be different" in client.out
+    client.run("promote missing* staging release", assert_error=True)
+    assert "No packages found matching pattern 'missing*' in remote 'staging'" in client.out
+    client.run("promote pkga/0.1@user/testing:missing staging release", assert_error=True)
+    assert "Errors promoting some packages" in client.out
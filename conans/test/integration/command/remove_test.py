@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 import unittest
 
 import six
@@ -596,3 +597,22 @@ class RemovePackageRevisionsTest(unittest.TestCase):
                         .format(self.NO_SETTINGS_RREF, NO_SETTINGS_PACKAGE_ID))
         self.client.run("info foobar/0.1@user/testing")
         self.assertIn("Binary: Missing", self.client.out)
+
+
+def test_remove_empties_trash():
+    client = TestClient()
+    client.save({"conanfile.py": GenConanfile().with_option("opt", [1, 2, 3])})
+    for opt in (1, 2, 3):
+        client.run("create . pkg/0.1@user/testing -o pkg:opt=%s" % opt)
+    trash_folder = os.path.join(client.cache_folder, "trash")
+    # Leftovers of an interrupted removal are removed too
+    os.makedirs(os.path.join(trash_folder, "interrupted"))
+    client.run("remove pkg/0.1@user/testing -f")
+    assert not os.path.exists(client.cache.package_layout(
+        ConanFileReference.loads("pkg/0.1@user/testing")).base_folder())
+    # The trash is emptied by a background process
+    for _ in range(100):
+        if not os.path.exists(trash_folder):
+            break
+        time.sleep(0.1)
+    assert not os.path.exists(trash_folder)
@@ -1,8 +1,10 @@
 import textwrap
 
+import pytest
 from mock import patch
 from requests import ConnectionError
 
+from conans.client.remote_manager import RemoteManager
 from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.tools import TestClient, NO_SETTINGS_PACKAGE_ID, TestRequester
 
@@ -86,3 +88,40 @@ def test_beat_character_long_upload():
            in out
     assert "%&$Uploading conan_export.tgz" in out
     assert "%&$Uploading conaninfo.txt" in out
+
+
+def test_upload_already_synced():
+    """ The remote is checked once per package, and the credentials once per remote, before
+    the transfers
+    """
+    client = TestClient(default_server_user=True)
+    client.save({"conanfile.py": GenConanfile().with_option("opt", [1, 2, 3, 4, 5])})
+    for opt in range(1, 6):
+        client.run("create . lib/1.0@user/channel -o lib:opt=%s" % opt)
+    client.run("upload lib* -c --all -r default")
+
+    def spy(method):
+        return patch.object(RemoteManager, method, autospec=True,
+                            side_effect=getattr(RemoteManager, method))
+
+    with spy("check_credentials") as credentials, spy("get_package_snapshot") as snapshots, \
+            spy("get_package_manifest") as manifests:
+        client.run("config set general.parallel_upload_checks=3")
+        client.run("upload lib* -c --all -r default")
+    assert "Recipe is up to date, upload skipped" in client.out
+    assert str(client.out).count("Package is up to date, upload skipped") == 5
+    assert credentials.call_count == 1
+    assert snapshots.call_count == 5
+    assert manifests.call_count == 5
+
+
+@pytest.mark.parametrize("item, argument", [("parallel_upload", "--parallel"),
+                                            ("parallel_upload_checks", "")])
+def test_upload_parallel_invalid_threads(item, argument):
+    client = TestClient(default_server_user=True)
+    client.save({"conanfile.py": GenConanfile()})
+    client.run("create . lib/1.0@user/channel")
+    client.run("config set general.%s=0" % item)
+    client.run("upload lib* -c --all -r default %s" % argument, assert_error=True)
+    assert "ERROR: Specify a number of" in client.out
+    assert "greater than 0 for '%s'" % item in client.out
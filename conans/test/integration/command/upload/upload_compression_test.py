@@ -1,9 +1,11 @@
 import os
+from collections import OrderedDict
 
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.test.assets.genconanfile import GenConanfile
-from conans.test.utils.test_files import uncompress_packaged_files
-from conans.test.utils.tools import TestClient
+from conans.test.utils.test_files import temp_folder, uncompress_packaged_files
+from conans.test.utils.tools import NO_SETTINGS_PACKAGE_ID, TestClient, TestServer
+from conans.util.files import rmdir
 
 
 def test_reuse_uploaded_tgz():
@@ -93,3 +95,51 @@ def test_upload_only_tgz_if_needed():
     folder = uncompress_packaged_files(server_paths, pref)
     libraries = os.listdir(os.path.join(folder, "lib"))
     assert len(libraries) == 1
+
+
+def test_reuse_tgz_exporting_same_recipe():
+    client = TestClient(default_server_user=True)
+    client.save({"conanfile.py": GenConanfile("pkg", "0.1").with_exports("*"),
+                 "file.txt": "contents"})
+    client.run("export . user/stable")
+    client.run("upload pkg/0.1@user/stable")
+    assert "Compressing recipe" in client.out
+    # The recipe didn't change, the compressed files are still valid
+    client.run("export . user/stable")
+    client.run("upload pkg/0.1@user/stable")
+    assert "Compressing recipe" not in client.out
+    # But if it changes, they are compressed again
+    client.save({"file.txt": "other contents"})
+    client.run("export . user/stable")
+    client.run("upload pkg/0.1@user/stable")
+    assert "Compressing recipe" in client.out
+
+
+def test_reuse_tgz_from_download_cache():
+    # Mirroring a package from one remote to another doesn't need to compress it again, even if
+    # the downloaded tgz is not in the cache, it is found in the download cache
+    servers = OrderedDict([("remote1", TestServer(users={"user": "password"})),
+                           ("remote2", TestServer(users={"user": "password"}))])
+    users = {"remote1": [("user", "password")], "remote2": [("user", "password")]}
+    client = TestClient(servers=servers, users=users)
+    client.save({"conanfile.py": GenConanfile("pkg", "0.1").with_exports("*")
+                .with_package_file("file.txt", "contents"),
+                 "file.txt": "contents"})
+    client.run("create . user/stable")
+    client.run("upload pkg/0.1@user/stable --all -r remote1")
+
+    client.run('config set storage.download_cache="%s"' % temp_folder())
+    client.run("remove * -f")
+    client.run("download pkg/0.1@user/stable -r remote1")
+    ref = ConanFileReference.loads("pkg/0.1@user/stable")
+    layout = client.cache.package_layout(ref)
+    pref = PackageReference(ref, NO_SETTINGS_PACKAGE_ID)
+    rmdir(layout.download_export())
+    rmdir(layout.download_package(pref))
+
+    client.run("upload pkg/0.1@user/stable --all -r remote2")
+    assert "Compressing recipe" not in client.out
+    assert "Compressing package" not in client.out
+    client.run("remove * -f")
+    client.run("install pkg/0.1@user/stable -r remote2")
+    assert "pkg/0.1@user/stable:%s - Download" % NO_SETTINGS_PACKAGE_ID in client.out
@@ -76,7 +76,9 @@ class UploadTest(unittest.TestCase):
             client.run("upload * --all --confirm")
             self.assertNotIn("Uploading conan_package.tgz", client.out)
             self.assertIn("Package is up to date, upload skipped", client.out)
-            self.assertIn("Compressing package...", client.out)
+            # Compared with the remote manifest first, up to date ones are not compressed
+            self.assertNotIn("Compressing package...", client.out)
+            self.assertNotIn("Compressing recipe...", client.out)
 
         client.run("upload * --all --confirm --force")
         self.assertIn("Uploading conanfile.py", client.out)
@@ -0,0 +1,88 @@
+import os
+import sys
+import textwrap
+import types
+from collections import OrderedDict
+
+import mock
+
+from conans.client.loader import parse_conanfile, _add_recipe_class
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient
+
+
+def test_recipe_classes_reused_across_api_calls():
+    c = TestClient()
+    pyreq = textwrap.dedent("""
+        from conans import ConanFile
+        class Base(object):
+            base_value = "{}"
+        class PyReq(ConanFile):
+            pass
+        """)
+    dep = textwrap.dedent("""
+        from conans import ConanFile
+        class Pkg(ConanFile):
+            python_requires = "pyreq/0.1"
+            python_requires_extend = "pyreq.Base"
+            def package_info(self):
+                self.output.info("BASE VALUE: {}".format(self.base_value))
+        """)
+    c.save({"pyreq/conanfile.py": pyreq.format("value1"),
+            "dep/conanfile.py": dep,
+            "conanfile.py": GenConanfile().with_requires("dep/0.1")})
+    c.run("export pyreq pyreq/0.1@")
+    c.run("create dep dep/0.1@")
+
+    def parsed_paths(mock_parse):
+        return [os.path.dirname(call.args[0]) for call in mock_parse.call_args_list]
+
+    with mock.patch("conans.client.loader.parse_conanfile", wraps=parse_conanfile) as mock_parse:
+        c.run("install .")
+        c.run("install .")
+    assert "BASE VALUE: value1" in c.out
+    # Only the consumer conanfile.py is parsed, the cache recipes were loaded in the create
+    assert parsed_paths(mock_parse) == [c.current_folder, c.current_folder]
+
+    # A new revision of the python_requires needs to load again the dependency recipe
+    c.save({"pyreq/conanfile.py": pyreq.format("value2")})
+    c.run("export pyreq pyreq/0.1@")
+    with mock.patch("conans.client.loader.parse_conanfile", wraps=parse_conanfile) as mock_parse:
+        c.run("install .")
+    assert "BASE VALUE: value2" in c.out
+    assert len(parsed_paths(mock_parse)) == 3  # consumer, dep and the new pyreq
+
+
+def test_recipe_classes_bounded():
+    c = TestClient()
+    for name in ("pkga", "pkgb", "pkgc"):
+        c.save({"conanfile.py": GenConanfile(name, "0.1")})
+        c.run("create .")
+    with mock.patch("conans.client.loader._RECIPE_CLASSES_MAX", 2):
+        with mock.patch("conans.client.loader._recipe_classes", OrderedDict()) as classes:
+            for name in ("pkga", "pkgb", "pkgc"):
+                c.run("install %s/0.1@" % name)
+            # The least recently used recipe is evicted
+            assert len(classes) == 2
+            assert not any("pkga" in path for path, _ in classes)
+            with mock.patch("conans.client.loader.parse_conanfile",
+                            wraps=parse_conanfile) as mock_parse:
+                c.run("install pkga/0.1@")
+            assert mock_parse.call_count == 1
+            assert not any("pkgb" in path for path, _ in classes)
+
+
+def test_recipe_classes_evicted_modules():
+    module = types.ModuleType("evicted_module_id")
+    submodule = types.ModuleType("evicted_module_id.helper")
+    sys.modules[module.__name__] = module
+    sys.modules[submodule.__name__] = submodule
+    with mock.patch("conans.client.loader._RECIPE_CLASSES_MAX", 1):
+        with mock.patch("conans.client.loader._recipe_classes", OrderedDict()) as classes:
+            _add_recipe_class(("path1", "rev1"), None, None, object, module)
+            assert module.__name__ in sys.modules
+            _add_recipe_class(("path2", "rev1"), None, None, object, types.ModuleType("other"))
+            assert list(classes) == [("path2", "rev1")]
+    # The modules of the evicted recipes are unloaded, so they can be freed
+    assert module.__name__ not in sys.modules
+    assert submodule.__name__ not in sys.modules
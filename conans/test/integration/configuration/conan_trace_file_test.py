@@ -133,3 +133,38 @@ class ConanTraceTest(unittest.TestCase):
             doc = json.loads(action)
             if doc.get("url") and "signature" in doc.get("url"):
                 self.assertIn("signature=*****", doc.get("url"))
+
+
+def test_perf_trace_file():
+    client = TestClient(default_server_user=True)
+    client.save({"conanfile.py": GenConanfile("dep", "1.0").with_exports_sources("*.h"),
+                 "dep.h": ""})
+    trace_file = os.path.join(temp_folder(), "conan_perf_trace.json")
+    with tools.environment_append({"CONAN_PERF_TRACE_FILE": trace_file}):
+        client.run("create .")
+        client.run("upload * --all -c")
+        client.run("remove * -f")
+        client.save({"conanfile.txt": "[requires]\ndep/[>=1.0]\n[generators]\ntxt"},
+                    clean_first=True)
+        client.run("install .")
+
+    # The Chrome trace JSON array format, without the closing bracket
+    events = json.loads(load(trace_file).rstrip().rstrip(",") + "]")
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+    spans = {(e["cat"], e["name"]) for e in events}
+    for expected in [("command", "create"), ("command", "upload"), ("command", "install"),
+                     ("graph", "expand conanfile.txt"), ("graph", "resolve dep/[>=1.0]"),
+                     ("graph", "load dep/1.0"), ("binaries", "binary dep/1.0"),
+                     ("build", "build dep/1.0"), ("package", "package dep/1.0"),
+                     ("package_info", "package_info dep/1.0"), ("generators", "generator txt"),
+                     ("compress", "compress conan_package.tgz"),
+                     ("download", "download conan_package.tgz"),
+                     ("unpack", "unpack conan_package.tgz")]:
+        assert expected in spans
+    assert any(cat == "remote" and name.startswith("get_package_info dep/1.0")
+               for cat, name in spans)
+    # The spans of the commands contain all the others
+    install = next(e for e in events if e["name"] == "install")
+    download = next(e for e in events if e["name"] == "download conan_package.tgz")
+    assert install["ts"] <= download["ts"]
+    assert download["ts"] + download["dur"] <= install["ts"] + install["dur"]
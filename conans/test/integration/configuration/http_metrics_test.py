@@ -0,0 +1,81 @@
+import json
+import os
+
+from conans.client.cache.cache import ClientCache
+from conans.client.rest.conan_requester import ConanRequester
+from conans.client.rest.http_metrics import endpoint_family
+from conans.client.tools import environment_append
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.mocks import TestBufferConanOutput
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestClient, StoppableThreadBottle
+from conans.util.files import load
+
+
+def test_endpoint_family():
+    base = "http://myserver/v2/conans/pkg/0.1/_/_"
+    assert endpoint_family("http://myserver/v1/ping") == "ping"
+    assert endpoint_family("http://myserver/v2/users/authenticate") == "auth"
+    assert endpoint_family("http://myserver/v2/conans/search?q=pkg") == "search"
+    assert endpoint_family(base + "/latest") == "revisions"
+    assert endpoint_family(base + "/revisions") == "revisions"
+    assert endpoint_family(base + "/revisions/rev1/files/conanmanifest.txt") == "manifest"
+    assert endpoint_family(base + "/revisions/rev1/files/conan_export.tgz") == "file"
+    assert endpoint_family("http://myserver/other") == "other"
+
+
+def test_http_metrics():
+    metrics_file = os.path.join(temp_folder(), "metrics.json")
+    client = TestClient(default_server_user=True)
+    client.save({"conanfile.py": GenConanfile("pkg", "0.1")})
+    client.run("create . user/testing")
+    client.run("upload pkg* --all -c")
+    assert "HTTP metrics" not in client.out
+
+    client.run("remove * -f")
+    with environment_append({"CONAN_HTTP_METRICS": "1",
+                             "CONAN_HTTP_METRICS_FILE": metrics_file}):
+        client.run("install pkg/0.1@user/testing")
+    assert "HTTP metrics (seconds):" in client.out
+    assert "  default" in client.out
+    assert "    file: " in client.out
+
+    metrics = json.loads(load(metrics_file))
+    assert list(metrics) == ["default"]
+    assert {"ping", "manifest", "file"}.issubset(metrics["default"])
+    files = metrics["default"]["file"]
+    assert files["requests"] > 0
+    assert files["errors"] == 0
+    assert files["bytes_received"] > 0
+
+    # The file is overwritten by every command, the summary can be disabled
+    with environment_append({"CONAN_HTTP_METRICS": "0",
+                             "CONAN_HTTP_METRICS_FILE": metrics_file}):
+        client.run("search pkg* -r=default")
+    assert "HTTP metrics" not in client.out
+    metrics = json.loads(load(metrics_file))
+    assert list(metrics["default"]) == ["ping", "search"]
+
+
+def test_http_metrics_connections():
+    http_server = StoppableThreadBottle()
+
+    @http_server.server.get("/myfile.txt")
+    def get_file():
+        return "some contents"
+
+    http_server.run_server()
+    cache = ClientCache(temp_folder(), TestBufferConanOutput())
+    with environment_append({"CONAN_HTTP_METRICS": "1"}):
+        requester = ConanRequester(cache.config)
+    url = "http://localhost:%s/myfile.txt" % http_server.port
+    response = requester.get(url, stream=True)
+    assert b"".join(response.iter_content(4)) == b"some contents"
+
+    metrics = requester.metrics.as_dict()["http://localhost:%s" % http_server.port]["other"]
+    assert metrics["requests"] == 1
+    assert metrics["new_connections"] == 1
+    assert metrics["bytes_received"] == len("some contents")
+    assert metrics["connect"] > 0
+    assert metrics["tls"] == 0
+    http_server.stop()
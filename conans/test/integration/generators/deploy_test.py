@@ -143,6 +143,14 @@ class DeployGeneratorPermissionsTest(unittest.TestCase):
         stat_info = os.stat(header1_path)
         self.assertTrue(stat_info.st_mode & stat.S_IXUSR)
 
+    def test_new_timestamps(self):
+        # The deployed files are new files, they don't keep the package files times
+        os.utime(self.header_path, (1000000000, 1000000000))
+        self.client.current_folder = temp_folder()
+        self.client.run("install %s -g deploy" % self.ref1.full_str())
+        header1_path = os.path.join(self.client.current_folder, "name1", "include", "header1.h")
+        self.assertGreater(os.stat(header1_path).st_mtime, 1000000000)
+
 
 @pytest.mark.skipif(platform.system() == "Windows", reason="Permissions in NIX systems only")
 class DeployGeneratorSymbolicLinkTest(unittest.TestCase):
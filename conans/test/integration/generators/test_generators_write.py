@@ -0,0 +1,126 @@
+import os
+import textwrap
+
+import pytest
+
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient
+from conans.util.files import load, save
+
+
+@pytest.fixture
+def client():
+    c = TestClient()
+    c.save({"dep/conanfile.py": GenConanfile("dep", "0.1"),
+            "conanfile.txt": textwrap.dedent("""
+                [requires]
+                dep/0.1
+                [generators]
+                txt
+                cmake
+                json
+                """)})
+    c.run("create dep")
+    return c
+
+
+@pytest.mark.parametrize("parallel", [None, 1, 4])
+def test_generators_skip_unchanged_files(client, parallel):
+    if parallel:
+        save(client.cache.new_config_path, "tools.generators:parallel={}".format(parallel))
+    client.run("install .")
+    generated = ("conanbuildinfo.txt", "conanbuildinfo.cmake", "conanbuildinfo.json")
+    for f in generated:
+        assert os.path.isfile(os.path.join(client.current_folder, f))
+    # The manifest of the written files is kept in the cache, not in the user folder
+    assert sorted(os.listdir(client.current_folder)) == sorted(
+        ["conanfile.txt", "dep", "conaninfo.txt", "conan.lock", "graph_info.json"] +
+        list(generated))
+    assert len(os.listdir(client.cache.generators_manifests_folder)) == 1
+    mtimes = {f: os.stat(os.path.join(client.current_folder, f)).st_mtime_ns for f in generated}
+
+    client.run("install .")
+    for f in generated:
+        assert mtimes[f] == os.stat(os.path.join(client.current_folder, f)).st_mtime_ns
+
+
+def test_generators_rewrite_modified_files(client):
+    client.run("install .")
+    cmake_path = os.path.join(client.current_folder, "conanbuildinfo.cmake")
+    content = load(cmake_path)
+    save(cmake_path, "user changes")
+    client.run("install .")
+    assert load(cmake_path) == content
+
+
+def test_generators_parallel_error(client):
+    save(client.cache.new_config_path, "tools.generators:parallel=4")
+    client.save({"conanfile.txt": "[generators]\ncmake\nmake\nvirtualenv\nnonexisting"})
+    client.run("install .", assert_error=True)
+    assert "Invalid generator 'nonexisting'" in client.out
+
+
+def test_generators_parallel_same_contents():
+    # The built-in generators only read the dependencies information, computing them
+    # concurrently or sequentially produces the same files
+    c = TestClient()
+    dep = textwrap.dedent("""
+        from conans import ConanFile
+        class Pkg(ConanFile):
+            def package_info(self):
+                self.cpp_info.components["core"].libs = ["core"]
+                self.cpp_info.components["core"].defines = ["CORE"]
+                self.cpp_info.components["extra"].requires = ["core"]
+                self.cpp_info.components["extra"].libs = ["extra"]
+                self.cpp_info.components["extra"].build_modules["cmake_find_package"] = ["m.cmake"]
+        """)
+    generators = ["txt", "cmake", "cmake_multi", "cmake_find_package", "cmake_paths", "json",
+                  "make", "premake", "qmake", "scons", "pkg_config", "b2", "xcode", "ycm"]
+    c.save({"dep/conanfile.py": dep,
+            "conanfile.txt": "[requires]\n{}\n[generators]\n{}".format(
+                "\n".join("dep{}/0.1".format(i) for i in range(20)), "\n".join(generators))})
+    for i in range(20):
+        c.run("create dep dep{}/0.1@".format(i))
+
+    def install(parallel):
+        folder = os.path.join(c.current_folder, "parallel{}".format(parallel))
+        save(c.cache.new_config_path, "tools.generators:parallel={}".format(parallel))
+        c.run("install . -if=parallel{}".format(parallel))
+        return {f: load(os.path.join(folder, f)) for f in os.listdir(folder)
+                if f not in ("conaninfo.txt", "conan.lock", "graph_info.json")}
+
+    sequential = install(1)
+    assert len(sequential) > len(generators)
+    for _ in range(3):
+        parallel = install(8)
+        assert parallel.keys() == sequential.keys()
+        for f, content in sequential.items():
+            assert parallel[f] == content.replace("parallel1", "parallel8"), f
+
+
+def test_generators_custom_sequential():
+    # Custom generators are computed in the main thread, they can do anything
+    c = TestClient()
+    gen = textwrap.dedent("""
+        import threading
+        from conans.model import Generator
+        from conans import ConanFile
+
+        class MyGen(Generator):
+            @property
+            def filename(self):
+                return "mygen.txt"
+
+            @property
+            def content(self):
+                return threading.current_thread().name
+
+        class MyGenPkg(ConanFile):
+            pass
+        """)
+    c.save({"gen/conanfile.py": gen,
+            "conanfile.txt": "[build_requires]\nmygen/0.1\n[generators]\nMyGen\ncmake\ntxt"})
+    c.run("create gen mygen/0.1@")
+    save(c.cache.new_config_path, "tools.generators:parallel=4")
+    c.run("install .")
+    assert c.load("mygen.txt") == "MainThread"
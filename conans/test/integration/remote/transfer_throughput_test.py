@@ -0,0 +1,88 @@
+import hashlib
+import os
+import time
+
+import bottle
+import mock
+import pytest
+
+from conans.client.cache.cache import ClientCache
+from conans.client.downloaders import file_downloader
+from conans.client.downloaders.file_downloader import FileDownloader
+from conans.client.rest import file_uploader
+from conans.client.rest.conan_requester import ConanRequester
+from conans.client.rest.file_uploader import FileUploader
+from conans.test.utils.mocks import TestBufferConanOutput
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import StoppableThreadBottle
+from conans.util.files import file_checksums
+
+_FILE_SIZE = 32 * 1024 * 1024
+_OLD_CHUNK_SIZE = 1024  # Uploads were read in 1 KB chunks, downloads in 100 KB ones
+
+
+def _transfer_throughput(requester, config, url, path, chunk_size):
+    """ MB/s of uploading and downloading the file to the local server
+    """
+    output = TestBufferConanOutput()
+    with mock.patch.object(file_uploader, "UPLOAD_CHUNK_SIZE", chunk_size):
+        start = time.time()
+        response = FileUploader(requester, output, False, config).upload(url + "/upload", path)
+        upload = time.time() - start
+    assert response.text == file_checksums(path, ("sha1",))["sha1"]
+
+    downloaded = os.path.join(temp_folder(), "downloaded.bin")
+    with mock.patch.object(file_downloader, "DOWNLOAD_CHUNK_SIZE", chunk_size):
+        start = time.time()
+        FileDownloader(requester, output, False, 0, 0).download(url + "/download", downloaded)
+        download = time.time() - start
+    assert file_checksums(downloaded, ("sha1",)) == file_checksums(path, ("sha1",))
+
+    size = _FILE_SIZE / (1024.0 * 1024.0)
+    return size / upload, size / download
+
+
+@pytest.mark.slow
+def test_transfer_throughput():
+    """ benchmark of the transfers against a real local HTTP server, the current chunks
+    against the old small ones, that made the Python overhead per chunk the bottleneck
+    """
+    folder = temp_folder()
+    path = os.path.join(folder, "file.bin")
+    with open(path, "wb") as f:
+        f.write(os.urandom(_FILE_SIZE))
+
+    http_server = StoppableThreadBottle()
+
+    @http_server.server.put("/upload")
+    def upload():
+        sha1 = hashlib.sha1()
+        body = bottle.request.environ["wsgi.input"]
+        remaining = int(bottle.request.headers["Content-Length"])
+        while remaining:
+            chunk = body.read(min(remaining, 1024 * 1024))
+            if not chunk:
+                break
+            sha1.update(chunk)
+            remaining -= len(chunk)
+        return sha1.hexdigest()
+
+    @http_server.server.get("/download")
+    def download():
+        return bottle.static_file("file.bin", root=folder)
+
+    http_server.run_server()
+    cache = ClientCache(temp_folder(), TestBufferConanOutput())
+    requester = ConanRequester(cache.config)
+    url = "http://localhost:%s" % http_server.port
+
+    old_upload, old_download = _transfer_throughput(requester, cache.config, url, path,
+                                                    _OLD_CHUNK_SIZE)
+    upload, download = _transfer_throughput(requester, cache.config, url, path,
+                                            file_uploader.UPLOAD_CHUNK_SIZE)
+    print("Upload: %.0f MB/s (%.0f MB/s with 1 KB chunks)" % (upload, old_upload))
+    print("Download: %.0f MB/s (%.0f MB/s with 1 KB chunks)" % (download, old_download))
+    # Typically several times faster, not asserting more to not depend on the machine load
+    assert upload > old_upload
+    assert download > old_download
+    http_server.stop()
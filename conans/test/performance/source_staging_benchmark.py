@@ -0,0 +1,77 @@
+""" Benchmark of the methods to stage the sources in the build folders ('core.sources:staging'),
+simulating the build of several configurations of a package with a big source tree.
+
+    python -m conans.test.performance.source_staging_benchmark [--files N] [--size KB]
+                                                                 [--configs N] [--folder PATH]
+
+The folder (a temporary one by default) determines the file system, and then whether reflinks
+or hard links are possible.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from conans.util.staging import STAGING_METHODS, copy_tree
+
+
+def _create_source_tree(folder, files, size):
+    content = os.urandom(size)
+    for i in range(files):
+        path = os.path.join(folder, "dir%d" % (i % 100), "file%d.cpp" % i)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, "wb") as f:
+            f.write(content)
+
+
+def _disk_usage(folder, inodes=None):
+    """ bytes of the disk blocks allocated by the tree, counting once the hard linked files and
+    excluding the given inodes (updated with the ones of the tree)
+    """
+    inodes = inodes if inodes is not None else set()
+    total = 0
+    for root, _, files in os.walk(folder):
+        for f in files:
+            st = os.lstat(os.path.join(root, f))
+            if st.st_ino not in inodes:
+                inodes.add(st.st_ino)
+                total += st.st_blocks * 512
+    return total
+
+
+def main(args):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=20000, help="Number of source files")
+    parser.add_argument("--size", type=int, default=16, help="Size of every file in KB")
+    parser.add_argument("--configs", type=int, default=6, help="Configurations built")
+    parser.add_argument("--folder", default=None, help="Folder to run the benchmark")
+    args = parser.parse_args(args)
+
+    base = tempfile.mkdtemp(dir=args.folder)
+    try:
+        source = os.path.join(base, "source")
+        _create_source_tree(source, args.files, args.size * 1024)
+        source_inodes = set()
+        print("Source tree: %d files, %.1f MB. Staging %d configurations\n"
+              % (args.files, _disk_usage(source, source_inodes) / 1024.0 / 1024.0, args.configs))
+        print("%-10s %12s %16s" % ("method", "time (s)", "new disk (MB)"))
+        for method in STAGING_METHODS:
+            builds = os.path.join(base, "build_%s" % method)
+            t1 = time.time()
+            for config in range(args.configs):
+                copy_tree(source, os.path.join(builds, str(config)), method)
+            duration = time.time() - t1
+            # Reflinks share the blocks too, but it is not visible in the allocated blocks
+            usage = _disk_usage(builds, set(source_inodes)) / 1024.0 / 1024.0
+            print("%-10s %12.2f %16.1f" % (method, duration, usage))
+            shutil.rmtree(builds)
+    finally:
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
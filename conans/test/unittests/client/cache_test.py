@@ -3,6 +3,8 @@
 import os
 import unittest
 
+import mock
+
 from six import StringIO
 
 from conans.client.cache.cache import ClientCache
@@ -12,7 +14,7 @@ from conans.model.package_metadata import PackageMetadata
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.test.utils.test_files import temp_folder
 from conans.util.files import mkdir
-from conans.util.files import save
+from conans.util.files import save, load
 
 
 class CacheTest(unittest.TestCase):
@@ -70,6 +72,36 @@ class CacheTest(unittest.TestCase):
 
         self.assertTrue(layout2.package_exists(pref2))
 
+    def test_metadata_parsed_once(self):
+        pref = PackageReference(self.ref, "999")
+        with self.cache.package_layout(self.ref).update_metadata() as metadata:
+            metadata.recipe.revision = "rrev"
+            metadata.packages[pref.id].revision = "prev"
+
+        with mock.patch.object(PackageMetadata, "loads", wraps=PackageMetadata.loads) as loads:
+            for _ in range(3):
+                layout = self.cache.package_layout(self.ref)
+                self.assertEqual(layout.recipe_revision(), "rrev")
+                self.assertEqual(layout.package_revision(pref), "prev")
+                # Reading a missing package doesn't modify the shared metadata
+                self.assertIsNone(layout.load_metadata().packages["missing"].revision)
+                self.assertNotIn("missing", layout.load_metadata().packages)
+            self.assertEqual(loads.call_count, 1)
+
+            # Updating the metadata invalidates it
+            with layout.update_metadata() as metadata:
+                metadata.packages[pref.id].revision = "prev2"
+            self.assertEqual(loads.call_count, 2)
+            layout = self.cache.package_layout(self.ref)
+            self.assertEqual(layout.package_revision(pref), "prev2")
+            self.assertEqual(loads.call_count, 3)
+
+            # Modified by other process
+            metadata = PackageMetadata.loads(load(layout.package_metadata()))
+            metadata.packages[pref.id].revision = "prev_other"
+            save(layout.package_metadata(), metadata.dumps())
+            self.assertEqual(layout.package_revision(pref), "prev_other")
+
     def test_localdb_uses_encryption(self):
         localdb = self.cache.localdb
         self.assertIsNone(localdb.encryption_key)
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="Lazy module attributes require Python 3.7")
+def test_startup_does_not_import_build_helpers():
+    # Loading the command line shouldn't load the build helpers, generators or command
+    # implementations, they are imported only by the commands and recipes that use them.
+    # Neither the third party libraries only needed to render templates, parse yml files or
+    # connect to the remotes
+    code = textwrap.dedent("""
+        import sys
+        import conans
+        assert list(m for m in sys.modules if m.startswith("conans.")) == [], "conans"
+        import conans.client.command
+        for m in ("conans.client.build.cmake", "conans.client.build.msbuild",
+                  "conans.client.build.meson", "conans.client.generators.cmake_find_package",
+                  "conans.client.generators.visualstudio", "conans.client.cmd.uploader",
+                  "conans.client.cmd.create", "conans.client.cmd.build",
+                  "jinja2", "yaml", "requests"):
+            assert m not in sys.modules, m
+        from conans import CMake, ConanFile, tools
+        assert "conans.client.build.cmake" in sys.modules
+        """)
+    subprocess.check_call([sys.executable, "-c", code])
+
+
+def test_version_fast_path():
+    code = textwrap.dedent("""
+        import sys
+        sys.argv = ["conan", "--version"]
+        from conans.conan import run
+        try:
+            run()
+        finally:
+            assert "conans.client.command" not in sys.modules
+        """)
+    output = subprocess.check_output([sys.executable, "-c", code])
+    assert b"Conan version" in output
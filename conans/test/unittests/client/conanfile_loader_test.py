@@ -5,6 +5,7 @@ import unittest
 from collections import OrderedDict
 
 import six
+import mock
 from mock import Mock, call
 from parameterized import parameterized
 import pytest
@@ -379,3 +380,43 @@ def append(data):
             self.assertIs(loaded1.myconanlogger.value, loaded2.myconanlogger.value)
         finally:
             sys.path.remove(temp)
+
+    def test_bytecode_cache(self):
+        conanfile = textwrap.dedent("""
+            from helper import value
+            def get_value():
+                return value
+            """)
+        tmp = temp_folder()
+        bytecode_folder = temp_folder()
+        conanfile_path = os.path.join(tmp, "conanfile.py")
+        save(conanfile_path, conanfile)
+        save(os.path.join(tmp, "helper.py"), "value = 42")
+
+        loaded, module_id = _parse_conanfile(conanfile_path, bytecode_folder)
+        self.assertEqual(loaded.get_value(), 42)
+        self.assertEqual(len(os.listdir(bytecode_folder)), 1)
+        self.assertIn("{}.helper".format(module_id), sys.modules)
+        self.assertNotIn("helper", sys.modules)
+
+        # The second time the recipe is not compiled
+        with mock.patch("conans.client.loader.compile", create=True,
+                        side_effect=AssertionError("compiled again")):
+            loaded, _ = _parse_conanfile(conanfile_path, bytecode_folder)
+        self.assertEqual(loaded.get_value(), 42)
+
+        # A change in the recipe compiles it again, replacing the stored one
+        save(conanfile_path, conanfile + "\nother = 1\n")
+        loaded, _ = _parse_conanfile(conanfile_path, bytecode_folder)
+        self.assertEqual(loaded.other, 1)
+        self.assertEqual(len(os.listdir(bytecode_folder)), 1)
+        with mock.patch("conans.client.loader.compile", create=True,
+                        side_effect=AssertionError("compiled again")):
+            loaded, _ = _parse_conanfile(conanfile_path, bytecode_folder)
+        self.assertEqual(loaded.other, 1)
+
+        # Going back to the previous contents is not served from the replaced bytecode
+        save(conanfile_path, conanfile)
+        loaded, _ = _parse_conanfile(conanfile_path, bytecode_folder)
+        self.assertFalse(hasattr(loaded, "other"))
+        self.assertEqual(len(os.listdir(bytecode_folder)), 1)
@@ -3,12 +3,13 @@ import re
 import tempfile
 import unittest
 
+import mock
 import pytest
 
-from conans.client.downloaders.file_downloader import FileDownloader
+from conans.client.downloaders.file_downloader import FileDownloader, DOWNLOAD_CHUNK_SIZE
 from conans.errors import ConanException
 from conans.test.utils.mocks import TestBufferConanOutput
-from conans.util.files import load
+from conans.util.files import load, file_checksums
 
 
 class _ConfigMock:
@@ -22,10 +23,12 @@ class MockResponse(object):
         self.data = data
         self.ok = True
         self.status_code = status_code
+        self.chunk_sizes = []
         self.headers = headers.copy()
         self.headers.update({key.lower(): value for key, value in headers.items()})
 
     def iter_content(self, size):
+        self.chunk_sizes.append(size)
         for i in range(0, len(self.data), size):
             yield self.data[i:i + size]
 
@@ -42,6 +45,7 @@ class MockRequester(object):
         self._chunk_size = chunk_size if chunk_size is not None else len(data)
         self._accept_ranges = accept_ranges
         self._echo_header = echo_header.copy() if echo_header else {}
+        self.responses = []
 
     def get(self, *_args, **kwargs):
         start = 0
@@ -65,6 +69,7 @@ class MockRequester(object):
             headers.update(self._echo_header)
         response = MockResponse(self._data[start:start + self._chunk_size], status_code=status,
                                 headers=headers)
+        self.responses.append(response)
         return response
 
 
@@ -143,3 +148,40 @@ class DownloaderUnitTest(unittest.TestCase):
         downloader.download("fake_url", file_path=self.target)
         actual_content = load(self.target, binary=True)
         self.assertEqual(expected_content, actual_content)
+
+    def test_checksums_computed_while_downloading(self):
+        expected_content = b"some data"
+        requester = MockRequester(expected_content)
+        downloader = FileDownloader(requester=requester, output=self.out, verify=None,
+                                    config_retry=0, config_retry_wait=0)
+        md5 = "1e50210a0202497fb79bc38b6ade6c34"
+        downloader.download("fake_url", file_path=self.target, md5=md5)
+        # The checksums of the downloaded file are available without reading it again
+        with mock.patch("conans.util.files.open", create=True, side_effect=AssertionError):
+            checksums = file_checksums(self.target, ("md5", "sha1"))
+        self.assertEqual(checksums["md5"], md5)
+        self.assertEqual(checksums["sha1"], "baf34551fecb48acc3da868eb85e1b6dac9de356")
+        # The sha256 is only computed if it is checked
+        self.assertEqual(file_checksums(self.target)["sha256"],
+                         "1307990e6ba5ca145eb35e99182a9bec46531bc54ddf656a602c780fa0240dee")
+
+        with pytest.raises(ConanException, match=r"sha1 signature failed for 'target' file"):
+            downloader.download("fake_url", file_path=self.target, sha1="invalid", overwrite=True)
+        self.assertFalse(os.path.exists(self.target))
+
+    def test_checksums_resumed_download(self):
+        expected_content = b"some data"
+        requester = MockRequester(expected_content, chunk_size=4)
+        downloader = FileDownloader(requester=requester, output=self.out, verify=None,
+                                    config_retry=0, config_retry_wait=0)
+        downloader.download("fake_url", file_path=self.target,
+                            md5="1e50210a0202497fb79bc38b6ade6c34")
+
+    def test_download_big_chunks(self):
+        expected_content = b"0123456789abcdef" * (DOWNLOAD_CHUNK_SIZE // 8)
+        requester = MockRequester(expected_content)
+        downloader = FileDownloader(requester=requester, output=self.out, verify=None,
+                                    config_retry=0, config_retry_wait=0)
+        downloader.download("fake_url", file_path=self.target)
+        self.assertEqual(requester.responses[0].chunk_sizes, [DOWNLOAD_CHUNK_SIZE])
+        self.assertEqual(expected_content, load(self.target, binary=True))
@@ -4,7 +4,7 @@ from collections import namedtuple
 
 import six
 
-from conans.client.rest.file_uploader import FileUploader
+from conans.client.rest.file_uploader import FileUploader, UPLOAD_CHUNK_SIZE
 from conans.errors import AuthenticationException, ForbiddenException, InternalErrorException
 from conans.test.utils.mocks import TestBufferConanOutput
 from conans.util.files import save
@@ -62,3 +62,25 @@ class UploaderUnitTest(unittest.TestCase):
         save(f, "some contents")
         with six.assertRaisesRegex(self, InternalErrorException, "tururu"):
             uploader.upload("fake_url", self.f, dedup=True)
+
+    def test_upload_big_chunks(self):
+        class ReadingRequester(object):
+            def __init__(self):
+                self.chunks = []
+
+            def put(self, *args, **kwargs):
+                data = kwargs["data"]
+                while True:
+                    chunk = data.read(8192)  # The size requested by the http layer is ignored
+                    if not chunk:
+                        break
+                    self.chunks.append(chunk)
+                return namedtuple("response", "status_code raise_for_status")(200, lambda: None)
+
+        contents = b"0123456789abcdef" * (UPLOAD_CHUNK_SIZE // 8)  # 2 chunks
+        save(self.f, contents)
+        requester = ReadingRequester()
+        uploader = FileUploader(requester, self.out, verify=False, config=_ConfigMock())
+        uploader.upload("fake_url", self.f)
+        self.assertEqual(len(requester.chunks), 2)
+        self.assertEqual(b"".join(requester.chunks), contents)
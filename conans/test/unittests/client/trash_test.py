@@ -0,0 +1,92 @@
+import os
+import time
+
+import mock
+from six import StringIO
+
+from conans.client.cache.cache import ClientCache
+from conans.client.cache.trash import Trash
+from conans.client.output import ConanOutput
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.mocks import TestBufferConanOutput
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import save
+
+
+def test_trash_discard_and_empty():
+    tmp = temp_folder()
+    trash = Trash(os.path.join(tmp, "trash"))
+    folders = []
+    for i in range(20):
+        folder = os.path.join(tmp, "folder%s" % i)
+        save(os.path.join(folder, "sub", "file.txt"), "contents")
+        folders.append(folder)
+
+    for folder in folders:
+        trash.discard(folder)
+        assert not os.path.exists(folder)
+    trash.discard(os.path.join(tmp, "missing"))
+    assert len(os.listdir(trash.folder)) == 20
+
+    trash.empty()
+    assert not os.path.exists(trash.folder)
+    trash.empty()  # Nothing to do
+
+
+def test_trash_resume_interrupted():
+    tmp = temp_folder()
+    trash = Trash(os.path.join(tmp, "trash"))
+    # Leftovers of an interrupted removal, partially removed
+    save(os.path.join(trash.folder, "a", "file.txt"), "contents")
+    save(os.path.join(trash.folder, "b", "sub", "file.txt"), "contents")
+    trash.empty()
+    assert not os.path.exists(trash.folder)
+
+
+def test_trash_cannot_move():
+    tmp = temp_folder()
+    output = TestBufferConanOutput()
+    trash = Trash(os.path.join(tmp, "trash"), output)
+    folders = [os.path.join(tmp, "folder%s" % i) for i in range(2)]
+    for folder in folders:
+        save(os.path.join(folder, "file.txt"), "contents")
+    with mock.patch("os.rename", side_effect=OSError("Invalid cross-device link")):
+        for folder in folders:
+            trash.discard(folder)
+    for folder in folders:
+        assert not os.path.exists(folder)
+    assert not os.listdir(trash.folder)
+    # Warned only once
+    assert str(output).count("cannot be moved to the trash") == 1
+    assert "Invalid cross-device link" in str(output)
+
+
+def test_trash_empty_in_background():
+    tmp = temp_folder()
+    trash = Trash(os.path.join(tmp, "trash"))
+    trash.empty_in_background()  # Nothing to do
+    for i in range(3):
+        save(os.path.join(tmp, "folder%s" % i, "sub", "file.txt"), "contents")
+        trash.discard(os.path.join(tmp, "folder%s" % i))
+    trash.empty_in_background()
+    for _ in range(100):
+        if not os.path.exists(trash.folder):
+            break
+        time.sleep(0.1)
+    assert not os.path.exists(trash.folder)
+
+
+def test_package_remove_trash():
+    cache = ClientCache(temp_folder(), ConanOutput(StringIO()))
+    ref = ConanFileReference.loads("lib/1.0@conan/stable")
+    layout = cache.package_layout(ref)
+    pref = PackageReference(ref, "123")
+    save(os.path.join(layout.package(pref), "file.txt"), "contents")
+    save(os.path.join(layout.download_package(pref), "conan_package.tgz"), "contents")
+
+    layout.package_remove(pref)
+    assert not layout.package_exists(pref)
+    assert not os.path.exists(layout.download_package(pref))
+    assert len(os.listdir(cache.trash.folder)) == 2
+    cache.trash.empty()
+    assert not os.path.exists(cache.trash.folder)
@@ -1,4 +1,5 @@
 import mock
+from jinja2 import Template
 from mock import Mock
 
 from conan.tools.cmake import CMakeDeps
@@ -178,3 +179,46 @@ def test_component_name_same_package():
         data_cmake = files["mypkg-release-x86-data.cmake"]
         assert 'set(mypkg_mypkg_mypkg_INCLUDE_DIRS_RELEASE ' \
                '"${mypkg_PACKAGE_FOLDER_RELEASE}/includedirs1")' in data_cmake
+
+
+def test_cmakedeps_templates_compiled_once():
+    """ Generating the files for many dependencies should compile every template just once
+    """
+    conanfile = ConanFile(Mock(), None)
+    conanfile._conan_node = Mock()
+    conanfile._conan_node.context = "host"
+    conanfile.settings = "os", "compiler", "build_type", "arch"
+    conanfile.initialize(Settings({"os": ["Windows"],
+                                   "compiler": ["gcc"],
+                                   "build_type": ["Release"],
+                                   "arch": ["x86"]}), EnvValues())
+    conanfile.settings.build_type = "Release"
+    conanfile.settings.arch = "x86"
+
+    deps = {}
+    for i in range(300):
+        name = "pkg{}".format(i)
+        cpp_info = CppInfo(name, "dummy_root_folder")
+        cpp_info.components["comp"].libs = ["lib{}".format(i)]
+        conanfile_dep = ConanFile(Mock(), None)
+        conanfile_dep.cpp_info = cpp_info
+        conanfile_dep.settings = conanfile.settings
+        conanfile_dep._conan_node = Mock()
+        conanfile_dep._conan_node.context = "host"
+        conanfile_dep._conan_node.ref = ConanFileReference.loads("{}/1.0".format(name))
+        conanfile_dep.folders.set_base_package("/path/to/{}".format(name))
+        req = Requirement(ConanFileReference.loads("{}/1.0".format(name)))
+        deps[req] = ConanFileInterface(conanfile_dep)
+
+    with mock.patch('conans.ConanFile.dependencies', new_callable=mock.PropertyMock) as mock_deps:
+        mock_deps.return_value = ConanFileDependencies(deps)
+
+        with mock.patch("jinja2.Template", wraps=Template) as template:
+            files = CMakeDeps(conanfile).content
+            assert len(files) == 1 + 300 * 5
+            first_compilations = template.call_count
+            # MacrosTemplate, config-version, data, target-configuration, targets and config
+            assert first_compilations <= 6
+            # A second generation in the same process doesn't need to compile anything
+            CMakeDeps(conanfile).content
+            assert template.call_count == first_compilations
@@ -1,17 +1,21 @@
 import os
 import platform
+import tarfile
+import time
 
+import mock
 import pytest
 import requests
 from bottle import HTTPError, auth_basic, static_file
 
 from conan.tools.files import ftp_download, download, get
+from conans.client.downloaders.download import run_downloader
 from conans.client.tools import chdir
 from conans.errors import ConanException, AuthenticationException
 from conans.test.utils.mocks import ConanFileMock
 from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import StoppableThreadBottle
-from conans.util.files import save, load
+from conans.util.files import save, load, sha256sum
 
 
 @pytest.mark.skip(msg="This causes more troubles than benefits, external ftp download is testing "
@@ -194,12 +198,12 @@ def bottle_server_zip():
     test_folder = os.path.join(tmp_folder, "test_folder")
     zipped_file = os.path.join(test_folder, "myfile.txt")
     save(zipped_file, "myfile contents!")
-    import tarfile
     tar_file = tarfile.open(file_path, "w:gz")
     tar_file.add(test_folder, "test_folder")
     tar_file.add(zipped_file, "test_folder/myfile.txt")
     tar_file.close()
     assert (os.path.exists(file_path))
+    http_server.file_path = file_path
 
     @http_server.server.get("/this_is_not_the_file_name")
     def get_file():
@@ -213,6 +217,25 @@ def bottle_server_zip():
     def get_file3():
         return static_file(os.path.basename(file_path), root=os.path.dirname(file_path))
 
+    @http_server.server.get("/checksum.tgz")
+    def get_file4():
+        return static_file(os.path.basename(file_path), root=os.path.dirname(file_path),
+                           mimetype="application/octet-stream")
+
+    links_path = os.path.join(tmp_folder, "links.tar.gz")
+    with tarfile.open(links_path, "w:gz") as tar_file:
+        tar_file.add(zipped_file, "test_folder/myfile.txt")
+        link = tarfile.TarInfo("test_folder/link.txt")
+        link.type = tarfile.SYMTYPE
+        link.linkname = "myfile.txt"
+        tar_file.addfile(link)
+    http_server.links_path = links_path
+
+    @http_server.server.get("/links.tgz")
+    def get_links():
+        return static_file(os.path.basename(links_path), root=os.path.dirname(links_path),
+                           mimetype="application/octet-stream")
+
     tmp = temp_folder()
     filepath = os.path.join(tmp, "test.txt.gz")
     import gzip
@@ -249,6 +272,107 @@ class TestGet:
                 retry=0, retry_wait=0, strip_root=True)
             assert load("myfile.txt") == "myfile contents!"
 
+    def test_get_tgz_checksum_extracted_while_downloaded(self, bottle_server_zip):
+        conanfile = ConanFileMock()
+        conanfile._conan_requester = requests
+        tmp_folder = temp_folder()
+        sha256 = sha256sum(bottle_server_zip.file_path)
+        with chdir(tmp_folder):
+            with mock.patch("conan.tools.files.files.run_downloader",
+                            side_effect=AssertionError):
+                get(conanfile, "http://localhost:%s/checksum.tgz" % bottle_server_zip.port,
+                    sha256=sha256, strip_root=True)
+            assert load("myfile.txt") == "myfile contents!"
+            assert os.listdir(".") == ["myfile.txt"]
+
+    def test_get_tgz_wrong_checksum(self, bottle_server_zip):
+        conanfile = ConanFileMock()
+        conanfile._conan_requester = requests
+        tmp_folder = temp_folder()
+        with chdir(tmp_folder):
+            with pytest.raises(ConanException, match="sha256 signature failed for 'checksum.tgz'"):
+                get(conanfile, "http://localhost:%s/checksum.tgz" % bottle_server_zip.port,
+                    sha256="bad")
+            assert os.listdir(".") == []
+
+    @pytest.mark.skipif(platform.system() == "Windows", reason="symlinks")
+    def test_get_tgz_links_verified_before_extracting(self, bottle_server_zip):
+        conanfile = ConanFileMock()
+        conanfile._conan_requester = requests
+        sha256 = sha256sum(bottle_server_zip.links_path)
+        with chdir(temp_folder()):
+            # The links are not extracted while downloading, the file is downloaded first
+            with mock.patch("conan.tools.files.files.run_downloader",
+                            wraps=run_downloader) as downloader:
+                get(conanfile, "http://localhost:%s/links.tgz" % bottle_server_zip.port,
+                    sha256=sha256, strip_root=True)
+            assert downloader.called
+            assert os.readlink("link.txt") == "myfile.txt"
+            assert load("link.txt") == "myfile contents!"
+            assert sorted(os.listdir(".")) == ["link.txt", "myfile.txt"]
+
+    def test_get_extracted_cache(self, bottle_server_zip):
+        conanfile = ConanFileMock()
+        conanfile._conan_requester = requests
+        conanfile.conf.define("tools.files.get:extracted_cache", temp_folder())
+        url = "http://localhost:%s/checksum.tgz" % bottle_server_zip.port
+        sha256 = sha256sum(bottle_server_zip.file_path)
+        with chdir(temp_folder()):
+            get(conanfile, url, sha256=sha256, strip_root=True)
+            assert load("myfile.txt") == "myfile contents!"
+            save("myfile.txt", "modified")
+
+        with chdir(temp_folder()):
+            with mock.patch("conan.tools.files.files.run_downloader",
+                            side_effect=AssertionError), \
+                    mock.patch("conan.tools.files.files.run_extracting_downloader",
+                               side_effect=AssertionError):
+                get(conanfile, url, sha256=sha256, strip_root=True)
+            assert "Using the extracted checksum.tgz from the cache" in conanfile.output
+            assert load("myfile.txt") == "myfile contents!"
+            # Other arguments are extracted again
+            get(conanfile, url, sha256=sha256, destination="sub")
+            assert load("sub/test_folder/myfile.txt") == "myfile contents!"
+
+    def test_get_extracted_cache_not_linked(self, bottle_server_zip):
+        conanfile = ConanFileMock()
+        conanfile._conan_requester = requests
+        conanfile.conf.define("tools.files.get:extracted_cache", temp_folder())
+        conanfile.conf.define("core.sources:staging", "auto")
+        url = "http://localhost:%s/checksum.tgz" % bottle_server_zip.port
+        sha256 = sha256sum(bottle_server_zip.file_path)
+        for _ in range(2):
+            with chdir(temp_folder()):
+                get(conanfile, url, sha256=sha256, strip_root=True)
+                # Hard links would share the cached file, modified by tools writing in place
+                assert os.stat("myfile.txt").st_nlink == 1
+                with open("myfile.txt", "a") as f:
+                    f.write(" modified")
+
+    def test_get_extracted_cache_eviction(self, bottle_server_zip):
+        conanfile = ConanFileMock()
+        conanfile._conan_requester = requests
+        extracted_cache = temp_folder()
+        conanfile.conf.define("tools.files.get:extracted_cache", extracted_cache)
+        conanfile.conf.define("tools.files.get:extracted_cache_max_size", 0)
+        url = "http://localhost:%s/checksum.tgz" % bottle_server_zip.port
+        sha256 = sha256sum(bottle_server_zip.file_path)
+        # Left by an interrupted get()
+        orphan = os.path.join(extracted_cache, "somekey.tmp1234")
+        os.makedirs(orphan)
+        os.utime(orphan, (time.time() - 48 * 3600, time.time() - 48 * 3600))
+        recent = os.path.join(extracted_cache, "otherkey.tmp1234")
+        os.makedirs(recent)
+        with chdir(temp_folder()):
+            get(conanfile, url, sha256=sha256, strip_root=True)
+            entries = sorted(os.listdir(extracted_cache))
+            assert entries[1:] == ["otherkey.tmp1234"]
+            get(conanfile, url, sha256=sha256, destination="sub")
+            assert load("sub/test_folder/myfile.txt") == "myfile contents!"
+        # The least recently used one is removed, as the cache is over its max size
+        new_entries = sorted(os.listdir(extracted_cache))
+        assert len(new_entries) == 2 and entries[0] not in new_entries
+
     def test_get_gunzip(self, bottle_server_zip):
         conanfile = ConanFileMock()
         conanfile._conan_requester = requests
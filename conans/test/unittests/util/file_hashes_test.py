@@ -1,12 +1,15 @@
 import os
 import unittest
 
+import mock
 import six
 
 from conans.client.tools.files import check_md5, check_sha1, check_sha256
 from conans.errors import ConanException
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import save
+from conans.client.downloaders.file_downloader import check_checksum
+from conans.util.files import save, md5, file_checksums, HashingWriter, \
+    store_file_checksums
 
 
 class HashesTest(unittest.TestCase):
@@ -29,3 +32,50 @@ class HashesTest(unittest.TestCase):
 
         with six.assertRaisesRegex(self, ConanException, "sha256 signature failed for 'file.txt' file."):
             check_sha256(filepath, "invalid")
+
+    def test_file_checksums(self):
+        folder = temp_folder()
+        filepath = os.path.join(folder, "file.txt")
+        save(filepath, "a file")
+        checksums = file_checksums(filepath)
+        self.assertEqual(checksums, {
+            "md5": "d6d0c756fb8abfb33e652a20e85b70bc",
+            "sha1": "eb599ec83d383f0f25691c184f656d40384f9435",
+            "sha256": "7365d029861e32c521f8089b00a6fb32daf0615025b69b599d1ce53501b845c2"})
+
+        # Modified files are hashed again
+        save(filepath, "other file")
+        self.assertEqual(file_checksums(filepath)["md5"], md5("other file"))
+
+    def test_hashing_writer(self):
+        folder = temp_folder()
+        filepath = os.path.join(folder, "file.txt")
+        with open(filepath, "wb") as f:
+            writer = HashingWriter(f)
+            writer.write(b"a ")
+            writer.write(b"file")
+        store_file_checksums(filepath, writer.checksums)
+        with mock.patch("conans.util.files.open", create=True, side_effect=AssertionError):
+            checksums = file_checksums(filepath, ("md5", "sha1"))
+        self.assertEqual(checksums["sha1"], "eb599ec83d383f0f25691c184f656d40384f9435")
+
+        with mock.patch("conans.util.files.open", create=True, side_effect=AssertionError):
+            checksums = file_checksums(filepath, ("md5",))
+        self.assertEqual(checksums, {"md5": "d6d0c756fb8abfb33e652a20e85b70bc"})
+        # Only the missing ones are computed
+        checksums = file_checksums(filepath)
+        self.assertEqual(checksums["sha256"],
+                         "7365d029861e32c521f8089b00a6fb32daf0615025b69b599d1ce53501b845c2")
+
+    def test_check_checksum_not_remembered(self):
+        folder = temp_folder()
+        filepath = os.path.join(folder, "file.txt")
+        save(filepath, "a file")
+        # Stale remembered checksums, e.g. modified within the mtime granularity
+        store_file_checksums(filepath, {"md5": md5("other file")})
+        with six.assertRaisesRegex(self, ConanException, "md5 signature failed for 'file.txt'"):
+            check_checksum(filepath, md5("other file"), None, None)
+        check_checksum(filepath, "d6d0c756fb8abfb33e652a20e85b70bc", None, None)
+        with six.assertRaisesRegex(self, ConanException, "sha1 signature failed for 'file.txt'"):
+            check_checksum(filepath, None, "invalid", None,
+                           checksums={"sha1": "eb599ec83d383f0f25691c184f656d40384f9435"})
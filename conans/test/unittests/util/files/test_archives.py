@@ -0,0 +1,105 @@
+import io
+import os
+import tarfile
+import zipfile
+
+import mock
+import pytest
+
+from conans.errors import ConanException
+from conans.test.utils.test_files import temp_folder
+from conans.util.archives import extract_tar_stream, extract_zip
+from conans.util.files import load
+
+
+def _zip(files):
+    zip_path = os.path.join(temp_folder(), "archive.zip")
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr(zipfile.ZipInfo("root/"), "")
+        for name, contents in files.items():
+            z.writestr(name, contents)
+    return zip_path
+
+
+def _tgz(files, links=None):
+    data = io.BytesIO()
+    with tarfile.open(fileobj=data, mode="w:gz") as tgz:
+        for name, contents in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(contents)
+            tgz.addfile(info, io.BytesIO(contents.encode()))
+        for name, target in (links or {}).items():
+            info = tarfile.TarInfo(name)
+            info.type = tarfile.SYMTYPE
+            info.linkname = target
+            tgz.addfile(info)
+    data = data.getvalue()
+    return [data[i:i + 100] for i in range(0, len(data), 100)]
+
+
+@pytest.mark.parametrize("strip_root", [False, True])
+@mock.patch("conans.util.archives._EXTRACT_WORKERS", 4)
+def test_extract_zip_parallel(strip_root):
+    files = {"root/folder%s/file%s.txt" % (i % 5, i): "contents %s" % i for i in range(100)}
+    files["root/file.h"] = "header"
+    destination = temp_folder()
+    extracted = []
+    with zipfile.ZipFile(_zip(files)) as z:
+        extract_zip(z, destination, pattern="*.txt", strip_root=strip_root,
+                    progress=extracted.append)
+    root = destination if strip_root else os.path.join(destination, "root")
+    assert load(os.path.join(root, "folder4", "file99.txt")) == "contents 99"
+    assert sorted(os.listdir(root)) == ["folder%s" % i for i in range(5)]
+    assert sum(len(os.listdir(os.path.join(root, f))) for f in os.listdir(root)) == 100
+    assert extracted[-1] == sum(len(c) for n, c in files.items() if n.endswith(".txt"))
+
+
+def test_extract_zip_strip_root_errors():
+    with zipfile.ZipFile(_zip({"root/file.txt": "", "other/file.txt": ""})) as z:
+        with pytest.raises(ConanException, match="The zip file contains more than 1 folder"):
+            extract_zip(z, temp_folder(), strip_root=True)
+
+
+def test_extract_tar_stream():
+    destination = temp_folder()
+    chunks = _tgz({"root/folder/file.txt": "contents", "root/file.h": "header"})
+    extract_tar_stream(iter(chunks), destination, pattern="*.txt", strip_root=True)
+    assert os.listdir(destination) == ["folder"]
+    assert load(os.path.join(destination, "folder", "file.txt")) == "contents"
+
+
+@pytest.mark.parametrize("files", [{"../outside.txt": "contents"},
+                                   {"/tmp/outside.txt": "contents"}])
+def test_extract_tar_stream_outside_destination(files):
+    with pytest.raises(ConanException, match="is outside the destination folder"):
+        extract_tar_stream(iter(_tgz(files)), temp_folder())
+
+
+@pytest.mark.parametrize("links", [{"folder/link": "../../outside"},
+                                   {"folder/link": "file.txt"}])
+def test_extract_tar_stream_links(links):
+    with pytest.raises(ConanException, match="is not a file or a folder"):
+        extract_tar_stream(iter(_tgz({"folder/file.txt": "contents"}, links)), temp_folder())
+
+
+def test_extract_tar_stream_chained_links():
+    data = io.BytesIO()
+    with tarfile.open(fileobj=data, mode="w:gz") as tgz:
+        folder = tarfile.TarInfo("a")
+        folder.type = tarfile.DIRTYPE
+        tgz.addfile(folder)
+        for name in ("a/b", "a/b/c"):
+            link = tarfile.TarInfo(name)
+            link.type = tarfile.SYMTYPE
+            link.linkname = ".."
+            tgz.addfile(link)
+        evil = tarfile.TarInfo("a/b/c/evil.txt")
+        evil.size = 4
+        tgz.addfile(evil, io.BytesIO(b"evil"))
+
+    base = temp_folder()
+    destination = os.path.join(base, "dest", "inner")
+    with pytest.raises(ConanException, match="'a/b' is not a file or a folder"):
+        extract_tar_stream(iter([data.getvalue()]), destination)
+    assert not os.path.exists(os.path.join(base, "dest", "evil.txt"))
+    assert not os.path.exists(os.path.join(base, "evil.txt"))
@@ -0,0 +1,90 @@
+import fnmatch
+import os
+
+import pytest
+from mock import patch
+
+from conans.client.file_copier import FileCopier
+from conans.test.utils.test_files import temp_folder
+from conans.util.file_selection import DirectorySnapshots, compile_patterns, directory_snapshots
+from conans.util.files import save
+
+
+@pytest.mark.parametrize("ignore_case", [True, False])
+@pytest.mark.parametrize("normcase", [True, False])
+def test_compile_patterns(ignore_case, normcase):
+    patterns = ["*.h", "include/*.HPP", "lib?.a", "[ab]*.txt", "*/build/*"]
+    matcher = compile_patterns(patterns, ignore_case, normcase)
+    names = ["file.h", "FILE.H", "include/file.hpp", "include/file.HPP", "lib1.a", "lib12.a",
+             "a.txt", "c.txt", "src/build/file.cpp", "src/file.cpp", "file.h.in"]
+    for name in names:
+        if ignore_case:
+            expected = any(fnmatch.fnmatch(name.lower(), p.lower()) if normcase
+                           else fnmatch.fnmatchcase(name.lower(), p.lower()) for p in patterns)
+        else:
+            expected = any(fnmatch.fnmatch(name, p) if normcase else fnmatch.fnmatchcase(name, p)
+                           for p in patterns)
+        assert matcher(name) == expected, name
+    assert compile_patterns([], ignore_case) is None
+
+
+def _tree():
+    folder = temp_folder()
+    for f in ("a.txt", "sub/b.txt", "sub/subsub/c.txt", "other/d.txt"):
+        save(os.path.join(folder, f), f)
+    return folder
+
+
+def test_walk_same_as_os_walk():
+    folder = _tree()
+    snapshots = DirectorySnapshots()
+    for _ in range(2):
+        walked = [(root, sorted(dirs), sorted(files)) for root, dirs, files
+                  in snapshots.walk(folder)]
+        expected = [(root, sorted(dirs), sorted(files)) for root, dirs, files in os.walk(folder)]
+        assert sorted(walked) == sorted(expected)
+
+    # Pruning the subfolders
+    walked = []
+    for root, dirs, _ in snapshots.walk(folder):
+        walked.append(os.path.relpath(root, folder))
+        if "sub" in dirs:
+            dirs.remove("sub")
+    assert sorted(walked) == [".", "other"]
+
+
+def test_walk_reuses_listings_until_written():
+    folder = _tree()
+    snapshots = DirectorySnapshots()
+    with patch("conans.util.file_selection._RACY_NS", 0):
+        list(snapshots.walk(folder))
+        with patch("os.scandir", side_effect=AssertionError("listed again")):
+            list(snapshots.walk(folder))
+
+        # Writing a new file in a folder invalidates its listing only
+        os.utime(os.path.join(folder, "sub"), ns=(0, 0))  # Ensure a different timestamp
+        save(os.path.join(folder, "sub", "new.txt"), "new")
+        listed = []
+        original_scandir = os.scandir
+
+        def scandir(path):
+            listed.append(path)
+            return original_scandir(path)
+
+        with patch("os.scandir", side_effect=scandir):
+            files = [f for _, _, fs in snapshots.walk(folder) for f in fs]
+        assert listed == [os.path.join(folder, "sub")]
+        assert "new.txt" in files
+
+
+def test_file_copier_walks_once():
+    src = _tree()
+    dst = temp_folder()
+    with directory_snapshots(), patch("conans.util.file_selection._RACY_NS", 0):
+        copier = FileCopier([src], dst)
+        copier("*.txt", src="sub")
+        with patch("os.scandir", side_effect=AssertionError("listed again")):
+            copier("b.txt", src="sub", dst="other")
+            copier("*.txt", src="sub", excludes="subsub")
+    assert os.path.exists(os.path.join(dst, "subsub", "c.txt"))
+    assert os.path.exists(os.path.join(dst, "other", "b.txt"))
@@ -0,0 +1,108 @@
+import os
+import shutil
+
+import pytest
+from mock import patch
+
+from conans.errors import ConanException
+from conans.model.conf import ConfDefinition
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, merge_directories, save
+from conans.util.staging import copy_files, copy_tree, get_staging_method
+
+
+def _source_tree():
+    folder = os.path.join(temp_folder(), "source")
+    save(os.path.join(folder, "file.txt"), "contents")
+    save(os.path.join(folder, "subdir", "other.txt"), "other contents")
+    return folder
+
+
+@pytest.mark.parametrize("method", ["copy", "reflink", "auto"])
+def test_copy_tree(method):
+    src = _source_tree()
+    dst = os.path.join(temp_folder(), "build")
+    copy_tree(src, dst, method)
+    assert load(os.path.join(dst, "file.txt")) == "contents"
+    assert load(os.path.join(dst, "subdir", "other.txt")) == "other contents"
+    if method == "copy":
+        assert os.stat(os.path.join(src, "file.txt")).st_nlink == 1
+
+
+def test_hardlinks_unshared_when_saved():
+    src = _source_tree()
+    dst = os.path.join(temp_folder(), "build")
+    with patch("conans.util.staging._reflink", side_effect=OSError):
+        copy_tree(src, dst, "auto")
+    src_file, dst_file = os.path.join(src, "file.txt"), os.path.join(dst, "file.txt")
+    assert os.path.samefile(src_file, dst_file)
+
+    save(dst_file, "modified")
+    assert not os.path.samefile(src_file, dst_file)
+    assert load(src_file) == "contents"
+    assert load(dst_file) == "modified"
+
+
+def test_merge_directories_replaces_linked_files():
+    src = _source_tree()
+    dst = os.path.join(temp_folder(), "build")
+    with patch("conans.util.staging._reflink", side_effect=OSError):
+        copy_tree(src, dst, "auto")
+        # Merging over a linked file mustn't write through the link
+        other = os.path.join(temp_folder(), "other")
+        save(os.path.join(other, "file.txt"), "new contents")
+        merge_directories(other, dst, staging="auto")
+    assert load(os.path.join(src, "file.txt")) == "contents"
+    assert load(os.path.join(dst, "file.txt")) == "new contents"
+
+
+def test_staging_method_conf():
+    conf = ConfDefinition()
+    assert get_staging_method(conf) == "copy"
+    conf.loads("core.sources:staging=auto")
+    assert get_staging_method(conf) == "auto"
+    conf.loads("core.sources:staging=symlink")
+    with pytest.raises(ConanException, match="Invalid 'core.sources:staging' value 'symlink'"):
+        get_staging_method(conf)
+
+
+def test_copy_files():
+    src = _source_tree()
+    for i in range(40):
+        save(os.path.join(src, "many", "file%s.txt" % i), "contents %s" % i)
+    dst = os.path.join(temp_folder(), "dst")
+    files = [(os.path.join(src, "many", "file%s.txt" % i),
+              os.path.join(dst, "folder%s" % (i % 4), "file%s.txt" % i)) for i in range(40)]
+    # Many files to the same destination, the last one wins
+    files.append((os.path.join(src, "file.txt"), os.path.join(dst, "folder0", "file0.txt")))
+    copy_files(files)
+    assert load(os.path.join(dst, "folder0", "file0.txt")) == "contents"
+    assert load(os.path.join(dst, "folder3", "file39.txt")) == "contents 39"
+    assert sum(len(os.listdir(os.path.join(dst, f))) for f in os.listdir(dst)) == 40
+
+
+def test_copy_over_hardlink():
+    src = _source_tree()
+    dst = os.path.join(temp_folder(), "build")
+    with patch("conans.util.staging._reflink", side_effect=OSError):
+        copy_tree(src, dst, "auto")
+    other = os.path.join(temp_folder(), "other.txt")
+    save(other, "other")
+    copy_files([(other, os.path.join(dst, "file.txt"))])
+    assert load(os.path.join(src, "file.txt")) == "contents"
+    assert load(os.path.join(dst, "file.txt")) == "other"
+
+
+def test_copy_files_order_and_copy_function():
+    src = _source_tree()
+    dst = temp_folder()
+    files = [(os.path.join(src, "file.txt"), os.path.join(dst, name)) for name in "cabd"]
+    files.append((os.path.join(src, "file.txt"), os.path.join(dst, "a")))
+    copied = []
+
+    def copy_function(s, d):
+        copied.append(os.path.basename(d))
+        return shutil.copy(s, d)
+
+    copy_files(files, copy_function=copy_function)
+    assert copied == ["c", "b", "d", "a"]
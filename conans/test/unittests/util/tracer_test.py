@@ -0,0 +1,37 @@
+import json
+import os
+import threading
+
+import fasteners
+from mock import patch
+
+from conans.client import tools
+from conans.test.utils.test_files import temp_folder
+from conans.util import tracer
+from conans.util.files import load
+
+
+def test_tracer_buffered_writes():
+    trace_file = os.path.join(temp_folder(), "conan_trace.log")
+    lock = fasteners.InterProcessLock
+
+    def log_downloads(thread):
+        for i in range(100):
+            tracer.log_download("http://myserver/%s/file%s" % (thread, i), 0.1)
+
+    with patch.object(tracer.fasteners, "InterProcessLock", side_effect=lock) as locks:
+        with tools.environment_append({"CONAN_TRACE_FILE": trace_file}):
+            threads = [threading.Thread(target=log_downloads, args=(t, )) for t in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            tracer.flush_log()
+
+    records = [json.loads(line) for line in load(trace_file).splitlines()]
+    assert len(records) == 400
+    for thread in range(4):
+        urls = [r["url"] for r in records if r["url"].startswith("http://myserver/%s/" % thread)]
+        assert urls == ["http://myserver/%s/file%s" % (thread, i) for i in range(100)]
+    # The file is locked once for every batch of records, not for every one
+    assert 1 <= locks.call_count < 400
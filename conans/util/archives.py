@@ -0,0 +1,225 @@
+""" Extraction of the archives of get(), unzip() and untargz(), both for conans.tools and
+conan.tools.files:
+
+- extract_zip(): the members of a zip are compressed independently, so they are decompressed
+  in parallel, with a different handle of the zip file for every thread
+- extract_tar(): a tar is a stream, its members are extracted in a single pass. The stream can
+  be the HTTP response of the download (see FileDownloader.extract())
+
+The 'strip_root' and 'pattern' arguments are applied to every member while they are extracted
+"""
+import os
+import platform
+import posixpath
+import tarfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+
+from conans.errors import ConanException
+
+TAR_EXTENSIONS = (".tar.gz", ".tgz", ".tbz2", ".tar.bz2", ".tar", ".tar.xz", ".txz")
+# Decompressing is CPU bound, zlib releases the GIL while inflating, one thread per CPU
+_EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+_MIN_PARALLEL_MEMBERS = 16
+
+
+def is_tar(filename):
+    return filename.endswith(TAR_EXTENSIONS)
+
+
+class _RootStripper(object):
+    """ removes the root folder from the names of the members, checking all of them are inside
+    the same one. Returns None for the entry of the root folder itself
+    """
+
+    def __init__(self, kind):
+        self._kind = kind
+        self._root_file = False
+        self.root = None
+
+    def __call__(self, name, is_dir):
+        name = name.replace("\\", "/")
+        root, _, rest = name.partition("/")
+        if self.root is None:
+            self.root = root
+            # A file in the root is an error, the message depends on the other members
+            self._root_file = not rest and not (is_dir or name.endswith("/"))
+        elif root != self.root or self._root_file or not (rest or is_dir):
+            raise ConanException("The %s file contains more than 1 folder in the root"
+                                 % self._kind)
+        return rest.rstrip("/") or None
+
+    def finish(self):
+        if self._root_file:
+            raise ConanException("The %s file contains a file in the root" % self._kind)
+
+
+def _zip_members(infos, pattern, strip_root):
+    strip = _RootStripper("zip") if strip_root else None
+    for info in infos:
+        if pattern and not fnmatch(info.filename, pattern):
+            continue
+        if strip:
+            name = strip(info.filename, info.is_dir())
+            if name is None:
+                continue
+            info.filename = name + "/" if info.is_dir() else name
+        yield info
+    if strip:
+        strip.finish()
+
+
+def zip_size(zip_file, pattern=None):
+    """ uncompressed size of the members of the zipfile.ZipFile to extract
+    """
+    return sum(i.file_size for i in zip_file.infolist()
+               if not pattern or fnmatch(i.filename, pattern))
+
+
+def extract_zip(zip_file, destination, pattern=None, strip_root=False, keep_permissions=False,
+                output=None, progress=None):
+    """ extracts the zipfile.ZipFile to the destination folder. The members are extracted by a
+    pool of threads, except the directories and the first member of every folder, extracted by
+    this thread creating the folders, so the threads never create them concurrently.
+    progress(extracted_size) is called with the uncompressed size of the members extracted
+    """
+    infos = zip_file.infolist()
+    keep_permissions = keep_permissions and platform.system() != "Windows"
+    handles = threading.local()
+    opened = []
+
+    def extract(info, z=None):
+        if z is None:
+            z = getattr(handles, "zip_file", None)
+            if z is None:
+                z = handles.zip_file = zipfile.ZipFile(zip_file.filename, "r")
+                opened.append(z)
+        try:
+            target = z.extract(info, destination)
+            if keep_permissions:
+                # Could be dangerous if the ZIP has been created in a non nix system
+                # https://bugs.python.org/issue15795
+                os.chmod(target, info.external_attr >> 16 & 0xFFF)
+        except Exception as e:
+            if output:
+                output.error("Error extract %s\n%s" % (info.filename, str(e)))
+
+    parallel = (zip_file.filename and _EXTRACT_WORKERS > 1 and
+                len(infos) >= _MIN_PARALLEL_MEMBERS)
+    executor = ThreadPoolExecutor(max_workers=_EXTRACT_WORKERS) if parallel else None
+    try:
+        folders = set()
+        futures = []
+        extracted_size = 0
+        for info in _zip_members(infos, pattern, strip_root):
+            extracted_size += info.file_size
+            if progress:
+                progress(extracted_size)
+            folder = posixpath.dirname(info.filename.rstrip("/"))
+            if executor is None or info.is_dir() or folder not in folders:
+                extract(info, zip_file)
+                folders.add(folder)
+            else:
+                futures.append(executor.submit(extract, info))
+        for future in futures:
+            future.result()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        for z in opened:
+            z.close()
+
+
+def _tar_members(tar, pattern, strip_root):
+    strip = _RootStripper("tgz") if strip_root else None
+    for member in tar:
+        if strip:
+            name = strip(member.name, member.isdir())
+            if name is None:
+                continue
+            member.name = name
+            member.path = member.name
+            if member.linkpath.startswith(strip.root):
+                # https://github.com/conan-io/conan/issues/11065
+                linkpath = member.linkpath.replace("\\", "/")
+                member.linkpath = linkpath.split("/", 1)[1]
+                member.linkname = member.linkpath
+        if pattern and not fnmatch(member.name, pattern):
+            continue
+        yield member
+    if strip:
+        strip.finish()
+
+
+def _checked_members(members):
+    """ the archives extracted before verifying their checksum cannot write outside of the
+    destination folder: no absolute paths, no '..' and only files and folders. The links could
+    point outside, also chaining links to '..', so those archives are downloaded and verified
+    before extracting them
+    """
+    for member in members:
+        if not (member.isfile() or member.isdir()):
+            raise ConanException("The archive member '%s' is not a file or a folder, it cannot "
+                                 "be extracted while downloading" % member.name)
+        path = member.name.replace("\\", "/")
+        if (posixpath.isabs(path) or os.path.splitdrive(path)[0] or
+                posixpath.normpath(path).split("/")[0] == ".."):
+            raise ConanException("The archive member '%s' is outside the destination folder"
+                                 % member.name)
+        yield member
+
+
+def extract_tar(tar, destination, pattern=None, strip_root=False):
+    """ extracts the members of the tarfile.TarFile, as they are read
+    """
+    if not pattern and not strip_root:
+        tar.extractall(destination)
+    else:
+        tar.extractall(destination, members=_tar_members(tar, pattern, strip_root))
+
+
+class _ChunksReader(object):
+    """ file object reading the data of an iterator of chunks of bytes, to read a tar archive
+    from a stream
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._chunk = b""
+        self._offset = 0
+
+    def read(self, size=-1):
+        parts = []
+        while size != 0:
+            if self._offset >= len(self._chunk):
+                self._chunk, self._offset = next(self._chunks, b""), 0
+                if not self._chunk:
+                    break
+            end = len(self._chunk) if size < 0 else self._offset + size
+            part = self._chunk[self._offset:end]
+            self._offset += len(part)
+            parts.append(part)
+            if size > 0:
+                size -= len(part)
+        return b"".join(parts)
+
+    def drain(self):
+        """ reads the rest of the stream, after the end of the archive
+        """
+        for _ in self._chunks:
+            pass
+
+
+def extract_tar_stream(chunks, destination, pattern=None, strip_root=False):
+    """ extracts the tar archive (compressed or not) of the iterator of chunks of bytes, in a
+    single pass. The whole iterator is consumed. As it is not verified yet, the members
+    outside of the destination and the links are an error
+    """
+    reader = _ChunksReader(chunks)
+    with tarfile.open(fileobj=reader, mode="r|*") as tar:
+        members = _tar_members(tar, pattern, strip_root) if pattern or strip_root else tar
+        tar.extractall(destination, members=_checked_members(members))
+    reader.drain()
+
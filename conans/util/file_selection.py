@@ -0,0 +1,136 @@
+""" Helpers to select the files to copy from a folder, used by FileCopier (self.copy()) and by
+conan.tools.files.copy():
+
+- compile_patterns(): all the fnmatch patterns of a copy in a single compiled regex
+- DirectorySnapshots: os.walk() replacement that reuses the listings of the folders while they
+  don't change, so the successive copies from the same folder in a recipe method (typically the
+  build folder in package()) walk it only once
+"""
+import fnmatch
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+# Folders modified in this period before being listed are listed again, so a change in the same
+# tick of the file system timestamps (2 seconds in FAT) is never missed
+_RACY_NS = 2 * 10 ** 9
+
+
+def compile_patterns(patterns, ignore_case=False, normcase=False):
+    """ returns a function checking if a name matches any of the fnmatch patterns, in a single
+    regex match. It is the same as:
+      - any(fnmatch.fnmatchcase(name, p) for p in patterns) by default
+      - any(fnmatch.fnmatch(name, p) for p in patterns) with normcase
+    with both the name and the patterns lowercased if ignore_case. None if there are no patterns
+    """
+    if not patterns:
+        return None
+
+    lower = ignore_case
+    normcase = normcase and os.path.normcase("A") != "A"  # Only does something in Windows
+
+    def normalize(name):
+        if lower:
+            name = name.lower()
+        if normcase:
+            name = os.path.normcase(name)
+        return name
+
+    match = re.compile("|".join(fnmatch.translate(normalize(p)) for p in patterns)).match
+    if not lower and not normcase:
+        return lambda name: match(name) is not None
+    return lambda name: match(normalize(name)) is not None
+
+
+class _Listing(object):
+    __slots__ = ("mtime", "listed", "dirs", "links", "files")
+
+    def __init__(self, mtime, listed, dirs, links, files):
+        self.mtime = mtime
+        self.listed = listed
+        self.dirs = dirs
+        self.links = links  # The subfolders that are symlinks
+        self.files = files
+
+
+class DirectorySnapshots(object):
+    """ Listings of the folders walked, reused while the modification time of every folder
+    doesn't change. Creating, removing or renaming an entry of a folder updates its
+    modification time, so it is listed again when it is written (by the copies, or by anything
+    else). Walking a tree that didn't change needs only a stat() per folder
+    """
+
+    def __init__(self):
+        self._listings = {}
+
+    def walk(self, top, followlinks=False):
+        """ same as os.walk(top, followlinks=followlinks), top-down. The subfolders not to be
+        walked can be removed from the yielded list, like with os.walk
+        """
+        pending = [top]
+        while pending:
+            root = pending.pop()
+            listing = self._list(root)
+            if listing is None:
+                continue
+            dirs, files = list(listing.dirs), list(listing.files)
+            yield root, dirs, files
+            for d in reversed(dirs):
+                if followlinks or d not in listing.links:
+                    pending.append(os.path.join(root, d))
+
+    def _list(self, folder):
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except OSError:
+            self._listings.pop(folder, None)
+            return None
+        listing = self._listings.get(folder)
+        if listing is not None and listing.mtime == mtime and mtime < listing.listed - _RACY_NS:
+            return listing
+
+        listed = int(time.time() * 10 ** 9)
+        dirs, links, files = [], set(), []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        dirs.append(entry.name)
+                        if entry.is_symlink():
+                            links.add(entry.name)
+                    else:
+                        files.append(entry.name)
+        except OSError:
+            self._listings.pop(folder, None)
+            return None
+        listing = _Listing(mtime, listed, dirs, links, files)
+        self._listings[folder] = listing
+        return listing
+
+
+_scope = threading.local()
+
+
+@contextmanager
+def directory_snapshots():
+    """ the copies done inside share the same DirectorySnapshots, used while running the recipe
+    methods
+    """
+    previous = getattr(_scope, "snapshots", None)
+    _scope.snapshots = DirectorySnapshots()
+    try:
+        yield _scope.snapshots
+    finally:
+        _scope.snapshots = previous
+
+
+def current_snapshots():
+    """ the DirectorySnapshots of the current scope, or new ones if there is no scope
+    """
+    return getattr(_scope, "snapshots", None) or DirectorySnapshots()
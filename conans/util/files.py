@@ -9,6 +9,7 @@ import stat
 import sys
 import tarfile
 import tempfile
+import threading
 
 
 from os.path import abspath, join as joinpath, realpath
@@ -168,12 +169,156 @@ def _generic_algorithm_sum(file_path, algorithm_name):
         return m.hexdigest()
 
 
+_CHECKSUM_ALGORITHMS = ("md5", "sha1", "sha256")
+# The checksums of the Conan artifacts, stored in the package metadata and the trace file
+ARTIFACT_CHECKSUMS = ("md5", "sha1")
+_checksums_lock = threading.Lock()
+_checksums = {}  # {abs_path: (stat_key, {algorithm: hexdigest})}
+_MAX_CHECKSUMS = 4096
+
+
+def _new_hash(algorithm_name):
+    try:
+        return hashlib.new(algorithm_name)
+    except ValueError:  # FIPS error https://github.com/conan-io/conan/issues/7800
+        return hashlib.new(algorithm_name, usedforsecurity=False)
+
+
+def _stat_key(file_path):
+    st = os.stat(file_path)
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+def check_with_algorithm_sum(algorithm_name, file_path, signature, real_signature=None):
+    """ raises if the checksum of the file is not the provided signature. 'real_signature' is
+    the checksum computed while writing the file, if it is not given the file is read
+    """
+    if real_signature is None:
+        real_signature = _generic_algorithm_sum(file_path, algorithm_name)
+    if real_signature != signature.lower():
+        from conans.errors import ConanException  # conans.errors imports this module
+        raise ConanException("%s signature failed for '%s' file. \n"
+                             " Provided signature: %s  \n"
+                             " Computed signature: %s" % (algorithm_name,
+                                                          os.path.basename(file_path),
+                                                          signature,
+                                                          real_signature))
+
+
+class HashingWriter(object):
+    """ File-like wrapper that computes the checksums of the data written through it, so the
+    checksums of a downloaded or compressed file are obtained in the same pass that writes it,
+    without reading it again
+    """
+    def __init__(self, file_handler, algorithms=ARTIFACT_CHECKSUMS):
+        self._file_handler = file_handler
+        self._hashes = [(a, _new_hash(a)) for a in algorithms]
+
+    def write(self, data):
+        for _, h in self._hashes:
+            h.update(data)
+        return self._file_handler.write(data)
+
+    def __getattr__(self, item):
+        return getattr(self._file_handler, item)
+
+    @property
+    def checksums(self):
+        return {a: h.hexdigest() for a, h in self._hashes}
+
+
+def _remember_checksums(file_path, key, checksums):
+    with _checksums_lock:
+        _checksums.pop(file_path, None)
+        if len(_checksums) >= _MAX_CHECKSUMS:
+            _checksums.pop(next(iter(_checksums)))
+        _checksums[file_path] = key, checksums
+
+
+def store_file_checksums(file_path, checksums):
+    """ remembers the checksums of a file that has just been completely written, computed while
+    writing it. They are returned by file_checksums() while the file is not modified
+    """
+    file_path = os.path.abspath(file_path)
+    _remember_checksums(file_path, _stat_key(file_path), checksums)
+
+
+def file_checksums(file_path, algorithms=_CHECKSUM_ALGORITHMS):
+    """ checksums of a file, as a {algorithm: hexdigest} dict. The ones that were not stored
+    while writing the file are computed reading the file just once.
+    They are remembered while the file size, mtime and inode don't change, the checks of
+    checksums provided by users must not rely on them, but use check_with_algorithm_sum()
+    """
+    file_path = os.path.abspath(file_path)
+    key = _stat_key(file_path)
+    checksums = {}
+    with _checksums_lock:
+        stored = _checksums.get(file_path)
+    if stored is not None and stored[0] == key:
+        checksums = stored[1]
+
+    missing = [a for a in algorithms if a not in checksums]
+    if missing:
+        hashes = [(a, _new_hash(a)) for a in missing]
+        with open(file_path, 'rb') as fh:
+            while True:
+                data = fh.read(65536)
+                if not data:
+                    break
+                for _, h in hashes:
+                    h.update(data)
+        checksums = dict(checksums)
+        checksums.update((a, h.hexdigest()) for a, h in hashes)
+        _remember_checksums(file_path, key, checksums)
+    return {a: checksums[a] for a in algorithms}
+
+
+def unshare_file(path):
+    """ replaces a file hard linked with others (i.e. the sources staged with hard links, see
+    conans.util.staging) with a copy, so writing it doesn't modify the other ones
+    """
+    try:
+        if os.lstat(path).st_nlink < 2:
+            return
+    except OSError:  # Doesn't exist
+        return
+    tmp_path = path + ".conan_unshare"
+    shutil.copy2(path, tmp_path)
+    os.replace(tmp_path, path)
+
+
+_saved_files = threading.local()
+
+
+@contextmanager
+def record_saved_files():
+    """ collects the absolute paths of the files written by save() in this thread while in the
+    context, also those not written as they didn't change, e.g. the outputs of an install
+    """
+    paths = set()
+    previous = getattr(_saved_files, "paths", None)
+    _saved_files.paths = paths
+    try:
+        yield paths
+    finally:
+        _saved_files.paths = previous
+
+
+def add_saved_file(path):
+    """ records the file as written, for the active record_saved_files(), if any
+    """
+    paths = getattr(_saved_files, "paths", None)
+    if paths is not None:
+        paths.add(os.path.abspath(path))
+
+
 def save_append(path, content, encoding="utf-8"):
     try:
         os.makedirs(os.path.dirname(path))
     except Exception:
         pass
 
+    unshare_file(path)
     with open(path, "ab") as handle:
         handle.write(to_file_bytes(content, encoding=encoding))
 
@@ -199,12 +344,14 @@ def save(path, content, only_if_modified=False, encoding="utf-8"):
             raise
 
     new_content = to_file_bytes(content, encoding)
+    add_saved_file(path)
 
     if only_if_modified and os.path.exists(path):
         old_content = load(path, binary=True, encoding=encoding)
         if old_content == new_content:
             return
 
+    unshare_file(path)
     with open(path, "wb") as handle:
         handle.write(new_content)
 
@@ -389,7 +536,12 @@ def exception_message_safe(exc):
         return decode_text(repr(exc))
 
 
-def merge_directories(src, dst, excluded=None):
+def merge_directories(src, dst, excluded=None, staging=None):
+    """ copies the src folder contents into dst, staging the files with the given method
+    (conans.util.staging), copying them by default
+    """
+    from conans.util.staging import FileStager
+    copy_file = FileStager(staging).copy if staging else shutil.copy2
     src = os.path.normpath(src)
     dst = os.path.normpath(dst)
     excluded = excluded or []
@@ -441,4 +593,4 @@ def merge_directories(src, dst, excluded=None):
             if os.path.islink(src_file):
                 link_to_rel(src_file)
             else:
-                shutil.copy2(src_file, dst_file)
+                copy_file(src_file, dst_file)
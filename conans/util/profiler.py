@@ -0,0 +1,88 @@
+""" Span based profiling of the Conan commands, enabled with CONAN_PERF_TRACE_FILE (or the
+'perf_trace_file' of the [log] section of conan.conf), the absolute path of a file.
+
+Every command records the time of its phases: the expansion of every node of the graph, the
+recipe loads, the version ranges resolution, every call to the remotes (binary analysis,
+downloads and uploads), the unpacking and compression of every artifact, the build(),
+package() and package_info() methods and every generator. When the command finishes, the
+spans are appended to the file in the Chrome trace event format, that can be loaded in
+https://ui.perfetto.dev or chrome://tracing
+
+The file is a JSON array without the closing bracket, allowed by the format, so the spans of
+many commands and processes can be appended to the same file
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import fasteners
+
+from conans.errors import ConanException
+from conans.util.log import logger
+
+# The spans of the command being profiled, None if not profiling
+_events = None
+
+
+def _get_trace_file():
+    trace_path = os.environ.get("CONAN_PERF_TRACE_FILE", None)
+    if trace_path is not None:
+        if not os.path.isabs(trace_path):
+            raise ConanException("Bad CONAN_PERF_TRACE_FILE value. The specified "
+                                 "path has to be an absolute path to a file.")
+        if not os.path.isdir(os.path.dirname(trace_path)):
+            raise ConanException("Bad CONAN_PERF_TRACE_FILE value. The specified "
+                                 "path doesn't exist: '%s'" % os.path.dirname(trace_path))
+    return trace_path
+
+
+@contextmanager
+def span(name, cat, **args):
+    """ times the block as a span of the command being profiled, if any. 'cat' is the category
+    of the span (graph, remote, build...) and 'args' extra information, shown with the span
+    """
+    events = _events
+    if events is None:
+        yield
+        return
+    start = time.time()
+    try:
+        yield
+    finally:
+        end = time.time()
+        # The list is shared by all the threads, list.append() is thread safe
+        events.append({"name": name, "cat": cat, "ph": "X", "ts": int(start * 1e6),
+                       "dur": int((end - start) * 1e6), "pid": os.getpid(),
+                       "tid": threading.get_ident(), "args": args})
+
+
+def _write_events(trace_path, events):
+    # A single write of the whole command, not one for every span
+    data = "".join(json.dumps(e, default=str) + ",\n" for e in events)
+    with fasteners.InterProcessLock(trace_path + ".lock", logger=logger):
+        with open(trace_path, "a") as trace_file:
+            if trace_file.tell() == 0:
+                data = "[\n" + data
+            trace_file.write(data)
+
+
+@contextmanager
+def profile_command(name, **args):
+    """ profiles the command, if enabled. The commands run by other commands (e.g. from the
+    conan_api methods) are spans of the outer one
+    """
+    global _events
+    trace_path = _get_trace_file() if _events is None else None
+    if not trace_path:
+        with span(name, "command", **args):
+            yield
+        return
+    _events = []
+    try:
+        with span(name, "command", **args):
+            yield
+    finally:
+        events, _events = _events, None
+        _write_events(trace_path, events)
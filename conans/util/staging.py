@@ -0,0 +1,146 @@
+""" Staging of the source files from the export folders to the source folder, and from the source
+folder to the build folders, selected by the 'core.sources:staging' conf:
+
+- "copy" (default): the files are copied
+- "reflink": copy-on-write clones of the files, in file systems supporting them (Btrfs, XFS,
+  APFS...), that share the data until it is modified. Falls back to copy when not supported
+- "auto": reflinks if possible, otherwise hard links, otherwise copy
+
+Hard links share the data with the original file, modifying a hard linked file in place would
+modify the original sources too. The Conan helpers writing files (save(), replace_in_file()...)
+break the link before writing them (see unshare_file()), and patch() replaces the file, but the
+tools modifying the files in place in the build() method are not protected. So the files are
+never hard linked from the export folders, that must keep matching the recipe revision, they
+are reflinked or copied to the source folder, and only that copy is linked to the build folders.
+
+The files imported and deployed from a read-only cache (CONAN_READ_ONLY_CACHE) use "auto" if
+CONAN_HARDLINK_IMPORTS is enabled, as they cannot be modified. Otherwise they are copied.
+"""
+import errno
+import os
+import platform
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from conans.errors import ConanException
+from conans.util.env_reader import get_env
+
+STAGING_COPY = "copy"
+STAGING_REFLINK = "reflink"
+STAGING_AUTO = "auto"
+STAGING_METHODS = (STAGING_COPY, STAGING_REFLINK, STAGING_AUTO)
+
+_FICLONE = 0x40049409  # Linux ioctl to clone a file: _IOW(0x94, 9, int)
+# Copying files is I/O bound, the threads wait for the file system most of the time
+_COPY_WORKERS = 8
+_MIN_PARALLEL_FILES = 16
+
+
+def get_imports_staging_method():
+    """ the files imported or deployed from the packages of a read-only cache can be hard
+    linked (if enabled with CONAN_HARDLINK_IMPORTS), as they cannot be modified
+    """
+    if get_env("CONAN_READ_ONLY_CACHE", False) and get_env("CONAN_HARDLINK_IMPORTS", False):
+        return STAGING_AUTO
+    return STAGING_COPY
+
+
+def get_staging_method(conf):
+    method = conf.get("core.sources:staging", default=STAGING_COPY, check_type=str)
+    if method not in STAGING_METHODS:
+        raise ConanException("Invalid 'core.sources:staging' value '%s', possible values: %s"
+                             % (method, ", ".join(STAGING_METHODS)))
+    return method
+
+
+def _reflink(src, dst):
+    """ creates dst as a copy-on-write clone of src, raises OSError if not possible
+    """
+    system = platform.system()
+    if system == "Linux":
+        import fcntl
+        with open(src, "rb") as src_file:
+            with open(dst, "wb") as dst_file:
+                try:
+                    fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+                except OSError:
+                    dst_file.close()
+                    os.remove(dst)
+                    raise
+        shutil.copystat(src, dst)
+    elif system == "Darwin":
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+    else:
+        raise OSError(errno.EOPNOTSUPP, "Reflinks not supported in %s" % system)
+
+
+def _is_shared(path):
+    """ if the file is hard linked, staged (or imported) before with links
+    """
+    try:
+        return os.lstat(path).st_nlink > 1
+    except OSError:
+        return False
+
+
+class FileStager(object):
+    """ copy function (shutil.copytree copy_function) implementing the staging method. The first
+    time cloning or linking fails (e.g. not supported by the file system, or between different
+    file systems), the next method is used for the rest of files. The files that are copied use
+    copy_function, shutil.copy2 by default, that also copies the file metadata
+    """
+
+    def __init__(self, method=STAGING_COPY, copy_function=None):
+        self._reflink = method in (STAGING_REFLINK, STAGING_AUTO)
+        self._hardlink = method == STAGING_AUTO
+        self._copy_function = copy_function
+
+    def copy(self, src, dst):
+        if os.path.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+        if os.path.lexists(dst) and (self._reflink or self._hardlink or _is_shared(dst)):
+            os.remove(dst)  # Never write into an existing file, it could be a shared one
+        if self._reflink:
+            try:
+                _reflink(src, dst)
+                return dst
+            except OSError:
+                self._reflink = False
+        if self._hardlink:
+            try:
+                os.link(src, dst)
+                return dst
+            except OSError:
+                self._hardlink = False
+        return (self._copy_function or shutil.copy2)(src, dst)
+
+
+def copy_tree(src, dst, method=STAGING_COPY):
+    """ shutil.copytree(src, dst, symlinks=True) staging the files with the given method
+    """
+    shutil.copytree(src, dst, symlinks=True, copy_function=FileStager(method).copy)
+
+
+def copy_files(files, method=STAGING_COPY, copy_function=None):
+    """ copies many files, a list of (src, dst) paths, staging them with the given method. The
+    destination folders are created first, once, and then the files are copied concurrently
+    """
+    # If many files go to the same destination, the last one wins, as copying them in order
+    files = list(files)
+    last = {dst: i for i, (_, dst) in enumerate(files)}
+    files = [f for i, f in enumerate(files) if last[f[1]] == i]
+    for folder in sorted(set(os.path.dirname(dst) for _, dst in files)):
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+    copy = FileStager(method, copy_function).copy
+    if len(files) < _MIN_PARALLEL_FILES:
+        for src, dst in files:
+            copy(src, dst)
+        return
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+        for _ in executor.map(lambda f: copy(*f), files):
+            pass  # Raise the first error, if any
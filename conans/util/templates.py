@@ -1,6 +1,26 @@
-from jinja2 import Template
+from functools import lru_cache
 
 
 def render_layout_file(content, ref=None, settings=None, options=None):
+    from jinja2 import Template
     t = Template(content)
     return t.render(reference=ref, settings=settings, options=options)
+
+
+@lru_cache(maxsize=256)
+def _compile_template(content, trim_blocks, lstrip_blocks, undefined):
+    from jinja2 import Template
+    return Template(content, trim_blocks=trim_blocks, lstrip_blocks=lstrip_blocks,
+                    undefined=undefined)
+
+
+def compiled_template(content, trim_blocks=False, lstrip_blocks=False, undefined=None):
+    """ Returns a jinja2 Template for the given text, compiling it only the first time it is
+    requested in this process. Generators render the same templates once per dependency, so
+    compilation, and not rendering, dominates their cost if the Template is built every time.
+    Compiled templates are immutable and can be rendered concurrently.
+    """
+    if undefined is None:
+        from jinja2 import Undefined
+        undefined = Undefined
+    return _compile_template(content, trim_blocks, lstrip_blocks, undefined)
@@ -1,6 +1,9 @@
+import atexit
 import copy
 import json
 import os
+import queue
+import threading
 import time
 from os.path import isdir
 
@@ -8,7 +11,7 @@ import fasteners
 
 from conans.errors import ConanException
 from conans.model.ref import ConanFileReference, PackageReference
-from conans.util.files import md5sum, sha1sum
+from conans.util.files import file_checksums, ARTIFACT_CHECKSUMS
 from conans.util.log import logger
 
 
@@ -31,13 +34,18 @@ def _validate_action(action_name):
         raise ConanException("Unknown action %s" % action_name)
 
 
+# The last CONAN_TRACE_FILE value validated, not checked again for every record
+_valid_tracer_file = None
+
+
 def _get_tracer_file():
     """
     If CONAN_TRACE_FILE is a file in an existing dir will log to it creating the file if needed
     Otherwise won't log anything
     """
+    global _valid_tracer_file
     trace_path = os.environ.get("CONAN_TRACE_FILE", None)
-    if trace_path is not None:
+    if trace_path is not None and trace_path != _valid_tracer_file:
         if not os.path.isabs(trace_path):
             raise ConanException("Bad CONAN_TRACE_FILE value. The specified "
                                  "path has to be an absolute path to a file.")
@@ -46,16 +54,89 @@ def _get_tracer_file():
                                  "path doesn't exist: '%s'" % os.path.dirname(trace_path))
         if isdir(trace_path):
             raise ConanException("CONAN_TRACE_FILE is a directory. Please, specify a file path")
+        _valid_tracer_file = trace_path
     return trace_path
 
 
-def _append_to_log(obj):
-    """Add a new line to the log file locking the file to protect concurrent access"""
-    if _get_tracer_file():
-        filepath = _get_tracer_file()
+def _write_records(records):
+    """ appends the (filepath, line) records, locking every file once to protect concurrent
+    access from other processes
+    """
+    lines_by_file = {}
+    for filepath, line in records:
+        lines_by_file.setdefault(filepath, []).append(line)
+    for filepath, lines in lines_by_file.items():
         with fasteners.InterProcessLock(filepath + ".lock", logger=logger):
             with open(filepath, "a") as logfile:
-                logfile.write(json.dumps(obj, sort_keys=True) + "\n")
+                logfile.write("".join(lines))
+
+
+class _TraceWriter(object):
+    """ writes the records in a background thread, in batches with all the records queued while
+    writing the previous one, so the threads tracing (e.g. every request of the parallel
+    downloads and uploads) don't wait for the file lock nor the file system
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def append(self, filepath, line):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="conan_tracer")
+                    self._thread.daemon = True
+                    self._thread.start()
+        self._queue.put((filepath, line))
+
+    def _run(self):
+        while True:
+            records = [self._queue.get()]
+            while True:
+                try:
+                    records.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                _write_records(records)
+            except Exception as e:
+                logger.error("Error writing to CONAN_TRACE_FILE: %s" % str(e))
+            finally:
+                for _ in records:
+                    self._queue.task_done()
+
+    def flush(self):
+        """ waits until all the records appended are written
+        """
+        if self._thread is not None:
+            self._queue.join()
+
+    def reset(self):
+        """ in a forked process, the thread doesn't exist, and the records are written by the
+        parent
+        """
+        self.__init__()
+
+
+_writer = _TraceWriter()
+atexit.register(_writer.flush)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_writer.reset)
+
+
+def flush_log():
+    """ writes the records appended to the log and not written yet, if any
+    """
+    _writer.flush()
+
+
+def _append_to_log(obj):
+    """Add a new line to the log file, written in the background"""
+    filepath = _get_tracer_file()
+    if filepath:
+        _writer.append(filepath, json.dumps(obj, sort_keys=True) + "\n")
 
 
 def _append_action(action_name, props):
@@ -69,7 +150,8 @@ def _append_action(action_name, props):
 # ############## LOG METHODS ######################
 
 def _file_document(name, path):
-    return {"name": name, "path": path, "md5": md5sum(path), "sha1": sha1sum(path)}
+    checksums = file_checksums(path, ARTIFACT_CHECKSUMS)
+    return {"name": name, "path": path, "md5": checksums["md5"], "sha1": checksums["sha1"]}
 
 
 def log_recipe_upload(ref, duration, files_uploaded, remote_name):